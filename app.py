@@ -6,14 +6,19 @@ Single entry point for the Weight Change Planner application.
 Supports:
 - GUI mode (CustomTkinter)
 - CLI mode (terminal)
+- Batch mode (CSV / JSONL plan files or stdin, streamed)
+- Serve mode (local HTTP/JSON service)
 
 Usage:
     python app.py            # GUI (default)
     python app.py --mode cli # CLI
+    python app.py --mode batch --input plans.csv --output results.jsonl
+    python app.py --mode serve --port 8080
 """
 
 import argparse
 import sys
+from contextlib import ExitStack
 
 
 # -----------------------------------------------------------------------------
@@ -28,6 +33,24 @@ def load_cli():
         return None
 
 
+def load_batch():
+    try:
+        from ui.ui_batch import BatchUI
+        return BatchUI
+    except Exception as e:
+        print(f"[BATCH LOAD ERROR] {e}", file=sys.stderr)
+        return None
+
+
+def load_server():
+    try:
+        from ui.ui_server import PlannerServer
+        return PlannerServer
+    except Exception as e:
+        print(f"[SERVER LOAD ERROR] {e}", file=sys.stderr)
+        return None
+
+
 def load_gui():
     try:
         from ui.ui_customtkinter import MainApp
@@ -47,11 +70,71 @@ def parse_arguments():
 
     parser.add_argument(
         "--mode",
-        choices=("gui", "cli"),
+        choices=("gui", "cli", "batch", "serve"),
         default="gui",
         help="Interface mode (default: gui)",
     )
 
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument(
+        "--input",
+        default="-",
+        help="Plan file (CSV or JSONL); '-' reads stdin (default)",
+    )
+    batch.add_argument(
+        "--output",
+        default="-",
+        help="Result file; '-' writes stdout (default)",
+    )
+    batch.add_argument(
+        "--errors",
+        default=None,
+        help="File for rejected rows as JSON lines (default: stderr)",
+    )
+    batch.add_argument(
+        "--input-format",
+        choices=("csv", "jsonl"),
+        default=None,
+        help="Input format (default: from extension, else csv)",
+    )
+    batch.add_argument(
+        "--output-format",
+        choices=("csv", "jsonl"),
+        default=None,
+        help="Output format (default: from extension, else csv)",
+    )
+    batch.add_argument(
+        "--detail",
+        choices=("summary", "weekly", "daily"),
+        default="summary",
+        help="Output detail per plan (default: summary)",
+    )
+
+    serve = parser.add_argument_group("serve mode")
+    serve.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Address to listen on (default: 127.0.0.1)",
+    )
+    serve.add_argument(
+        "--port",
+        type=int,
+        default=8080,
+        help="Port to listen on (default: 8080)",
+    )
+    serve.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Calculation worker threads (default: 4)",
+    )
+    serve.add_argument(
+        "--max-pending",
+        type=int,
+        default=64,
+        help="In-flight requests before answering 503 (default: 64)",
+    )
+
     return parser.parse_args()
 
 
@@ -68,6 +151,76 @@ def run_cli():
     ConsoleUI().run()
 
 
+def run_batch(args):
+    BatchUI = load_batch()
+    if BatchUI is None:
+        print("❌ Batch interface unavailable.", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        written, rejected = _stream_batch(BatchUI, args)
+    except (OSError, ValueError) as e:
+        print(f"❌ Batch run failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Processed {written} plans, rejected {rejected} rows.", file=sys.stderr)
+
+
+def _stream_batch(BatchUI, args):
+    from core.plan_io import detect_format
+
+    with ExitStack() as files:
+        def open_stream(path, mode, default):
+            if path in (None, "-"):
+                return default
+            return files.enter_context(open(path, mode, newline="", encoding="utf-8"))
+
+        source = open_stream(args.input, "r", sys.stdin)
+        output = open_stream(args.output, "w", sys.stdout)
+        errors = open_stream(args.errors, "w", sys.stderr)
+
+        return BatchUI(
+            source,
+            output,
+            errors,
+            input_format=args.input_format or detect_format(args.input),
+            output_format=args.output_format or detect_format(args.output),
+            detail=args.detail,
+        ).run()
+
+
+def run_server(args):
+    import asyncio
+
+    PlannerServer = load_server()
+    if PlannerServer is None:
+        print("❌ Server unavailable.", file=sys.stderr)
+        sys.exit(1)
+
+    server = PlannerServer(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_pending=args.max_pending,
+    )
+
+    async def serve():
+        await server.start()
+        print(f"Serving on http://{server.host}:{server.port} (Ctrl+C to stop)")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(serve())
+    except OSError as e:
+        print(f"❌ Server failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
 def run_gui():
     MainApp = load_gui()
     if MainApp is None:
@@ -87,6 +240,10 @@ def main():
 
     if args.mode == "cli":
         run_cli()
+    elif args.mode == "batch":
+        run_batch(args)
+    elif args.mode == "serve":
+        run_server(args)
     else:
         run_gui()
 
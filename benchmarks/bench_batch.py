@@ -0,0 +1,61 @@
+"""
+bench_batch.py
+
+Compares calling WeightChangeCalculator.calculate once per plan with a
+single calculate_many call over the same plans.
+
+Usage:
+    python -m benchmarks.bench_batch
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+
+
+BATCH_SIZES = (100, 1_000, 10_000)
+
+
+def make_inputs(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    return [
+        WeightChangeInput(
+            start_weight=round(rng.uniform(60, 130), 1),
+            end_weight=round(rng.uniform(55, 110), 1),
+            height_cm=round(rng.uniform(150, 200)),
+            gender=rng.choice(list(Gender)),
+            start_date=start,
+            end_date=start + timedelta(days=rng.randint(30, 365)),
+        )
+        for _ in range(count)
+    ]
+
+
+def main():
+    calculator = WeightChangeCalculator()
+
+    print(f"{'plans':>8} {'calculate':>12} {'calculate_many':>15} {'speedup':>9}")
+    for size in BATCH_SIZES:
+        inputs = make_inputs(size)
+
+        started = time.perf_counter()
+        for data in inputs:
+            calculator.calculate(data)
+        single = time.perf_counter() - started
+
+        started = time.perf_counter()
+        calculator.calculate_many(inputs)
+        batch = time.perf_counter() - started
+
+        print(
+            f"{size:>8} {single * 1e3:>10.1f}ms {batch * 1e3:>13.1f}ms "
+            f"{single / batch:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+bench_chart_export.py
+
+Chart export of a ten-year plan in PNG, SVG and PDF at several DPIs:
+the former synchronous savefig() of the window's figure (time the Tk
+thread was blocked) against the background export, reporting the time
+the Tk thread spends submitting it, the worker's render time for a
+new snapshot and a repeat export served from the render cache.
+
+Usage:
+    python -m benchmarks.bench_chart_export
+"""
+
+import io
+import threading
+import time
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+from ui.chart import EXPORT_FORMATS, ChartExporter, WeightChart
+from ui.workers import JobQueue
+
+DPIS = (150, 300, 600)
+
+START = datetime(2024, 1, 1)
+
+
+class NoTk:
+    """
+    Stands in for the window: outcomes are not polled here.
+    """
+
+    def after(self, ms, callback):
+        return None
+
+
+def timed(func):
+    started = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - started
+
+
+def main():
+    result = WeightChangeCalculator().calculate(WeightChangeInput(
+        start_weight=110.0,
+        end_weight=70.0,
+        height_cm=175.0,
+        gender=Gender.MALE,
+        start_date=START,
+        end_date=START + timedelta(days=3_650),
+    ))
+    window_chart = WeightChart(result)
+    xlim, ylim = window_chart.ax.get_xlim(), window_chart.ax.get_ylim()
+    jobs = JobQueue(NoTk())
+
+    print(f"{'format':<7} {'dpi':>4} {'savefig (Tk)':>13} {'submit (Tk)':>12} "
+          f"{'render':>9} {'cached':>9}")
+    for fmt in EXPORT_FORMATS:
+        for dpi in DPIS:
+            _, blocking = timed(lambda: window_chart.figure.savefig(io.BytesIO(), format=fmt, dpi=dpi))
+
+            exporter = ChartExporter(result)
+            rendered = threading.Event()
+            renders = []
+
+            def job():
+                renders.append(timed(lambda: exporter.render(fmt, dpi, xlim, ylim))[1])
+                rendered.set()
+
+            _, submit = timed(lambda: jobs.submit(job, lambda _: None, print))
+            rendered.wait()
+            render = renders[0]
+            _, cached = timed(lambda: exporter.render(fmt, dpi, xlim, ylim))
+            print(
+                f"{fmt:<7} {dpi:>4} {blocking * 1e3:>11.0f}ms {submit * 1e6:>10.0f}us "
+                f"{render * 1e3:>7.0f}ms {cached * 1e6:>7.1f}us"
+            )
+
+    jobs.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+bench_dates.py
+
+Date parsing throughput: the former strptime-based parse_date against
+the sliced DD-MM-YYYY fast path, ISO parsing and the bulk parse_dates
+column parser (with the repeated dates typical of plan files).
+
+Usage:
+    python -m benchmarks.bench_dates [dates]
+"""
+
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from core.utils import DATE_FORMAT, parse_date, parse_dates, parse_iso_date
+
+
+def strptime_parse(values):
+    return [datetime.strptime(value, DATE_FORMAT) for value in values]
+
+
+def throughput(func, values) -> float:
+    """
+    Returns the best throughput of func(values) in dates per second.
+    """
+    timer = timeit.Timer(lambda: func(values))
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=5, number=number)) / number
+    return len(values) / best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(0)
+    start = datetime(2020, 1, 1)
+
+    distinct = [start + timedelta(days=rng.randrange(3_650)) for _ in range(count)]
+    repeated = [start + timedelta(days=rng.randrange(90)) for _ in range(count)]
+    dmy = [d.strftime(DATE_FORMAT) for d in distinct]
+    dmy_repeated = [d.strftime(DATE_FORMAT) for d in repeated]
+    iso = [d.strftime("%Y-%m-%d") for d in distinct]
+
+    cases = (
+        ("strptime (before)", strptime_parse, dmy),
+        ("parse_date", lambda v: [parse_date(s, "Date") for s in v], dmy),
+        ("parse_iso_date", lambda v: [parse_iso_date(s, "Date") for s in v], iso),
+        ("parse_dates (3650 distinct)", lambda v: parse_dates(v, "Date"), dmy),
+        ("parse_dates (90 distinct)", lambda v: parse_dates(v, "Date"), dmy_repeated),
+    )
+
+    baseline = None
+    print(f"{count} dates")
+    print(f"{'parser':<28} {'dates/s':>12} {'speedup':>9}")
+    for name, func, values in cases:
+        rate = throughput(func, values)
+        baseline = baseline or rate
+        print(f"{name:<28} {rate:>12,.0f} {rate / baseline:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+bench_energy.py
+
+Energy-balance model: 10k plans of one year simulated as a single
+array computation (calculate_many) against one calculate() call per
+plan with the Python reference engine and with the NumPy engine.
+
+Usage:
+    python -m benchmarks.bench_energy [plans] [days]
+"""
+
+import sys
+import time
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+
+
+def make_inputs(count: int, days: int):
+    start = datetime(2024, 1, 1)
+    return [
+        WeightChangeInput(
+            start_weight=70 + i % 50,
+            end_weight=60 + i % 40,
+            height_cm=155 + i % 40,
+            gender=Gender.MALE if i % 2 else Gender.FEMALE,
+            start_date=start,
+            end_date=start + timedelta(days=days),
+        )
+        for i in range(count)
+    ]
+
+
+def timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+    inputs = make_inputs(count, days)
+
+    python = WeightChangeCalculator(engine="python", model="energy")
+    numpy = WeightChangeCalculator(engine="numpy", model="energy")
+
+    loop_python = timed(lambda: [python.calculate(d) for d in inputs])
+    loop_numpy = timed(lambda: [numpy.calculate(d) for d in inputs])
+    batch = timed(lambda: numpy.calculate_many(inputs))
+
+    print(f"{count} plans x {days + 1} days ({count * (days + 1):,} plan-days)")
+    print(f"{'per plan, python engine':<26} {loop_python:>8.2f}s")
+    print(f"{'per plan, numpy engine':<26} {loop_numpy:>8.2f}s")
+    print(f"{'calculate_many':<26} {batch:>8.2f}s {loop_python / batch:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+bench_engines.py
+
+Compares the reference Python timeline engine with the vectorized NumPy
+engine for plans of increasing length.
+
+Usage:
+    python -m benchmarks.bench_engines
+"""
+
+import timeit
+
+from core.timeline import build_timeline_numpy, build_timeline_python
+
+
+PLAN_LENGTHS = (30, 365, 3_650, 36_500)
+
+START_WEIGHT = 95.0
+END_WEIGHT = 70.0
+HEIGHT_CM = 172.0
+
+
+def time_engine(engine, days: int) -> float:
+    """
+    Returns the best per-call time of engine in seconds.
+    """
+    daily_change = (END_WEIGHT - START_WEIGHT) / days
+    timer = timeit.Timer(
+        lambda: engine(START_WEIGHT, daily_change, HEIGHT_CM, days)
+    )
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    print(f"{'days':>8} {'python':>12} {'numpy':>12} {'speedup':>9}")
+    for days in PLAN_LENGTHS:
+        python_time = time_engine(build_timeline_python, days)
+        numpy_time = time_engine(build_timeline_numpy, days)
+        print(
+            f"{days:>8} "
+            f"{python_time * 1e6:>10.1f}us "
+            f"{numpy_time * 1e6:>10.1f}us "
+            f"{python_time / numpy_time:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+bench_export.py
+
+Daily timeline export of a 100-year plan and of a batch of one-year
+plans: calculating every result first and then writing it (the
+materialized way) against streaming rows from iter_timeline /
+iter_batch_timeline into export_timeline. Reports the time and the
+tracemalloc peak of each; the streaming peak does not grow with the
+plan length or the batch size.
+
+Usage:
+    python -m benchmarks.bench_export [plans]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+from core.export import (
+    TimelineWriter,
+    export_timeline,
+    iter_batch_timeline,
+    iter_result_timeline,
+    iter_timeline,
+)
+
+START = datetime(2024, 1, 1)
+
+
+def make_input(days: int, index: int = 0) -> WeightChangeInput:
+    return WeightChangeInput(
+        start_weight=1_000.0 - index % 20,  # large enough to stay positive for 100 years
+        end_weight=400.0 + index % 15,
+        height_cm=165.0 + index % 30,
+        gender=Gender.MALE if index % 2 else Gender.FEMALE,
+        start_date=START,
+        end_date=START + timedelta(days=days),
+    )
+
+
+def materialized(inputs, path) -> int:
+    calculator = WeightChangeCalculator(engine="python")
+    results = [calculator.calculate(data) for data in inputs]
+    with open(path, "w", newline="", encoding="utf-8") as stream:
+        writer = TimelineWriter(stream, "csv")
+        for row, result in enumerate(results):
+            for line in iter_result_timeline(result, row):
+                writer.write(line)
+    return writer.count
+
+
+def streamed(inputs, path) -> int:
+    plans = enumerate(inputs)
+    return export_timeline(iter_batch_timeline(plans), path)
+
+
+def measure(export, inputs, path):
+    started = time.perf_counter()
+    count = export(inputs, path)
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    export(inputs, path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, seconds, peak
+
+
+def main():
+    plans = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    cases = {
+        "100-year plan": [make_input(36_500)],
+        f"{plans} one-year plans": [make_input(365, i) for i in range(plans)],
+    }
+
+    # iter_timeline is the single-plan form of the same stream
+    assert list(iter_timeline(make_input(30))) == list(iter_batch_timeline([(0, make_input(30))]))
+
+    print(f"{'case':<22} {'export':<13} {'rows':>9} {'time':>9} {'peak memory':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "timeline.csv")
+        for name, inputs in cases.items():
+            for label, export in (("materialized", materialized), ("streamed", streamed)):
+                count, seconds, peak = measure(export, inputs, path)
+                print(
+                    f"{name:<22} {label:<13} {count:>9} {seconds:>8.2f}s "
+                    f"{peak / 2**20:>9.2f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main()
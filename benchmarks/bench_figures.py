@@ -0,0 +1,86 @@
+"""
+bench_figures.py
+
+Results window chart lifecycle: opening and closing many windows, with
+Agg in place of the Tk canvas. Compares building a new WeightChart per
+window (FigurePool size 0) with reusing released charts, reporting the
+time to prepare each window's chart (acquire + prerender) and the live
+Figure and gc-tracked object counts after every block of windows.
+
+Usage:
+    python -m benchmarks.bench_figures [windows]
+"""
+
+import gc
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+from ui.chart import ChartWindow, FigurePool
+
+POOL_SIZES = (0, 2)
+BLOCK = 50
+
+START = datetime(2024, 1, 1)
+
+
+def make_results():
+    calculator = WeightChangeCalculator()
+    return [
+        calculator.calculate(WeightChangeInput(
+            start_weight=95.0 + i,
+            end_weight=70.0 - i,
+            height_cm=165.0 + i,
+            gender=Gender.FEMALE,
+            start_date=START,
+            end_date=START + timedelta(days=365 * (i + 1)),
+        ))
+        for i in range(3)
+    ]
+
+
+def open_and_close(pool, result) -> float:
+    started = time.perf_counter()
+    chart = pool.acquire(result)
+    chart.prerender()
+    prepared = time.perf_counter() - started
+
+    shown = ChartWindow(pool, chart)
+    shown.attach(FigureCanvasAgg).draw()
+    shown.close()
+    return prepared
+
+
+def live_figures() -> int:
+    return sum(isinstance(o, Figure) for o in gc.get_objects())
+
+
+def main():
+    windows = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    results = make_results()
+
+    for size in POOL_SIZES:
+        pool = FigurePool(size)
+        times, counts = [], []
+        for i in range(windows):
+            times.append(open_and_close(pool, results[i % len(results)]))
+            if (i + 1) % BLOCK == 0:
+                gc.collect()
+                counts.append((live_figures(), len(gc.get_objects())))
+
+        print(
+            f"pool size {size}: {windows} windows, chart ready in "
+            f"median {statistics.median(times) * 1e3:.1f}ms"
+        )
+        for block, (figures, objects) in enumerate(counts, start=1):
+            print(f"  after {block * BLOCK:>4} windows: {figures} figures, {objects} objects")
+
+
+if __name__ == "__main__":
+    main()
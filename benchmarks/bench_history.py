@@ -0,0 +1,70 @@
+"""
+bench_history.py
+
+Shows that opening a HistoryStore (which loads the most recent plans)
+costs the same with 1k or 100k stored plans, and compares index lookups
+with parsing the whole log.
+
+Usage:
+    python -m benchmarks.bench_history
+"""
+
+import json
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+from core.history import HistoryStore
+
+
+HISTORY_SIZES = (1_000, 10_000, 100_000)
+
+
+def fill(store: HistoryStore, count: int) -> None:
+    calculator = WeightChangeCalculator(engine="lazy")
+    saved_at = datetime(2020, 1, 1)
+    for i in range(len(store), count):
+        data = WeightChangeInput(
+            start_weight=60 + i % 500 / 10,
+            end_weight=55 + i % 300 / 10,
+            height_cm=150 + i % 50,
+            gender=Gender.MALE if i % 2 else Gender.FEMALE,
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 7, 1),
+        )
+        store.append(data, calculator.calculate(data),
+                     saved_at + timedelta(minutes=30 * i))
+
+
+def timed(action) -> float:
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "history.json"
+        store = HistoryStore(path)
+
+        print(f"{'plans':>8} {'open':>10} {'by date':>10} {'by key':>10} "
+              f"{'full parse':>11}")
+        for size in HISTORY_SIZES:
+            fill(store, size)
+            key = store.entries[-1].plan_key
+
+            opened = timed(lambda: HistoryStore(path))
+            by_date = timed(lambda: store.find_by_date(date(2020, 1, 5)))
+            fresh = HistoryStore(path)
+            by_key = timed(lambda: fresh.find_by_key(key))
+            full = timed(lambda: [json.loads(line) for line in open(path)])
+
+            print(f"{size:>8} {opened * 1e3:>8.2f}ms {by_date * 1e3:>8.2f}ms "
+                  f"{by_key * 1e3:>8.2f}ms {full * 1e3:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+bench_incremental.py
+
+Incremental recalculation: a full calculate() of the updated plan
+against recalculate() from the previous result, for plans of growing
+length. Extending a plan at the same daily change only computes the
+new days, so its cost follows the number of added days; a new height
+only rescales the BMI series.
+
+Usage:
+    python -m benchmarks.bench_incremental
+"""
+
+import timeit
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+
+PLAN_LENGTHS = (365, 3_650, 36_500)
+EXTENSIONS = (1, 30, 365)
+DAILY_CHANGE = -1 / 64  # exact in binary: every length has the same daily change
+
+START = datetime(2024, 1, 1)
+
+
+def make_input(days: int) -> WeightChangeInput:
+    return WeightChangeInput(
+        start_weight=1_000.0,  # large enough to stay positive for 100 years
+        end_weight=1_000.0 + DAILY_CHANGE * days,
+        height_cm=180.0,
+        gender=Gender.MALE,
+        start_date=START,
+        end_date=START + timedelta(days=days),
+    )
+
+
+def best(func) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=5, number=number)) / number
+
+
+def main():
+    calculator = WeightChangeCalculator(engine="numpy")
+
+    cases = [(f"extend +{days}d", lambda d, n=days: make_input(d + n)) for days in EXTENSIONS]
+    cases.append(("height", lambda d: replace(make_input(d), height_cm=175.0)))
+
+    print(f"{'change':<14} {'days':>7} {'calculate':>11} {'recalculate':>12} {'speedup':>8}")
+    for name, updated in cases:
+        for days in PLAN_LENGTHS:
+            previous = calculator.calculate(make_input(days))
+            data = updated(days)
+            assert calculator.recalculate(previous, data) == calculator.calculate(data)
+
+            full = best(lambda: calculator.calculate(data))
+            incremental = best(lambda: calculator.recalculate(previous, data))
+            print(
+                f"{name:<14} {days:>7} {full * 1e3:>9.3f}ms "
+                f"{incremental * 1e3:>10.3f}ms {full / incremental:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
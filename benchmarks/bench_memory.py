@@ -0,0 +1,82 @@
+"""
+bench_memory.py
+
+Measures the memory retained by 10k one-year results in the regular
+WeightChangeResult form and in CompactWeightChangeResult (float64 and
+float32), using tracemalloc.
+
+Usage:
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import tracemalloc
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+
+
+RESULT_COUNT = 10_000
+PLAN_DAYS = 365
+
+
+def make_inputs():
+    start = datetime(2024, 1, 1)
+    return [
+        WeightChangeInput(
+            start_weight=80 + (i % 400) / 10,
+            end_weight=70 + (i % 150) / 10,
+            height_cm=150 + i % 50,
+            gender=Gender.FEMALE if i % 2 else Gender.MALE,
+            start_date=start,
+            end_date=start + timedelta(days=PLAN_DAYS),
+        )
+        for i in range(RESULT_COUNT)
+    ]
+
+
+def measure(build) -> int:
+    """
+    Returns the bytes still allocated by the object build() returns.
+    """
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained
+
+
+def main():
+    calculator = WeightChangeCalculator()
+    inputs = make_inputs()
+
+    variants = {
+        "WeightChangeResult": lambda: [
+            calculator.calculate(data) for data in inputs
+        ],
+        "Compact (float64)": lambda: [
+            calculator.calculate(data).compact() for data in inputs
+        ],
+        "Compact (float32)": lambda: [
+            calculator.calculate(data).compact(float32=True)
+            for data in inputs
+        ],
+    }
+
+    print(f"{RESULT_COUNT} results x {PLAN_DAYS + 1} days")
+    baseline = None
+    for name, build in variants.items():
+        retained = measure(build)
+        baseline = baseline or retained
+        print(
+            f"{name:<20} {retained / 2**20:>8.1f} MiB "
+            f"({retained / baseline:>5.1%} of regular)"
+        )
+
+
+if __name__ == "__main__":
+    main()
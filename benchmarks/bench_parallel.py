@@ -0,0 +1,44 @@
+"""
+bench_parallel.py
+
+Scaling of ParallelCalculator.calculate_many at 1, 2, 4 and 8 worker
+processes (1 worker runs in-process). Speedups are bounded by the
+number of CPU cores available.
+
+Usage:
+    python -m benchmarks.bench_parallel [plans]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.bench_batch import make_inputs
+from core.parallel import ParallelCalculator
+
+
+WORKER_COUNTS = (1, 2, 4, 8)
+CHUNK_SIZE = 2_000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    inputs = make_inputs(count)
+
+    print(f"{count} plans, chunk size {CHUNK_SIZE}, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'time':>10} {'speedup':>9}")
+    baseline = None
+    for workers in WORKER_COUNTS:
+        with ParallelCalculator(workers=workers, chunk_size=CHUNK_SIZE) as calculator:
+            calculator.calculate_many(inputs[:CHUNK_SIZE * workers])  # start workers
+
+            started = time.perf_counter()
+            calculator.calculate_many(inputs)
+            elapsed = time.perf_counter() - started
+
+        baseline = baseline or elapsed
+        print(f"{workers:>8} {elapsed:>9.2f}s {baseline / elapsed:>8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
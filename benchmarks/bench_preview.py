@@ -0,0 +1,86 @@
+"""
+bench_preview.py
+
+Live preview update cost for a stream of small edits to a one-year
+plan (end weight, end date, height): recalculate() through the cache,
+PreviewChart.show() and one Agg redraw of the reused figure, against
+building and pre-rendering a new WeightChart per edit. The preview
+budget is one 60 Hz frame (16 ms).
+
+Usage:
+    python -m benchmarks.bench_preview [edits] [days]
+"""
+
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from core.cache import CachingCalculator
+from core.data_models import Gender, WeightChangeInput
+from ui.chart import PreviewChart, WeightChart
+
+FRAME_MS = 16.0
+START = datetime(2024, 1, 1)
+
+
+def edits(count: int, days: int):
+    for i in range(count):
+        yield WeightChangeInput(
+            start_weight=95.0,
+            end_weight=75.0 - (i % 7) * 0.5,
+            height_cm=175.0 - i % 3,
+            gender=Gender.FEMALE,
+            start_date=START,
+            end_date=START + timedelta(days=days + i % 30),
+        )
+
+
+def report(name: str, times) -> None:
+    times = sorted(t * 1e3 for t in times)
+    p95 = times[int(len(times) * 0.95) - 1]
+    print(
+        f"{name:<24} median {statistics.median(times):6.2f}ms  "
+        f"p95 {p95:6.2f}ms  max {times[-1]:6.2f}ms"
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+
+    calculator = CachingCalculator()
+    preview = PreviewChart()
+    canvas = FigureCanvasAgg(preview.figure)
+
+    previous = None
+    update_times, frame_times, rebuild_times = [], [], []
+    for data in edits(count, days):
+        started = time.perf_counter()
+        if previous is None:
+            result = calculator.calculate(data, prevalidated=True)
+        else:
+            result = calculator.recalculate(previous, data, prevalidated=True)
+        preview.show(result)
+        updated = time.perf_counter()
+        canvas.draw()
+        drawn = time.perf_counter()
+        previous = result
+
+        update_times.append(updated - started)
+        frame_times.append(drawn - started)
+
+        started = time.perf_counter()
+        WeightChart(result).prerender()
+        rebuild_times.append(time.perf_counter() - started)
+
+    print(f"{count} edits of a {days}-day plan (budget {FRAME_MS:.0f} ms)")
+    report("preview: update", update_times)
+    report("preview: update + draw", frame_times)
+    report("new WeightChart", rebuild_times)
+
+
+if __name__ == "__main__":
+    main()
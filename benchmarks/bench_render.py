@@ -0,0 +1,72 @@
+"""
+bench_render.py
+
+Times building and drawing the weight chart on an Agg canvas, comparing
+the former one-Line2D-per-day rendering with the single LineCollection
+and with the level-of-detail trajectory used by ResultsWindow.
+
+Usage:
+    python -m benchmarks.bench_render
+"""
+
+import time
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from core.timeline import build_timeline_numpy
+from ui.chart import (
+    LodTrajectory,
+    bmi_color,
+    draw_bmi_bands,
+    draw_weight_line,
+    style_axes,
+)
+
+
+PLAN_LENGTHS = (30, 365, 1_825, 3_650, 36_500)
+HEIGHT_CM = 170.0
+
+
+def draw_per_day(ax, weights, bmis):
+    days = list(range(len(weights)))
+    for i in range(len(weights) - 1):
+        ax.plot(days[i:i + 2], weights[i:i + 2],
+                color=bmi_color(bmis[i]), linewidth=3, zorder=3)
+
+
+def render(draw_line, weights, bmis) -> float:
+    started = time.perf_counter()
+    fig = Figure(figsize=(7, 4.5))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    draw_bmi_bands(ax, HEIGHT_CM)
+    draw_line(ax, weights, bmis)
+    style_axes(ax)
+    canvas.draw()
+    return time.perf_counter() - started
+
+
+def best_of(repeat, *args) -> float:
+    return min(render(*args) for _ in range(repeat))
+
+
+def main():
+    print(f"{'days':>8} {'per-day':>12} {'collection':>12} {'lod':>12}")
+    for days in PLAN_LENGTHS:
+        weights, bmis = build_timeline_numpy(115, -50 / days, HEIGHT_CM, days)
+        repeat = 3 if days > 1_000 else 5
+        if days <= 3_650:
+            legacy = f"{best_of(repeat, draw_per_day, weights, bmis) * 1e3:.1f}ms"
+        else:
+            legacy = "skipped"
+        collection = best_of(repeat, draw_weight_line, weights, bmis)
+        lod = best_of(repeat, LodTrajectory, weights, bmis)
+        print(
+            f"{days:>8} {legacy:>12} {collection * 1e3:>10.1f}ms "
+            f"{lod * 1e3:>10.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+bench_server.py
+
+Latency and throughput of the HTTP service (ui.ui_server) under a local
+load generator. The server runs in a background thread with its own
+event loop; each client keeps one connection alive and sends requests
+in pipelined bursts.
+
+Usage:
+    python -m benchmarks.bench_server [requests per client]
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+
+from ui.ui_server import PlannerServer
+
+
+CLIENT_COUNTS = (1, 8, 32)
+PIPELINE = 4
+
+
+def make_plan(rng):
+    return {
+        "start_weight": rng.randint(60, 120),
+        "end_weight": rng.randint(55, 110),
+        "height_cm": rng.randint(150, 200),
+        "gender": rng.choice(("male", "female")),
+        "start_date": "01-01-2024",
+        "end_date": f"{rng.randint(1, 28):02d}-{rng.randint(2, 12):02d}-2025",
+    }
+
+
+def encode(plan):
+    body = json.dumps(plan).encode()
+    return (
+        f"POST /plan HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n"
+    ).encode() + body
+
+
+async def read_response(reader):
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(port, count, seed, latencies, statuses):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    for _ in range(0, count, PIPELINE):
+        burst = [encode(make_plan(rng)) for _ in range(PIPELINE)]
+        started = time.perf_counter()
+        writer.write(b"".join(burst))
+        for _ in burst:
+            statuses.append(await read_response(reader))
+            latencies.append(time.perf_counter() - started)
+    writer.close()
+
+
+async def load(port, clients, count):
+    latencies, statuses = [], []
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client(port, count, seed, latencies, statuses) for seed in range(clients)
+    ))
+    return time.perf_counter() - started, latencies, statuses
+
+
+def start_server():
+    server = PlannerServer(port=0, max_pending=256)
+    loop = asyncio.new_event_loop()
+    ready = threading.Event()
+
+    async def serve():
+        await server.start()
+        ready.set()
+        await server.serve_forever()
+
+    threading.Thread(target=loop.run_until_complete, args=(serve(),), daemon=True).start()
+    ready.wait()
+    return server
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    server = start_server()
+
+    print(f"{count} requests per client, pipeline depth {PIPELINE}")
+    print(f"{'clients':>8} {'req/s':>9} {'p50':>9} {'p99':>9} {'503s':>6}")
+    for clients in CLIENT_COUNTS:
+        elapsed, latencies, statuses = asyncio.run(load(server.port, clients, count))
+        quantiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"{clients:>8} {len(latencies) / elapsed:>9.0f} "
+            f"{quantiles[49] * 1000:>7.2f}ms {quantiles[98] * 1000:>7.2f}ms "
+            f"{statuses.count(503):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
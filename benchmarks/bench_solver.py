@@ -0,0 +1,113 @@
+"""
+bench_solver.py
+
+Goal solver: the earliest safe end date found by calling calculate()
+with one more day until the pace is no longer flagged (what the front
+end used to do) against the closed form and its batch form.
+
+The BMI milestone lookup is timed on prebuilt lazy results, for one-
+and ten-year plans: scanning the series day by day against bisection
+(bmi_reached_day_in), so the calculation both share is left out. The
+batch form is timed from the inputs, calculation included.
+
+Usage:
+    python -m benchmarks.bench_solver [queries]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+from core.solver import (
+    bmi_reached_day_in,
+    bmi_reached_days_many,
+    earliest_safe_days,
+    earliest_safe_days_many,
+    pace_level,
+)
+
+START = datetime(2024, 1, 1)
+
+PLAN_DAYS = (365, 3_650)
+
+
+def make_input(start_weight, end_weight, days) -> WeightChangeInput:
+    return WeightChangeInput(
+        start_weight=start_weight,
+        end_weight=end_weight,
+        height_cm=175,
+        gender=Gender.FEMALE,
+        start_date=START,
+        end_date=START + timedelta(days=days),
+    )
+
+
+def search_safe_days(calculator, start_weight, end_weight) -> int:
+    days = 1
+    while pace_level(calculator.calculate(make_input(start_weight, end_weight, days)).daily_change):
+        days += 1
+    return days
+
+
+def scan_bmi_day(result, bmi):
+    bmis = result.bmis
+    falling = bmi <= bmis[0]
+    for day, value in enumerate(bmis):
+        if (value <= bmi if falling else value >= bmi):
+            return day
+    return None
+
+
+def timed(func):
+    started = time.perf_counter()
+    value = func()
+    return value, time.perf_counter() - started
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rng = random.Random(0)
+    starts = [rng.uniform(70, 130) for _ in range(count)]
+    ends = [rng.uniform(55, 100) for _ in range(count)]
+    targets = [rng.uniform(22, 35) for _ in range(count)]
+
+    calculator = WeightChangeCalculator(engine="numpy")
+    rows = []
+
+    searched, before = timed(lambda: [search_safe_days(calculator, s, e) for s, e in zip(starts, ends)])
+    solved, after = timed(lambda: [earliest_safe_days(s, e) for s, e in zip(starts, ends)])
+    batched, batch = timed(lambda: earliest_safe_days_many(starts, ends).tolist())
+    assert searched == solved == batched
+    rows += [
+        ("safe end date: calculate() search", before),
+        ("safe end date: closed form", after),
+        ("safe end date: batch", batch),
+    ]
+
+    lazy = WeightChangeCalculator(engine="lazy")
+    for days in PLAN_DAYS:
+        plans = [make_input(s, e, days) for s, e in zip(starts, ends)]
+        results = [lazy.calculate(p) for p in plans]
+        label = f"BMI date ({days} days)"
+
+        scanned, before = timed(lambda: [scan_bmi_day(r, t) for r, t in zip(results, targets)])
+        solved, after = timed(lambda: [bmi_reached_day_in(r, t) for r, t in zip(results, targets)])
+        batched, batch = timed(lambda: bmi_reached_days_many(plans, targets).tolist())
+        assert [-1 if d is None else d for d in scanned] == [-1 if d is None else d for d in solved] == batched
+        rows += [
+            (f"{label}: lazy series scan", before),
+            (f"{label}: bisection", after),
+            (f"{label}: batch", batch),
+        ]
+
+    print(f"{count} queries")
+    print(f"{'method':<40} {'total':>10} {'per query':>12}")
+    for name, seconds in rows:
+        print(f"{name:<40} {seconds * 1e3:>8.1f}ms {seconds / count * 1e6:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
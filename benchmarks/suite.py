@@ -0,0 +1,251 @@
+"""
+suite.py
+
+Headless benchmark suite: calculator plan lengths, batch sizes, date
+parsing throughput and Agg chart rendering. Results are written as
+JSON; compare flags cases that got slower than a stored baseline.
+
+Usage:
+    python -m benchmarks.suite run [--output results.json] [--group calculate ...]
+    python -m benchmarks.suite run --output benchmarks/baseline.json
+    python -m benchmarks.suite compare benchmarks/baseline.json results.json [--threshold 0.10]
+
+compare exits with status 1 when any case regressed beyond the threshold.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, WeightChangeInput
+from core.timeline import HAS_NUMPY
+from core.utils import parse_date, parse_dates
+
+
+PLAN_LENGTHS = (7, 30, 365, 3_650, 36_500)
+BATCH_SIZES = (100, 1_000, 10_000)
+DATE_COUNT = 10_000
+RENDER_LENGTHS = (30, 365, 3_650, 36_500)
+
+GROUPS = ("calculate", "batch", "dates", "render")
+DEFAULT_THRESHOLD = 0.10
+
+START = datetime(2024, 1, 1)
+
+
+# ------------------------------------------------------------------
+# CASES
+# ------------------------------------------------------------------
+
+def make_input(days: int, index: int = 0) -> WeightChangeInput:
+    return WeightChangeInput(
+        start_weight=95.0 + index % 20,
+        end_weight=70.0 + index % 15,
+        height_cm=165.0 + index % 30,
+        gender=Gender.MALE if index % 2 else Gender.FEMALE,
+        start_date=START,
+        end_date=START + timedelta(days=days),
+    )
+
+
+def calculate_cases() -> Iterator[Tuple[str, Callable[[], object]]]:
+    engines = ["python", "lazy"] + (["numpy"] if HAS_NUMPY else [])
+    for engine in engines:
+        calculator = WeightChangeCalculator(engine=engine)
+        for days in PLAN_LENGTHS:
+            data = make_input(days)
+            yield f"calculate/{engine}/{days}", lambda c=calculator, d=data: c.calculate(d)
+
+
+def batch_cases() -> Iterator[Tuple[str, Callable[[], object]]]:
+    if not HAS_NUMPY:
+        return
+    calculator = WeightChangeCalculator()
+    for size in BATCH_SIZES:
+        inputs = [make_input(30 + i % 365, i) for i in range(size)]
+        yield f"batch/{size}", lambda i=inputs: calculator.calculate_many(i)
+
+    energy = WeightChangeCalculator(model="energy")
+    for size in BATCH_SIZES:
+        inputs = [make_input(30 + i % 365, i) for i in range(size)]
+        yield f"batch/energy/{size}", lambda i=inputs: energy.calculate_many(i)
+
+
+def date_cases() -> Iterator[Tuple[str, Callable[[], object]]]:
+    dates = [
+        (START + timedelta(days=i % 3_650)).strftime("%d-%m-%Y")
+        for i in range(DATE_COUNT)
+    ]
+    yield f"dates/parse_date/{DATE_COUNT}", lambda: [parse_date(d, "Date") for d in dates]
+    yield f"dates/parse_dates/{DATE_COUNT}", lambda: parse_dates(dates, "Date")
+
+
+def render_cases() -> Iterator[Tuple[str, Callable[[], object]]]:
+    try:
+        import matplotlib  # noqa: F401
+    except ImportError:
+        return
+    from ui.chart import WeightChart
+
+    calculator = WeightChangeCalculator()
+    for days in RENDER_LENGTHS:
+        result = calculator.calculate(make_input(days))
+        yield f"render/agg/{days}", lambda r=result: WeightChart(r).prerender()
+
+
+CASE_GROUPS = {
+    "calculate": calculate_cases,
+    "batch": batch_cases,
+    "dates": date_cases,
+    "render": render_cases,
+}
+
+
+# ------------------------------------------------------------------
+# RUNNING
+# ------------------------------------------------------------------
+
+def time_case(func: Callable[[], object], repeat: int = 5) -> float:
+    """
+    Returns the best per-call time of func in seconds.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(groups=GROUPS, repeat: int = 5, log=None) -> dict:
+    results = {}
+    for group in groups:
+        for name, func in CASE_GROUPS[group]():
+            results[name] = time_case(func, repeat)
+            if log:
+                print(f"{name:<32} {format_time(results[name]):>12}", file=log)
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+# ------------------------------------------------------------------
+# COMPARING
+# ------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    status: str  # "regression", "improvement", "ok", "new" or "missing"
+
+    @property
+    def change(self) -> Optional[float]:
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1
+
+
+def compare(
+    baseline: Dict[str, float],
+    current: Dict[str, float],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[Comparison]:
+    """
+    Compares per-case timings; a case is a regression when it is more
+    than threshold (relative) slower than the baseline.
+    """
+    comparisons = []
+    names = list(current) + [name for name in baseline if name not in current]
+    for name in names:
+        before, after = baseline.get(name), current.get(name)
+        if before is None:
+            status = "new"
+        elif after is None:
+            status = "missing"
+        elif after > before * (1 + threshold):
+            status = "regression"
+        elif after < before * (1 - threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        comparisons.append(Comparison(name, before, after, status))
+    return comparisons
+
+
+def format_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds >= 1e-1:
+        return f"{seconds:.2f}s"
+    if seconds >= 1e-4:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds * 1e6:.1f}us"
+
+
+# ------------------------------------------------------------------
+# COMMAND LINE
+# ------------------------------------------------------------------
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Headless benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run benchmarks and write JSON results")
+    run_parser.add_argument("--output", default="benchmark-results.json")
+    run_parser.add_argument("--group", action="append", choices=GROUPS,
+                            help="Only run this group (repeatable)")
+    run_parser.add_argument("--repeat", type=int, default=5)
+
+    compare_parser = commands.add_parser("compare", help="Compare results with a baseline")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="Relative slowdown flagged as regression (default: 0.10)")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_arguments(argv)
+
+    if args.command == "run":
+        report = run(args.group or GROUPS, args.repeat, log=sys.stdout)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {len(report['results'])} results to {args.output}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)["results"]
+
+    comparisons = compare(baseline, current, args.threshold)
+    print(f"{'case':<32} {'baseline':>12} {'current':>12} {'change':>8}  status")
+    for c in comparisons:
+        change = f"{c.change:+.1%}" if c.change is not None else "-"
+        print(
+            f"{c.name:<32} {format_time(c.baseline):>12} "
+            f"{format_time(c.current):>12} {change:>8}  {c.status}"
+        )
+
+    regressions = [c for c in comparisons if c.status == "regression"]
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
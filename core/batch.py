@@ -0,0 +1,172 @@
+from core.data_models import BatchResult
+from core.energy import (
+    SEX_OFFSETS,
+    build_energy_buffers,
+    build_energy_timeline_python,
+    decay_power,
+    equilibrium_weight,
+    expenditure,
+)
+from core.timeline import build_timeline_python, round_array
+from core.validation import (  # noqa: F401  (re-exported)
+    INPUT_COLUMNS,
+    BatchInput,
+    to_columns,
+    validate_columns,
+)
+
+try:
+    import numpy as np
+except ImportError:  # reported by calculate_batch
+    np = None
+
+
+# ------------------------------------------------------------------
+# CALCULATION
+# ------------------------------------------------------------------
+
+def calculate_batch(
+    data: BatchInput, engine: str = "numpy", model: str = "linear"
+) -> BatchResult:
+    """
+    Validates and calculates many plans at once.
+
+    Rows that fail validation are reported in BatchResult.errors and
+    get an empty timeline; they never abort the batch. model is
+    "linear" or "energy" (see WeightChangeCalculator).
+    """
+    if np is None:
+        raise ImportError("calculate_many requires NumPy (pip install numpy).")
+
+    # --------------------------------------------------------------
+    # Validation (same checks and order as calculate())
+    # --------------------------------------------------------------
+    checked = validate_columns(data, model)
+    start_weight = checked.start_weight
+    height_cm = checked.height_cm
+    days = checked.days
+    valid = checked.valid
+    size = len(checked)
+
+    # --------------------------------------------------------------
+    # Summary columns
+    # --------------------------------------------------------------
+    nan = np.float64("nan")
+    weight_difference = np.where(valid, checked.end_weight - start_weight, nan)
+    daily_change = weight_difference / np.where(valid, days, 1)
+
+    # --------------------------------------------------------------
+    # Shared timeline buffers
+    # --------------------------------------------------------------
+    lengths = np.where(valid, days + 1, 0)
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    energy_intake = None
+    if model == "energy":
+        sex_offset = np.array(
+            [SEX_OFFSETS.get(gender, np.nan) for gender in checked.gender]
+        )
+        weights, bmis, target = _build_energy(
+            checked, engine, offsets, lengths
+        )
+        energy_intake = round_array(np.where(
+            valid, expenditure(target, start_weight, height_cm, sex_offset), nan
+        ), 1)
+    elif engine == "python":
+        weights, bmis = _build_buffers_python(
+            lambda row: build_timeline_python(
+                float(start_weight[row]),
+                float(daily_change[row]),
+                float(height_cm[row]),
+                int(days[row]),
+            ),
+            offsets, valid,
+        )
+    else:
+        weights, bmis = _build_buffers_numpy(
+            start_weight, daily_change, height_cm, offsets, lengths
+        )
+
+    first = np.where(valid, offsets[:-1], 0)
+    last = np.where(valid, offsets[1:] - 1, 0)
+    bmi_start = np.where(valid, bmis[first] if len(bmis) else nan, nan)
+    bmi_end = np.where(valid, bmis[last] if len(bmis) else nan, nan)
+
+    return BatchResult(
+        start_weight=start_weight,
+        end_weight=checked.end_weight,
+        height_cm=height_cm,
+        start_date=checked.start_date.tolist(),
+        end_date=checked.end_date.tolist(),
+        days=days,
+        weight_difference=round_array(weight_difference, 2),
+        daily_change=round_array(daily_change, 4),
+        bmi_start=bmi_start,
+        bmi_end=bmi_end,
+        offsets=offsets,
+        weights=weights,
+        bmis=bmis,
+        valid=valid,
+        errors=checked.errors,
+        energy_intake=energy_intake,
+    )
+
+
+def _buffer_positions(offsets, lengths):
+    """
+    Row index and day number of every element of the timeline buffers.
+    """
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    day = np.arange(offsets[-1]) - offsets[:-1][rows]
+    return rows, day
+
+
+def _build_buffers_numpy(start_weight, daily_change, height_cm, offsets, lengths):
+    rows, day = _buffer_positions(offsets, lengths)
+
+    weights = round_array(start_weight[rows] + daily_change[rows] * day.astype(np.float64))
+
+    height_m = height_cm / 100
+    bmis = round_array(weights / (height_m ** 2)[rows])
+
+    return weights, bmis
+
+
+def _build_energy(checked, engine: str, offsets, lengths):
+    if engine != "python":
+        rows, day = _buffer_positions(offsets, lengths)
+        return build_energy_buffers(
+            checked.start_weight, checked.end_weight, checked.height_cm,
+            checked.days, rows, day,
+        )
+
+    weights, bmis = _build_buffers_python(
+        lambda row: build_energy_timeline_python(
+            float(checked.start_weight[row]),
+            float(checked.end_weight[row]),
+            float(checked.height_cm[row]),
+            checked.gender[row],
+            int(checked.days[row]),
+        ),
+        offsets, checked.valid,
+    )
+    end_decay = np.array([decay_power(max(days, 1)) for days in checked.days.tolist()])
+    target = equilibrium_weight(checked.start_weight, checked.end_weight, end_decay)
+    return weights, bmis, target
+
+
+def _build_buffers_python(build_row, offsets, valid):
+    """
+    Fills the shared buffers one row at a time with a reference engine.
+    """
+    weights = np.empty(offsets[-1], dtype=np.float64)
+    bmis = np.empty(offsets[-1], dtype=np.float64)
+
+    for row in np.flatnonzero(valid):
+        row_weights, row_bmis = build_row(row)
+        start, stop = offsets[row], offsets[row + 1]
+        weights[start:stop] = row_weights
+        bmis[start:stop] = row_bmis
+
+    return weights, bmis
@@ -0,0 +1,204 @@
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import WeightChangeInput, WeightChangeResult
+from core.timeline import PrefixedSeries
+
+
+_FLOAT_SIZE = sys.getsizeof(0.0)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    timeline_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _series_bytes(series) -> int:
+    if isinstance(series, array):
+        return series.itemsize * len(series)
+    if isinstance(series, list):
+        return sys.getsizeof(series) + _FLOAT_SIZE * len(series)
+    return sys.getsizeof(series)  # lazy series hold no per-day data
+
+
+def _buffers(result: WeightChangeResult) -> Dict[int, Tuple[object, int]]:
+    """
+    The objects holding the timeline data of a result, by id, with their
+    approximate sizes. A PrefixedSeries holds its tail and its shared base.
+    """
+    buffers = {}
+    for series in (result.weights, result.bmis):
+        if isinstance(series, PrefixedSeries):
+            parts = (series.base, series.tail)
+        else:
+            parts = (series,)
+        for part in parts:
+            buffers[id(part)] = (part, _series_bytes(part))
+    return buffers
+
+
+def timeline_bytes(result: WeightChangeResult) -> int:
+    """
+    Approximate memory held by the weight and BMI series of a result,
+    including the base a PrefixedSeries shares with an earlier result.
+    """
+    return sum(size for _, size in _buffers(result).values())
+
+
+class CachingCalculator:
+    """
+    Opt-in memoizing wrapper around WeightChangeCalculator.
+
+    Results are kept in an LRU keyed by the normalized input, bounded
+    both by entry count and by the total timeline bytes they hold
+    (None disables a bound). A base shared by several results (see
+    PrefixedSeries) is counted once, as long as any cached result holds
+    it. Hit, miss and eviction counters are
+    available through stats().
+
+    Cached results are shared between callers and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        calculator: Optional[WeightChangeCalculator] = None,
+        max_entries: Optional[int] = 256,
+        max_bytes: Optional[int] = 64 * 2**20,
+    ):
+        self.calculator = calculator or WeightChangeCalculator()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: "OrderedDict[WeightChangeInput, WeightChangeResult]" = OrderedDict()
+        self._entry_buffers: Dict[WeightChangeInput, List[int]] = {}
+        self._buffers: Dict[int, list] = {}  # id -> [series, holders, bytes]
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # PUBLIC API
+    # ------------------------------------------------------------------
+    @property
+    def engine(self) -> str:
+        return self.calculator.engine
+
+    @property
+    def model(self) -> str:
+        return self.calculator.model
+
+    def calculate(
+        self, data: WeightChangeInput, prevalidated: bool = False
+    ) -> WeightChangeResult:
+        return self._cached(
+            data, lambda d: self.calculator.calculate(d, prevalidated=prevalidated)
+        )
+
+    def recalculate(
+        self,
+        previous: WeightChangeResult,
+        data: WeightChangeInput,
+        prevalidated: bool = False,
+    ) -> WeightChangeResult:
+        """
+        Like calculate(), but a cache miss updates previous incrementally
+        (see WeightChangeCalculator.recalculate).
+        """
+        return self._cached(
+            data,
+            lambda d: self.calculator.recalculate(previous, d, prevalidated=prevalidated),
+        )
+
+    def calculate_many(self, data):
+        return self.calculator.calculate_many(data)
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                timeline_bytes=self._bytes,
+            )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._entry_buffers.clear()
+            self._buffers.clear()
+            self._bytes = 0
+
+    # ------------------------------------------------------------------
+    # INTERNAL HELPERS
+    # ------------------------------------------------------------------
+    def _cached(self, data: WeightChangeInput, compute) -> WeightChangeResult:
+        try:
+            key = data.normalized()
+        except (TypeError, ValueError):
+            # Invalid input: let the calculator raise its usual error.
+            return compute(data)
+
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return result
+            self._misses += 1
+
+        result = compute(key)
+
+        with self._lock:
+            if key not in self._entries:
+                self._store(key, result)
+        return result
+
+    def _store(self, key: WeightChangeInput, result: WeightChangeResult) -> None:
+        buffers = _buffers(result)
+        size = sum(size for _, size in buffers.values())
+        if self.max_bytes is not None and size > self.max_bytes:
+            return  # would evict everything and still not fit
+
+        self._entries[key] = result
+        self._entry_buffers[key] = list(buffers)
+        for ident, (series, size) in buffers.items():
+            held = self._buffers.get(ident)
+            if held is None:
+                self._buffers[ident] = [series, 1, size]
+                self._bytes += size
+            else:
+                held[1] += 1
+
+        while (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            evicted, _ = self._entries.popitem(last=False)
+            self._release(evicted)
+            self._evictions += 1
+
+    def _release(self, key: WeightChangeInput) -> None:
+        # a buffer stops counting once no cached result holds it
+        for ident in self._entry_buffers.pop(key):
+            held = self._buffers[ident]
+            held[1] -= 1
+            if not held[1]:
+                del self._buffers[ident]
+                self._bytes -= held[2]
@@ -1,16 +1,29 @@
 from datetime import timedelta
-from typing import List
+from typing import TYPE_CHECKING
 
 from core.data_models import (
+    BatchResult,
     WeightChangeInput,
     WeightChangeResult,
     Gender,
 )
+from core.energy import MODELS, get_energy_engine, required_intake
+from core.timeline import (
+    PrefixedSeries,
+    calculate_bmi,
+    extend_weights,
+    get_engine,
+    rescale_bmis,
+)
 from core.utils import (
+    validate_gender,
     validate_positive,
     validate_date_range,
 )
 
+if TYPE_CHECKING:
+    from core.batch import BatchInput
+
 
 class WeightChangeCalculator:
     """
@@ -23,24 +36,147 @@ class WeightChangeCalculator:
     - Result aggregation
 
     This module is UI-agnostic.
+
+    The timeline is built by a pluggable engine (see core.timeline):
+    "python" is the reference loop, "numpy" the vectorized equivalent,
+    "lazy" returns O(1)-memory series computed on access and "auto"
+    (default) picks NumPy when it is installed.
+
+    model selects the trajectory:
+    - "linear" (default): the same weight change every day;
+    - "energy": a constant calorie intake against an expenditure that
+      follows weight, height and gender (Mifflin-St Jeor) with metabolic
+      adaptation, so weight changes fastest at the start (see
+      core.energy). The result also carries that intake.
     """
 
+    def __init__(self, engine: str = "auto", model: str = "linear"):
+        if model not in MODELS:
+            raise ValueError(
+                f"Unknown model '{model}'. Choose one of: {', '.join(MODELS)}."
+            )
+
+        self.engine = engine
+        self.model = model
+        if model == "energy":
+            self._build_timeline = get_energy_engine(engine)
+        else:
+            self._build_timeline = get_engine(engine)
+
     # ------------------------------------------------------------------
     # PUBLIC API
     # ------------------------------------------------------------------
-    def calculate(self, data: WeightChangeInput) -> WeightChangeResult:
+    def calculate(
+        self, data: WeightChangeInput, prevalidated: bool = False
+    ) -> WeightChangeResult:
         """
         Perform weight change calculation based on provided input.
+
+        prevalidated=True skips input validation for data that already
+        went through it (the UI readers, validate_columns().inputs()):
+        numbers must be positive floats and end_date after start_date.
+        """
+        plan = self._validate(data, prevalidated)
+        return self._result(data, *plan, *self._timeline(*plan))
+
+    def recalculate(
+        self,
+        previous: WeightChangeResult,
+        data: WeightChangeInput,
+        prevalidated: bool = False,
+    ) -> WeightChangeResult:
+        """
+        calculate(data), reusing the timeline of previous, the result of
+        the same plan before end_date, end_weight, height_cm or gender
+        changed:
+
+        - a new height only rescales the BMI series;
+        - gender only changes the energy model's intake;
+        - a new end date / end weight at the same daily change (linear
+          model) keeps the known days and computes only the days past
+          the previous end date, or cuts the series for a shorter plan.
+
+        Any other change (start weight or date, slope, energy trajectory)
+        and lazy series fall back to a full calculation. The result is
+        always equal to calculate(data).
+        """
+        plan = self._validate(data, prevalidated)
+        start_weight, end_weight, height_cm, gender, total_days = plan
+
+        reusable = (
+            previous.start_weight == start_weight
+            and previous.start_date == data.start_date
+            and isinstance(previous.weights, (list, PrefixedSeries))
+            and isinstance(previous.bmis, (list, PrefixedSeries))
+        )
+        if reusable and self.model == "energy":
+            reusable = (
+                previous.end_weight == end_weight and previous.days == total_days
+            )
+        elif reusable:
+            daily_change = (end_weight - start_weight) / total_days
+            reusable = daily_change == (
+                (previous.end_weight - previous.start_weight) / previous.days
+            )
+
+        if not reusable:
+            return self._result(data, *plan, *self._timeline(*plan))
+
+        if self.model == "energy":
+            weights = previous.weights  # same trajectory
+        else:
+            weights = extend_weights(
+                previous.weights, start_weight, daily_change, total_days
+            )
+
+        if height_cm != previous.height_cm:
+            bmis = rescale_bmis(weights, height_cm)
+        else:
+            bmis = rescale_bmis(weights, height_cm, known=previous.bmis)
+
+        return self._result(data, *plan, weights, bmis)
+
+    def calculate_many(self, data: "BatchInput") -> BatchResult:
+        """
+        Calculate many plans at once.
+
+        data is either a sequence of WeightChangeInput or a mapping of
+        column name -> values (same names as WeightChangeInput fields).
+        Invalid rows are reported per row in BatchResult.errors.
+        """
+        # Imported here: the batch path pulls in NumPy, which would
+        # otherwise slow down every import of the calculator.
+        from core.batch import calculate_batch
+
+        return calculate_batch(data, engine=self.engine, model=self.model)
+
+    # ------------------------------------------------------------------
+    # INTERNAL HELPERS
+    # ------------------------------------------------------------------
+    def _validate(self, data: WeightChangeInput, prevalidated: bool):
+        """
+        Returns (start_weight, end_weight, height_cm, gender, total_days).
         """
 
         # --------------------------------------------------------------
         # Validation
         # --------------------------------------------------------------
-        start_weight = validate_positive(data.start_weight, "Start weight")
-        end_weight = validate_positive(data.end_weight, "End weight")
-        height_cm = validate_positive(data.height_cm, "Height")
-
-        validate_date_range(data.start_date, data.end_date)
+        if prevalidated:
+            start_weight = data.start_weight
+            end_weight = data.end_weight
+            height_cm = data.height_cm
+            gender = data.gender
+        else:
+            start_weight = validate_positive(data.start_weight, "Start weight")
+            end_weight = validate_positive(data.end_weight, "End weight")
+            height_cm = validate_positive(data.height_cm, "Height")
+            # only the energy model depends on gender
+            gender = (
+                Gender(validate_gender(data.gender))
+                if self.model == "energy" else data.gender
+            )
+
+            validate_date_range(data.start_date, data.end_date)
 
         # --------------------------------------------------------------
         # Time calculations
@@ -49,31 +185,37 @@ class WeightChangeCalculator:
         if total_days <= 0:
             raise ValueError("Date range must be at least 1 day.")
 
-        # --------------------------------------------------------------
-        # Weight calculations
-        # --------------------------------------------------------------
-        weight_difference = end_weight - start_weight
-        daily_change = weight_difference / total_days
+        return start_weight, end_weight, height_cm, gender, total_days
 
-        weights: List[float] = []
-        bmis: List[float] = []
-
-        for day in range(total_days + 1):
-            current_weight = start_weight + daily_change * day
-            current_weight = round(current_weight, 2)
+    def _timeline(self, start_weight, end_weight, height_cm, gender, total_days):
+        """
+        Weight calculations: the daily weight and BMI series.
+        """
+        if self.model == "energy":
+            return self._build_timeline(
+                start_weight, end_weight, height_cm, gender, total_days
+            )
+
+        daily_change = (end_weight - start_weight) / total_days
+        return self._build_timeline(
+            start_weight, daily_change, height_cm, total_days
+        )
 
-            weights.append(current_weight)
-            bmis.append(self._calculate_bmi(current_weight, height_cm))
+    def _result(
+        self,
+        data: WeightChangeInput,
+        start_weight, end_weight, height_cm, gender, total_days,
+        weights, bmis,
+    ) -> WeightChangeResult:
+        weight_difference = end_weight - start_weight
+        daily_change = weight_difference / total_days
 
-        # --------------------------------------------------------------
-        # BMI boundaries
-        # --------------------------------------------------------------
-        bmi_start = bmis[0]
-        bmi_end = bmis[-1]
+        energy_intake = None
+        if self.model == "energy":
+            energy_intake = round(required_intake(
+                start_weight, end_weight, height_cm, gender, total_days
+            ), 1)
 
-        # --------------------------------------------------------------
-        # Result
-        # --------------------------------------------------------------
         return WeightChangeResult(
             start_weight=start_weight,
             end_weight=end_weight,
@@ -85,18 +227,15 @@ class WeightChangeCalculator:
             daily_change=round(daily_change, 4),
             weights=weights,
             bmis=bmis,
-            bmi_start=bmi_start,
-            bmi_end=bmi_end,
+            # BMI boundaries
+            bmi_start=bmis[0],
+            bmi_end=bmis[-1],
+            energy_intake=energy_intake,
         )
 
-    # ------------------------------------------------------------------
-    # INTERNAL HELPERS
-    # ------------------------------------------------------------------
     @staticmethod
     def _calculate_bmi(weight: float, height_cm: float) -> float:
         """
         BMI = weight (kg) / height (m)^2
         """
-        height_m = height_cm / 100
-        bmi = weight / (height_m ** 2)
-        return round(bmi, 2)
+        return calculate_bmi(weight, height_cm)
@@ -1,7 +1,8 @@
+from array import array
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
 
 
 # ------------------------------------------------------------------
@@ -12,6 +13,13 @@ class Gender(str, Enum):
     FEMALE = "female"
 
 
+class BmiCategory(str, Enum):
+    UNDERWEIGHT = "underweight"
+    NORMAL = "normal"
+    OVERWEIGHT = "overweight"
+    OBESE = "obese"
+
+
 # ------------------------------------------------------------------
 # INPUT MODEL
 # ------------------------------------------------------------------
@@ -24,10 +32,68 @@ class WeightChangeInput:
     start_date: datetime
     end_date: datetime
 
+    def normalized(self) -> "WeightChangeInput":
+        """
+        Canonical form: numbers as floats and gender as Gender, so equal
+        plans compare and hash equal however they were entered.
+        """
+        return WeightChangeInput(
+            start_weight=float(self.start_weight),
+            end_weight=float(self.end_weight),
+            height_cm=float(self.height_cm),
+            gender=Gender(self.gender),
+            start_date=self.start_date,
+            end_date=self.end_date,
+        )
+
+    @property
+    def plan_key(self) -> str:
+        """
+        Stable identifier of the plan (hex digest of its normalized form).
+        """
+        data = self.normalized()
+        text = "|".join((
+            repr(data.start_weight),
+            repr(data.end_weight),
+            repr(data.height_cm),
+            data.gender.value,
+            data.start_date.isoformat(),
+            data.end_date.isoformat(),
+        ))
+        # imported here: loading OpenSSL is a large part of core's import time
+        import hashlib
+
+        return hashlib.sha1(text.encode()).hexdigest()
+
 
 # ------------------------------------------------------------------
 # RESULT MODEL
 # ------------------------------------------------------------------
+@dataclass(frozen=True)
+class BmiSegment:
+    """
+    Days start_day..end_day (inclusive) of a plan spent in one BMI category.
+    """
+
+    start_day: int
+    end_day: int
+    category: BmiCategory
+
+
+@dataclass(frozen=True, slots=True)
+class TimelineRow:
+    """
+    One day of a plan, as yielded by core.export.iter_timeline.
+    """
+
+    row: int
+    day: int
+    date: datetime
+    weight: float
+    bmi: float
+    category: BmiCategory
+
+
 @dataclass(frozen=True)
 class WeightChangeResult:
     # --- raw inputs (for UI & plots) ---
@@ -43,12 +109,25 @@ class WeightChangeResult:
     # --- weight change ---
     weight_difference: float
     daily_change: float
-    weights: List[float]
+    weights: Sequence[float]
 
     # --- BMI ---
     bmi_start: float
     bmi_end: float
-    bmis: List[float]
+    bmis: Sequence[float]
+
+    # --- energy model only: constant intake reaching end_weight (kcal/day) ---
+    energy_intake: Optional[float] = None
+
+    # --- BMI category runs, computed from bmis when not given ---
+    bmi_segments: Optional[Tuple[BmiSegment, ...]] = None
+
+    def __post_init__(self):
+        if self.bmi_segments is None:
+            # imported here: core.timeline imports this module
+            from core.timeline import bmi_segments
+
+            object.__setattr__(self, "bmi_segments", bmi_segments(self.bmis))
 
     # ------------------------------------------------------------------
     # Derived properties
@@ -64,3 +143,248 @@ class WeightChangeResult:
     @property
     def is_weight_stable(self) -> bool:
         return self.weight_difference == 0
+
+    def compact(self, float32: bool = False) -> "CompactWeightChangeResult":
+        return CompactWeightChangeResult.from_result(self, float32=float32)
+
+
+# ------------------------------------------------------------------
+# COMPACT RESULT MODEL
+# ------------------------------------------------------------------
+@dataclass(frozen=True, slots=True)
+class CompactWeightChangeResult:
+    """
+    Memory-lean WeightChangeResult for caching many results.
+
+    The object is slotted and keeps the timeline in array('d') (or
+    array('f') in float32 mode) instead of lists of boxed floats. Both
+    arrays support the buffer protocol, e.g. memoryview / numpy.frombuffer.
+
+    Timeline values are rounded to 2 decimals, so float32 storage is
+    lossless once re-rounded; to_result() does that.
+    """
+
+    start_weight: float
+    end_weight: float
+    height_cm: float
+    start_date: datetime
+    end_date: datetime
+    days: int
+    weight_difference: float
+    daily_change: float
+    weights: array
+    bmi_start: float
+    bmi_end: float
+    bmis: array
+    energy_intake: Optional[float] = None
+    bmi_segments: Optional[Tuple[BmiSegment, ...]] = None
+
+    @classmethod
+    def from_result(
+        cls, result: WeightChangeResult, float32: bool = False
+    ) -> "CompactWeightChangeResult":
+        typecode = "f" if float32 else "d"
+        return cls(
+            start_weight=result.start_weight,
+            end_weight=result.end_weight,
+            height_cm=result.height_cm,
+            start_date=result.start_date,
+            end_date=result.end_date,
+            days=result.days,
+            weight_difference=result.weight_difference,
+            daily_change=result.daily_change,
+            weights=array(typecode, result.weights),
+            bmi_start=result.bmi_start,
+            bmi_end=result.bmi_end,
+            bmis=array(typecode, result.bmis),
+            energy_intake=result.energy_intake,
+            bmi_segments=result.bmi_segments,
+        )
+
+    @property
+    def is_float32(self) -> bool:
+        return self.weights.typecode == "f"
+
+    def to_result(self) -> WeightChangeResult:
+        """
+        Expands back into a regular WeightChangeResult.
+        """
+        if self.is_float32:
+            weights = [round(w, 2) for w in self.weights]
+            bmis = [round(b, 2) for b in self.bmis]
+        else:
+            weights = self.weights.tolist()
+            bmis = self.bmis.tolist()
+
+        return WeightChangeResult(
+            start_weight=self.start_weight,
+            end_weight=self.end_weight,
+            height_cm=self.height_cm,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            days=self.days,
+            weight_difference=self.weight_difference,
+            daily_change=self.daily_change,
+            weights=weights,
+            bmis=bmis,
+            bmi_start=self.bmi_start,
+            bmi_end=self.bmi_end,
+            energy_intake=self.energy_intake,
+            bmi_segments=self.bmi_segments,
+        )
+
+    @property
+    def is_weight_loss(self) -> bool:
+        return self.weight_difference < 0
+
+    @property
+    def is_weight_gain(self) -> bool:
+        return self.weight_difference > 0
+
+    @property
+    def is_weight_stable(self) -> bool:
+        return self.weight_difference == 0
+
+
+# ------------------------------------------------------------------
+# BATCH MODELS
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class RowError:
+    row: int
+    field: str
+    message: str
+
+
+@dataclass(frozen=True)
+class ValidatedColumns:
+    """
+    Typed input columns produced by core.validation.validate_columns.
+
+    Numbers are float64 arrays, genders an object array of Gender and
+    dates datetime64[us] arrays; invalid values are NaN / None / NaT.
+    Only the first error of every invalid row is kept in errors.
+    """
+
+    start_weight: Any
+    end_weight: Any
+    height_cm: Any
+    gender: Any
+    start_date: Any
+    end_date: Any
+    days: Any
+    valid: Any
+    errors: List[RowError]
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def inputs(self) -> Iterator[Tuple[int, WeightChangeInput]]:
+        """
+        Yields (row, WeightChangeInput) for every valid row, ready for
+        WeightChangeCalculator.calculate(data, prevalidated=True).
+        """
+        start_dates = self.start_date.tolist()
+        end_dates = self.end_date.tolist()
+        for row in self.valid.nonzero()[0].tolist():
+            yield row, WeightChangeInput(
+                start_weight=float(self.start_weight[row]),
+                end_weight=float(self.end_weight[row]),
+                height_cm=float(self.height_cm[row]),
+                gender=self.gender[row],
+                start_date=start_dates[row],
+                end_date=end_dates[row],
+            )
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Columnar results of WeightChangeCalculator.calculate_many.
+
+    Every summary column holds one value per input row (NaN / 0 for rows
+    that failed validation). The daily series of all rows share the
+    weights and bmis buffers: row i owns weights[offsets[i]:offsets[i + 1]].
+    """
+
+    # --- per-row inputs ---
+    start_weight: Any
+    end_weight: Any
+    height_cm: Any
+    start_date: Sequence[datetime]
+    end_date: Sequence[datetime]
+
+    # --- per-row summary ---
+    days: Any
+    weight_difference: Any
+    daily_change: Any
+    bmi_start: Any
+    bmi_end: Any
+
+    # --- shared timeline buffers ---
+    offsets: Any
+    weights: Any
+    bmis: Any
+
+    # --- validation ---
+    valid: Any
+    errors: List[RowError]
+
+    # --- energy model only (kcal/day per row) ---
+    energy_intake: Any = None
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def timeline(self, row: int) -> Tuple[Any, Any]:
+        """
+        Returns views of the weight and BMI series of one row.
+        """
+        start, stop = self.offsets[row], self.offsets[row + 1]
+        return self.weights[start:stop], self.bmis[start:stop]
+
+    def result(self, row: int) -> "WeightChangeResult":
+        """
+        Materializes one row as a regular WeightChangeResult.
+        """
+        if not self.valid[row]:
+            error = next(e for e in self.errors if e.row == row)
+            raise ValueError(error.message)
+
+        weights, bmis = self.timeline(row)
+        return WeightChangeResult(
+            start_weight=float(self.start_weight[row]),
+            end_weight=float(self.end_weight[row]),
+            height_cm=float(self.height_cm[row]),
+            start_date=self.start_date[row],
+            end_date=self.end_date[row],
+            days=int(self.days[row]),
+            weight_difference=float(self.weight_difference[row]),
+            daily_change=float(self.daily_change[row]),
+            weights=weights.tolist(),
+            bmis=bmis.tolist(),
+            bmi_start=float(self.bmi_start[row]),
+            bmi_end=float(self.bmi_end[row]),
+            energy_intake=(
+                None if self.energy_intake is None
+                else float(self.energy_intake[row])
+            ),
+        )
+
+
+# ------------------------------------------------------------------
+# HISTORY MODEL
+# ------------------------------------------------------------------
+@dataclass(frozen=True)
+class HistoryEntry:
+    id: int
+    saved_at: datetime
+    plan_key: str
+    input: WeightChangeInput
+
+    # --- summary (timelines are recomputed on demand) ---
+    days: int
+    weight_difference: float
+    daily_change: float
+    bmi_start: float
+    bmi_end: float
@@ -0,0 +1,265 @@
+from typing import Callable, Dict, List
+
+from core.data_models import Gender
+from core.timeline import (
+    HAS_NUMPY,
+    BmiSeries,
+    Timeline,
+    _LazySeries,
+    calculate_bmi,
+    round_array,
+)
+
+
+# ------------------------------------------------------------------
+# MODEL CONSTANTS
+# ------------------------------------------------------------------
+
+KCAL_PER_KG = 7700.0          # energy density of body weight change
+ACTIVITY_FACTOR = 1.4         # TDEE = ACTIVITY_FACTOR * BMR (light activity)
+ADAPTATION_KCAL_PER_KG = 12.0 # expenditure drop per kg below the start weight
+DEFAULT_AGE = 35              # age is not collected by the UIs
+
+SEX_OFFSETS = {Gender.MALE: 5.0, Gender.FEMALE: -161.0}
+
+# Expenditure is linear in weight, E(W) = SLOPE * W + intercept, so a
+# constant intake I gives the daily recurrence
+#     W[t + 1] = W[t] + (I - E(W[t])) / KCAL_PER_KG = DECAY * W[t] + k
+# whose solution is W[t] = W* + (W[0] - W*) * DECAY ** t.
+SLOPE = ACTIVITY_FACTOR * 10 + ADAPTATION_KCAL_PER_KG
+DECAY = 1 - SLOPE / KCAL_PER_KG
+
+EnergyEngine = Callable[[float, float, float, Gender, int], Timeline]
+
+
+# ------------------------------------------------------------------
+# ENERGY EXPENDITURE
+# ------------------------------------------------------------------
+
+def bmr(weight, height_cm, gender: Gender, age: float = DEFAULT_AGE):
+    """
+    Mifflin-St Jeor basal metabolic rate in kcal/day.
+    """
+    return 10 * weight + 6.25 * height_cm - 5 * age + SEX_OFFSETS[Gender(gender)]
+
+
+def tdee(weight, height_cm, gender: Gender, age: float = DEFAULT_AGE):
+    """
+    Total daily energy expenditure before adaptation, in kcal/day.
+    """
+    return ACTIVITY_FACTOR * bmr(weight, height_cm, gender, age)
+
+
+def expenditure(weight, start_weight, height_cm, sex_offset):
+    """
+    Adapted expenditure: TDEE minus ADAPTATION_KCAL_PER_KG for every kg
+    below the start weight (plus as much for every kg above it).
+
+    Works element-wise on NumPy arrays; sex_offset is SEX_OFFSETS[gender].
+    """
+    intercept = ACTIVITY_FACTOR * (6.25 * height_cm - 5 * DEFAULT_AGE + sex_offset)
+    return SLOPE * weight + intercept - ADAPTATION_KCAL_PER_KG * start_weight
+
+
+# ------------------------------------------------------------------
+# CLOSED FORM
+# ------------------------------------------------------------------
+
+_SQUARES: List[float] = [DECAY]  # DECAY ** (2 ** bit)
+
+
+def _square(bit: int) -> float:
+    while len(_SQUARES) <= bit:
+        _SQUARES.append(_SQUARES[-1] * _SQUARES[-1])
+    return _SQUARES[bit]
+
+
+def decay_power(day: int) -> float:
+    """
+    DECAY ** day by binary exponentiation over a shared table of squares.
+
+    NumPy's vectorized power differs from ** in the last bit for many
+    inputs; multiplying the same squares in the same order keeps the
+    Python, lazy and NumPy engines bit-identical.
+    """
+    result = 1.0
+    bit = 0
+    while day:
+        if day & 1:
+            result *= _square(bit)
+        day >>= 1
+        bit += 1
+    return result
+
+
+def decay_powers(total_days: int):
+    """
+    decay_power(day) for every day in 0..total_days, as a float64 array.
+    """
+    import numpy as np
+
+    return decay_powers_at(np.arange(total_days + 1))
+
+
+def decay_powers_at(days):
+    """
+    decay_power(day) for every element of an integer array of days.
+    """
+    import numpy as np
+
+    powers = np.ones(days.shape)
+    bit = 0
+    while days.size and (1 << bit) <= days.max():
+        powers[(days >> bit) & 1 == 1] *= _square(bit)
+        bit += 1
+    return powers
+
+
+def equilibrium_weight(start_weight, end_weight, end_decay):
+    """
+    W* such that the trajectory reaches end_weight on the last day;
+    end_decay is decay_power(total_days).
+    """
+    return (end_weight - start_weight * end_decay) / (1 - end_decay)
+
+
+def required_intake(
+    start_weight: float,
+    end_weight: float,
+    height_cm: float,
+    gender: Gender,
+    total_days: int,
+) -> float:
+    """
+    Constant daily intake (kcal/day) reaching end_weight in total_days.
+    """
+    target = equilibrium_weight(start_weight, end_weight, decay_power(total_days))
+    return expenditure(target, start_weight, height_cm, SEX_OFFSETS[Gender(gender)])
+
+
+# ------------------------------------------------------------------
+# ENGINES
+# ------------------------------------------------------------------
+
+def build_energy_timeline_python(
+    start_weight: float,
+    end_weight: float,
+    height_cm: float,
+    gender: Gender,
+    total_days: int,
+) -> Timeline:
+    """
+    Reference engine: evaluates the closed form one day at a time.
+    """
+    target = equilibrium_weight(start_weight, end_weight, decay_power(total_days))
+    offset = start_weight - target
+
+    weights = [
+        round(target + offset * decay_power(day), 2)
+        for day in range(total_days + 1)
+    ]
+    return weights, [calculate_bmi(w, height_cm) for w in weights]
+
+
+def build_energy_timeline_numpy(
+    start_weight: float,
+    end_weight: float,
+    height_cm: float,
+    gender: Gender,
+    total_days: int,
+) -> Timeline:
+    """
+    Vectorized engine, returning the same lists as the Python engine.
+    """
+    powers = decay_powers(total_days)
+    target = equilibrium_weight(start_weight, end_weight, float(powers[-1]))
+
+    weights = round_array(target + (start_weight - target) * powers)
+    bmis = round_array(weights / ((height_cm / 100) ** 2))
+    return weights.tolist(), bmis.tolist()
+
+
+class EnergyWeightSeries(_LazySeries):
+    """
+    Daily weights of an energy-balance plan, computed on access.
+    """
+
+    def __init__(self, target: float, offset: float, days: range):
+        super().__init__(days)
+        self.target = target
+        self.offset = offset
+
+    def _value(self, day: int) -> float:
+        return round(self.target + self.offset * decay_power(day), 2)
+
+    def _view(self, days: range) -> "EnergyWeightSeries":
+        return EnergyWeightSeries(self.target, self.offset, days)
+
+
+def build_energy_timeline_lazy(
+    start_weight: float,
+    end_weight: float,
+    height_cm: float,
+    gender: Gender,
+    total_days: int,
+) -> Timeline:
+    """
+    Lazy engine: O(1) memory series computing each day on access.
+    """
+    target = equilibrium_weight(start_weight, end_weight, decay_power(total_days))
+    weights = EnergyWeightSeries(
+        target, start_weight - target, range(total_days + 1)
+    )
+    return weights, BmiSeries(weights, height_cm)
+
+
+def build_energy_buffers(start_weight, end_weight, height_cm, days, rows, day):
+    """
+    Weights, BMIs and equilibrium weights of many plans in one array
+    computation.
+
+    days holds the length of every plan; rows and day give the plan and
+    day number of every element of the shared timeline buffers (see
+    core.batch).
+    """
+    import numpy as np
+
+    powers = decay_powers(max(int(days.max()) if len(days) else 0, 1))
+    # invalid rows have 0 days and no timeline; keep them off 1 - 1
+    target = equilibrium_weight(start_weight, end_weight, powers[np.maximum(days, 1)])
+
+    weights = round_array(target[rows] + (start_weight - target)[rows] * powers[day])
+    bmis = round_array(weights / ((height_cm / 100) ** 2)[rows])
+    return weights, bmis, target
+
+
+# ------------------------------------------------------------------
+# MODEL SELECTION
+# ------------------------------------------------------------------
+
+MODELS = ("linear", "energy")
+
+ENERGY_ENGINES: Dict[str, EnergyEngine] = {
+    "python": build_energy_timeline_python,
+    "numpy": build_energy_timeline_numpy,
+    "lazy": build_energy_timeline_lazy,
+}
+
+
+def get_energy_engine(name: str) -> EnergyEngine:
+    """
+    Energy-model counterpart of core.timeline.get_engine.
+    """
+    if name == "auto":
+        name = "numpy" if HAS_NUMPY else "python"
+
+    if name not in ENERGY_ENGINES:
+        choices = ", ".join(["auto", *ENERGY_ENGINES])
+        raise ValueError(f"Unknown engine '{name}'. Choose one of: {choices}.")
+
+    if name == "numpy" and not HAS_NUMPY:
+        raise ImportError(
+            "The 'numpy' engine requires NumPy (pip install numpy)."
+        )
+
+    return ENERGY_ENGINES[name]
@@ -0,0 +1,218 @@
+import csv
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import (
+    RowError,
+    TimelineRow,
+    WeightChangeInput,
+    WeightChangeResult,
+)
+from core.plan_io import FORMATS, TIMELINE_FIELDS, detect_format
+from core.utils import format_date
+
+
+EXPORT_FORMATS = (*FORMATS, "parquet")
+EXPORT_FIELDS = (*TIMELINE_FIELDS, "category")
+
+# rows buffered per Parquet row group (the only rows held in memory)
+PARQUET_BATCH_ROWS = 65_536
+
+
+def detect_export_format(path: Union[str, Path], default: str = "csv") -> str:
+    """
+    detect_format, plus ".parquet" files.
+    """
+    if Path(str(path)).suffix.lower() == ".parquet":
+        return "parquet"
+    return detect_format(path, default)
+
+
+# ------------------------------------------------------------------
+# ROWS
+# ------------------------------------------------------------------
+
+def iter_result_timeline(result: WeightChangeResult, row: int = 0) -> Iterator[TimelineRow]:
+    """
+    Yields one TimelineRow per day of an already calculated result.
+    """
+    one_day = timedelta(days=1)
+    date = result.start_date
+    segments = iter(result.bmi_segments)
+    segment = next(segments)
+
+    for day, (weight, bmi) in enumerate(zip(result.weights, result.bmis)):
+        if day > segment.end_day:
+            # segments are contiguous and in day order
+            segment = next(segments)
+        yield TimelineRow(row, day, date, weight, bmi, segment.category)
+        date += one_day
+
+
+def iter_timeline(
+    data: WeightChangeInput, model: str = "linear", row: int = 0
+) -> Iterator[TimelineRow]:
+    """
+    Lazily yields (date, weight, BMI, category) rows for every day of
+    the plan.
+
+    The lazy engine computes each day as it is reached, so memory stays
+    O(1) whatever the plan length. Invalid input raises ValueError here,
+    not on the first next().
+    """
+    result = WeightChangeCalculator(engine="lazy", model=model).calculate(data)
+    return iter_result_timeline(result, row)
+
+
+def iter_batch_timeline(
+    plans: Iterable[Tuple[int, Union[WeightChangeInput, RowError]]],
+    model: str = "linear",
+    on_error: Optional[Callable[[RowError], None]] = None,
+) -> Iterator[TimelineRow]:
+    """
+    Timelines of many plans one after another, from (row, plan or
+    RowError) pairs as yielded by plan_io.read_plans. Only one plan is
+    alive at a time; rejected rows go to on_error and are skipped.
+    """
+    calculator = WeightChangeCalculator(engine="lazy", model=model)
+    for row, plan in plans:
+        if not isinstance(plan, RowError):
+            try:
+                result = calculator.calculate(plan)
+            except ValueError as e:
+                # fields are already valid here: only the date range can fail
+                plan = RowError(row, "end_date", str(e))
+            else:
+                yield from iter_result_timeline(result, row)
+                continue
+        if on_error is not None:
+            on_error(plan)
+
+
+def timeline_row_record(row: TimelineRow) -> Dict[str, Any]:
+    return {
+        "row": row.row,
+        "day": row.day,
+        "date": format_date(row.date),
+        "weight": row.weight,
+        "bmi": row.bmi,
+        "category": row.category.value,
+    }
+
+
+# ------------------------------------------------------------------
+# WRITERS
+# ------------------------------------------------------------------
+
+class TimelineWriter:
+    """
+    Streams TimelineRows as CSV or JSONL (EXPORT_FIELDS), one record
+    per row as it arrives.
+    """
+
+    def __init__(self, stream: IO[str], fmt: str):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format '{fmt}'.")
+
+        self.stream = stream
+        self.fmt = fmt
+        self.count = 0
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=EXPORT_FIELDS)
+            self._csv.writeheader()
+
+    def write(self, row: TimelineRow) -> None:
+        record = timeline_row_record(row)
+        if self.fmt == "csv":
+            self._csv.writerow(record)
+        else:
+            self.stream.write(json.dumps(record) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class ParquetTimelineWriter:
+    """
+    Writes TimelineRows to a Parquet file, one row group per batch_rows
+    rows, so at most one row group is buffered. Requires pyarrow.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_rows: int = PARQUET_BATCH_ROWS):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError(
+                "Parquet export requires pyarrow (pip install pyarrow)."
+            ) from None
+
+        self._pa = pa
+        self._schema = pa.schema([
+            ("row", pa.int64()),
+            ("day", pa.int64()),
+            ("date", pa.date32()),
+            ("weight", pa.float64()),
+            ("bmi", pa.float64()),
+            ("category", pa.dictionary(pa.int8(), pa.string())),
+        ])
+        self._writer = pq.ParquetWriter(str(path), self._schema)
+        self._batch_rows = batch_rows
+        self._columns = {name: [] for name in EXPORT_FIELDS}
+        self.count = 0
+
+    def write(self, row: TimelineRow) -> None:
+        columns = self._columns
+        columns["row"].append(row.row)
+        columns["day"].append(row.day)
+        columns["date"].append(row.date.date())
+        columns["weight"].append(row.weight)
+        columns["bmi"].append(row.bmi)
+        columns["category"].append(row.category.value)
+        self.count += 1
+        if len(columns["row"]) >= self._batch_rows:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._columns["row"]:
+            table = self._pa.Table.from_pydict(self._columns, schema=self._schema)
+            self._writer.write_table(table)
+            self._columns = {name: [] for name in EXPORT_FIELDS}
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+def export_timeline(
+    rows: Iterable[TimelineRow],
+    path: Union[str, Path],
+    fmt: Optional[str] = None,
+) -> int:
+    """
+    Writes rows to path as CSV, JSONL or Parquet (from the extension
+    unless fmt is given) and returns the number of rows written. rows
+    is consumed as it is written, never collected.
+    """
+    fmt = fmt or detect_export_format(path)
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format '{fmt}'.")
+
+    if fmt == "parquet":
+        writer = ParquetTimelineWriter(path)
+        try:
+            for row in rows:
+                writer.write(row)
+        finally:
+            writer.close()
+        return writer.count
+
+    with open(path, "w", newline="", encoding="utf-8") as stream:
+        writer = TimelineWriter(stream, fmt)
+        for row in rows:
+            writer.write(row)
+    return writer.count
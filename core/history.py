@@ -0,0 +1,300 @@
+import bisect
+import json
+import os
+import struct
+import zlib
+from datetime import date, datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+from core.data_models import (
+    Gender,
+    HistoryEntry,
+    WeightChangeInput,
+    WeightChangeResult,
+)
+
+
+DEFAULT_HISTORY_PATH = Path(__file__).resolve().parents[1] / "data" / "history.json"
+
+# offset, length, saved day (date ordinal), first 8 bytes of the plan key
+_INDEX_RECORD = struct.Struct("<QIIQ")
+
+
+class HistoryStore:
+    """
+    Append-only store of every computed plan.
+
+    Records are appended to a JSON Lines log (data/history.json), each
+    with a CRC so a line torn by a crash is detected. A fixed-width
+    binary index next to it (history.idx) holds the offset, length,
+    saved day and key hash of every record, which allows:
+
+    - recent(): reads only the tail of the index and the matching log
+      lines, so opening a store with 100k plans costs the same as with
+      a handful;
+    - find_by_date(): binary search over the index (saved days never
+      decrease);
+    - find_by_key(): a key-hash table built from the index, not from
+      the log.
+
+    On open, only the part of the log past the last indexed record is
+    checked: complete records are indexed and a torn tail is truncated.
+    An indexed record that later fails its check is skipped on read.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_HISTORY_PATH,
+        recent_count: int = 50,
+    ):
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx")
+        self.recent_count = recent_count
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch(exist_ok=True)
+        self.index_path.touch(exist_ok=True)
+
+        self._recover()
+        self._key_table: Optional[Dict[int, List[int]]] = None
+        self.entries: List[HistoryEntry] = self.recent()
+
+    # ------------------------------------------------------------------
+    # PUBLIC API
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self.index_path.stat().st_size // _INDEX_RECORD.size
+
+    def append(
+        self,
+        data: WeightChangeInput,
+        result: WeightChangeResult,
+        saved_at: Optional[datetime] = None,
+    ) -> HistoryEntry:
+        """
+        Persists one computed plan and returns its history entry.
+        """
+        saved_at = saved_at or datetime.now()
+        data = data.normalized()
+
+        record = {
+            "id": len(self),
+            "saved_at": saved_at.isoformat(),
+            "plan_key": data.plan_key,
+            "input": {
+                "start_weight": data.start_weight,
+                "end_weight": data.end_weight,
+                "height_cm": data.height_cm,
+                "gender": data.gender.value,
+                "start_date": data.start_date.isoformat(),
+                "end_date": data.end_date.isoformat(),
+            },
+            "days": result.days,
+            "weight_difference": result.weight_difference,
+            "daily_change": result.daily_change,
+            "bmi_start": result.bmi_start,
+            "bmi_end": result.bmi_end,
+        }
+        line = _encode(record)
+
+        # Index days never decrease, even if the clock goes backwards,
+        # so find_by_date() can binary search.
+        last = self._read_index(len(self) - 1) if len(self) else None
+        day = max(saved_at.toordinal(), last[2] if last else 0)
+
+        offset = self.path.stat().st_size
+        _append_durably(self.path, line)
+        _append_durably(
+            self.index_path,
+            _INDEX_RECORD.pack(offset, len(line), day, _key_hash(data.plan_key)),
+        )
+
+        entry = _to_entry(record)
+        if self._key_table is not None:
+            self._key_table.setdefault(_key_hash(entry.plan_key), []).append(entry.id)
+        self.entries = (self.entries + [entry])[-self.recent_count:]
+        return entry
+
+    def recent(self, count: Optional[int] = None) -> List[HistoryEntry]:
+        """
+        Returns the last count entries, oldest first.
+        """
+        count = self.recent_count if count is None else count
+        total = len(self)
+        return list(self._entries(range(max(total - count, 0), total)))
+
+    def find_by_key(self, plan_key: str) -> List[HistoryEntry]:
+        """
+        Returns every entry saved for the given plan key.
+        """
+        if self._key_table is None:
+            self._key_table = {}
+            for position, record in enumerate(self._iter_index()):
+                self._key_table.setdefault(record[3], []).append(position)
+
+        candidates = self._key_table.get(_key_hash(plan_key), [])
+        return [e for e in self._entries(candidates) if e.plan_key == plan_key]
+
+    def find_by_date(
+        self, first: date, last: Optional[date] = None
+    ) -> List[HistoryEntry]:
+        """
+        Returns the entries saved between first and last (inclusive).
+        """
+        last = last or first
+        days = _IndexDays(self)
+        start = bisect.bisect_left(days, first.toordinal())
+        stop = bisect.bisect_right(days, last.toordinal())
+        return list(self._entries(range(start, stop)))
+
+    # ------------------------------------------------------------------
+    # INTERNAL HELPERS
+    # ------------------------------------------------------------------
+    def _read_index(self, position: int):
+        with open(self.index_path, "rb") as index:
+            index.seek(position * _INDEX_RECORD.size)
+            return _INDEX_RECORD.unpack(index.read(_INDEX_RECORD.size))
+
+    def _iter_index(self) -> Iterator[tuple]:
+        with open(self.index_path, "rb") as index:
+            while chunk := index.read(_INDEX_RECORD.size * 4096):
+                yield from _INDEX_RECORD.iter_unpack(chunk)
+
+    def _entries(self, positions) -> Iterator[HistoryEntry]:
+        with open(self.index_path, "rb") as index, open(self.path, "rb") as log:
+            for position in positions:
+                index.seek(position * _INDEX_RECORD.size)
+                offset, length, _, _ = _INDEX_RECORD.unpack(
+                    index.read(_INDEX_RECORD.size)
+                )
+                log.seek(offset)
+                try:
+                    yield _to_entry(_decode(log.read(length)))
+                except ValueError:
+                    continue  # corrupted after it was indexed: skip it
+
+    def _recover(self) -> None:
+        record_size = _INDEX_RECORD.size
+        log_size = self.path.stat().st_size
+
+        # Drop a torn index record and records pointing past the log.
+        index_size = self.index_path.stat().st_size
+        count = index_size // record_size
+        while count:
+            offset, length, _, _ = self._read_index(count - 1)
+            if offset + length <= log_size:
+                break
+            count -= 1
+        if count * record_size != index_size:
+            os.truncate(self.index_path, count * record_size)
+
+        # Index complete records written after the last indexed one,
+        # then cut whatever is left (a torn or corrupt tail).
+        if count:
+            offset, length, day, _ = self._read_index(count - 1)
+            indexed_end = offset + length
+        else:
+            indexed_end, day = 0, 0
+
+        if indexed_end == log_size:
+            return
+
+        with open(self.path, "rb") as log:
+            log.seek(indexed_end)
+            good_end = indexed_end
+            for line in log:
+                try:
+                    record = _decode(line)
+                except ValueError:
+                    break
+                day = max(
+                    datetime.fromisoformat(record["saved_at"]).toordinal(), day
+                )
+                _append_durably(
+                    self.index_path,
+                    _INDEX_RECORD.pack(
+                        good_end, len(line), day, _key_hash(record["plan_key"])
+                    ),
+                )
+                good_end += len(line)
+
+        if good_end != log_size:
+            os.truncate(self.path, good_end)
+
+
+class _IndexDays:
+    """
+    Sequence view of the saved days in the index, for bisect.
+    """
+
+    def __init__(self, store: HistoryStore):
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, position: int) -> int:
+        return self.store._read_index(position)[2]
+
+
+# ------------------------------------------------------------------
+# RECORD ENCODING
+# ------------------------------------------------------------------
+
+def _encode(record: dict) -> bytes:
+    payload = json.dumps(record, sort_keys=True, separators=(",", ":"))
+    crc = zlib.crc32(payload.encode())
+    return (payload[:-1] + f',"crc":{crc}}}\n').encode()
+
+
+def _decode(line: bytes) -> dict:
+    if not line.endswith(b"\n"):
+        raise ValueError("Incomplete history record.")
+    try:
+        record = json.loads(line)
+        crc = record.pop("crc")
+    except (json.JSONDecodeError, KeyError, AttributeError, TypeError):
+        raise ValueError("Corrupt history record.")
+    payload = json.dumps(record, sort_keys=True, separators=(",", ":"))
+    if zlib.crc32(payload.encode()) != crc:
+        raise ValueError("History record checksum mismatch.")
+    return record
+
+
+def _to_entry(record: dict) -> HistoryEntry:
+    fields = record["input"]
+    return HistoryEntry(
+        id=record["id"],
+        saved_at=datetime.fromisoformat(record["saved_at"]),
+        plan_key=record["plan_key"],
+        input=WeightChangeInput(
+            start_weight=fields["start_weight"],
+            end_weight=fields["end_weight"],
+            height_cm=fields["height_cm"],
+            gender=Gender(fields["gender"]),
+            start_date=datetime.fromisoformat(fields["start_date"]),
+            end_date=datetime.fromisoformat(fields["end_date"]),
+        ),
+        days=record["days"],
+        weight_difference=record["weight_difference"],
+        daily_change=record["daily_change"],
+        bmi_start=record["bmi_start"],
+        bmi_end=record["bmi_end"],
+    )
+
+
+def _key_hash(plan_key: str) -> int:
+    return int(plan_key[:16], 16)
+
+
+def _append_durably(path: Path, data: bytes) -> None:
+    """
+    Appends data with a single write and fsyncs it before returning.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,205 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from itertools import chain
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.batch import BatchInput, calculate_batch, np, to_columns
+from core.data_models import BatchResult, RowError
+
+
+_SUMMARY_COLUMNS = (
+    "start_weight",
+    "end_weight",
+    "height_cm",
+    "days",
+    "weight_difference",
+    "daily_change",
+    "bmi_start",
+    "bmi_end",
+    "valid",
+)
+
+_DATE_COLUMNS = ("start_date", "end_date")
+
+_ChunkResult = Tuple[str, int, Dict[str, Any], Any, List[RowError]]
+
+
+# ------------------------------------------------------------------
+# WORKER SIDE
+# ------------------------------------------------------------------
+
+def _calculate_chunk(columns: Dict[str, list], engine: str, model: str) -> _ChunkResult:
+    """
+    Calculates one chunk in a worker process.
+
+    The weight and BMI buffers are written to a new shared memory block
+    whose name is returned; only the small summary columns are pickled.
+    """
+    batch = calculate_batch(columns, engine=engine, model=model)
+    length = len(batch.weights)
+
+    block = shared_memory.SharedMemory(create=True, size=max(16 * length, 1))
+    timeline = np.ndarray((2, length), dtype=np.float64, buffer=block.buf)
+    timeline[0] = batch.weights
+    timeline[1] = batch.bmis
+    del timeline
+    block.close()
+
+    summary = {
+        name: getattr(batch, name) for name in _SUMMARY_COLUMNS + _DATE_COLUMNS
+    }
+    summary["energy_intake"] = batch.energy_intake
+    return block.name, length, summary, batch.offsets, batch.errors
+
+
+# ------------------------------------------------------------------
+# PARENT SIDE
+# ------------------------------------------------------------------
+
+class ParallelCalculator:
+    """
+    Runs calculate_many over a ProcessPoolExecutor.
+
+    The input is split into chunks of chunk_size rows that are
+    calculated in parallel; output rows keep the input order. Timeline
+    buffers come back through shared memory and are copied once into
+    the final BatchResult buffers.
+
+    Use as a context manager (or call close()) to stop the workers.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_size: int = 2_000,
+        engine: str = "numpy",
+        model: str = "linear",
+    ):
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be greater than zero.")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.engine = engine
+        self.model = model
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelCalculator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    # ------------------------------------------------------------------
+    # PUBLIC API
+    # ------------------------------------------------------------------
+    def calculate_many(self, data: BatchInput) -> BatchResult:
+        columns = to_columns(data)
+        size = len(columns["start_weight"])
+
+        if self.workers == 1 or size <= self.chunk_size:
+            return calculate_batch(columns, engine=self.engine, model=self.model)
+
+        if self._pool is None:
+            # Workers must share the parent's resource tracker: blocks they
+            # create are then released by the parent's unlink() instead of
+            # being reported as leaked when a worker exits.
+            resource_tracker.ensure_running()
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+        starts = range(0, size, self.chunk_size)
+        chunks = (
+            {name: values[start:start + self.chunk_size]
+             for name, values in columns.items()}
+            for start in starts
+        )
+        futures = [
+            self._pool.submit(_calculate_chunk, chunk, self.engine, self.model)
+            for chunk in chunks
+        ]
+
+        # results are collected in submission order
+        try:
+            results = [future.result() for future in futures]
+            return self._assemble(starts, results)
+        except BaseException:
+            # a failed chunk must not leak the blocks of the ones that
+            # succeeded, including those still running
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            _release(
+                future.result()[0] for future in futures
+                if not future.cancelled() and future.exception() is None
+            )
+            raise
+
+    # ------------------------------------------------------------------
+    # INTERNAL HELPERS
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _assemble(starts, results: List[_ChunkResult]) -> BatchResult:
+        total = sum(length for _, length, _, _, _ in results)
+        weights = np.empty(total, dtype=np.float64)
+        bmis = np.empty(total, dtype=np.float64)
+
+        offsets = [np.zeros(1, dtype=np.int64)]
+        errors: List[RowError] = []
+        position = 0
+
+        for start, (name, length, _, chunk_offsets, chunk_errors) in zip(starts, results):
+            block = shared_memory.SharedMemory(name=name)
+            try:
+                timeline = np.ndarray((2, length), dtype=np.float64, buffer=block.buf)
+                weights[position:position + length] = timeline[0]
+                bmis[position:position + length] = timeline[1]
+                del timeline
+            finally:
+                block.close()
+                block.unlink()
+
+            offsets.append(chunk_offsets[1:] + position)
+            errors.extend(
+                RowError(e.row + start, e.field, e.message) for e in chunk_errors
+            )
+            position += length
+
+        summary = {
+            name: np.concatenate([r[2][name] for r in results])
+            for name in _SUMMARY_COLUMNS
+        }
+        dates = {
+            name: list(chain.from_iterable(r[2][name] for r in results))
+            for name in _DATE_COLUMNS
+        }
+        intakes = [r[2]["energy_intake"] for r in results]
+        energy_intake = None if intakes[0] is None else np.concatenate(intakes)
+
+        return BatchResult(
+            offsets=np.concatenate(offsets),
+            weights=weights,
+            bmis=bmis,
+            errors=errors,
+            energy_intake=energy_intake,
+            **summary,
+            **dates,
+        )
+
+
+def _release(names) -> None:
+    """
+    Unlinks shared memory blocks that were not consumed.
+    """
+    for name in names:
+        try:
+            block = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            continue
+        block.close()
+        block.unlink()
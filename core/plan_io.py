@@ -0,0 +1,232 @@
+import csv
+import json
+from datetime import timedelta
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Tuple, Union
+
+from core.data_models import (
+    Gender,
+    RowError,
+    WeightChangeInput,
+    WeightChangeResult,
+)
+from core.utils import (
+    format_date,
+    parse_date,
+    validate_gender,
+    validate_positive,
+)
+
+
+FORMATS = ("csv", "jsonl")
+DETAIL_LEVELS = ("summary", "weekly", "daily")
+
+PLAN_FIELDS = (
+    "start_weight",
+    "end_weight",
+    "height_cm",
+    "gender",
+    "start_date",
+    "end_date",
+)
+SUMMARY_FIELDS = (
+    "row",
+    *PLAN_FIELDS,
+    "days",
+    "weight_difference",
+    "daily_change",
+    "bmi_start",
+    "bmi_end",
+)
+TIMELINE_FIELDS = ("row", "day", "date", "weight", "bmi")
+
+
+def detect_format(path: Union[str, Path], default: str = "csv") -> str:
+    """
+    Guesses the file format from its extension.
+    """
+    suffix = Path(str(path)).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    return default
+
+
+# ------------------------------------------------------------------
+# READING
+# ------------------------------------------------------------------
+
+_FIELD_PARSERS = (
+    ("start_weight", lambda v: validate_positive(v, "Start weight")),
+    ("end_weight", lambda v: validate_positive(v, "End weight")),
+    ("height_cm", lambda v: validate_positive(v, "Height")),
+    ("gender", lambda v: Gender(validate_gender(v))),
+    ("start_date", lambda v: parse_date(v, "Start date")),
+    ("end_date", lambda v: parse_date(v, "End date")),
+)
+
+
+def iter_records(stream: IO[str], fmt: str) -> Iterator[Tuple[int, Any]]:
+    """
+    Yields (row number, record dict) lazily, one input row at a time.
+
+    Rows are numbered from 1, not counting the CSV header. A JSONL line
+    that is not a JSON object is yielded as a RowError.
+    """
+    if fmt == "csv":
+        yield from enumerate(csv.DictReader(stream), start=1)
+        return
+
+    if fmt != "jsonl":
+        raise ValueError(f"Unsupported format '{fmt}'.")
+
+    row = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row, RowError(row, "record", f"Invalid JSON: {e.msg}.")
+            continue
+        if not isinstance(record, dict):
+            yield row, RowError(row, "record", "Each line must be a JSON object.")
+            continue
+        yield row, record
+
+
+def parse_plan(row: int, record: Dict[str, Any]) -> Union[WeightChangeInput, RowError]:
+    """
+    Converts one input record into a WeightChangeInput, or the RowError
+    of its first invalid field.
+    """
+    values = {}
+    for field, parse in _FIELD_PARSERS:
+        try:
+            values[field] = parse(record.get(field))
+        except ValueError as e:
+            return RowError(row, field, str(e))
+    return WeightChangeInput(**values)
+
+
+def read_plans(
+    stream: IO[str], fmt: str
+) -> Iterator[Tuple[int, Union[WeightChangeInput, RowError]]]:
+    """
+    Lazily yields (row number, plan or RowError) for every input row.
+    """
+    for row, record in iter_records(stream, fmt):
+        if isinstance(record, RowError):
+            yield row, record
+        else:
+            yield row, parse_plan(row, record)
+
+
+# ------------------------------------------------------------------
+# WRITING
+# ------------------------------------------------------------------
+
+class PlanWriter:
+    """
+    Streams calculated plans as CSV or JSONL.
+
+    detail selects what is written for each plan:
+    - "summary": one record per plan (SUMMARY_FIELDS);
+    - "weekly":  one record per week of the plan plus its last day;
+    - "daily":   one record per day (TIMELINE_FIELDS).
+    """
+
+    def __init__(self, stream: IO[str], fmt: str, detail: str = "summary"):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported format '{fmt}'.")
+        if detail not in DETAIL_LEVELS:
+            raise ValueError(f"Unsupported detail level '{detail}'.")
+
+        self.stream = stream
+        self.fmt = fmt
+        self.detail = detail
+
+        fields = SUMMARY_FIELDS if detail == "summary" else TIMELINE_FIELDS
+        if fmt == "csv":
+            self._csv = csv.DictWriter(stream, fieldnames=fields)
+            self._csv.writeheader()
+
+    def write(self, row: int, data: WeightChangeInput, result: WeightChangeResult) -> None:
+        if self.detail == "summary":
+            self._write_record(summary_record(row, data, result))
+            return
+
+        step = 7 if self.detail == "weekly" else 1
+        for day in range(0, result.days + 1, step):
+            self._write_record(timeline_record(row, result, day))
+        if result.days % step:
+            self._write_record(timeline_record(row, result, result.days))
+
+    def _write_record(self, record: Dict[str, Any]) -> None:
+        if self.fmt == "csv":
+            self._csv.writerow(record)
+        else:
+            self.stream.write(json.dumps(record) + "\n")
+
+
+class ErrorWriter:
+    """
+    Streams RowErrors as JSON lines: {"row", "field", "message"}.
+    """
+
+    def __init__(self, stream: IO[str]):
+        self.stream = stream
+        self.count = 0
+
+    def write(self, error: RowError) -> None:
+        self.count += 1
+        self.stream.write(json.dumps({
+            "row": error.row,
+            "field": error.field,
+            "message": error.message,
+        }) + "\n")
+
+
+def summary_record(row: int, data: WeightChangeInput, result: WeightChangeResult) -> Dict[str, Any]:
+    return {
+        "row": row,
+        "start_weight": result.start_weight,
+        "end_weight": result.end_weight,
+        "height_cm": result.height_cm,
+        "gender": Gender(data.gender).value,
+        "start_date": format_date(result.start_date),
+        "end_date": format_date(result.end_date),
+        "days": result.days,
+        "weight_difference": result.weight_difference,
+        "daily_change": result.daily_change,
+        "bmi_start": result.bmi_start,
+        "bmi_end": result.bmi_end,
+    }
+
+
+def segment_records(result: WeightChangeResult) -> List[Dict[str, Any]]:
+    """
+    The BMI category runs of result, with their dates.
+    """
+    return [
+        {
+            "start_day": segment.start_day,
+            "end_day": segment.end_day,
+            "start_date": format_date(result.start_date + timedelta(days=segment.start_day)),
+            "end_date": format_date(result.start_date + timedelta(days=segment.end_day)),
+            "category": segment.category.value,
+        }
+        for segment in result.bmi_segments
+    ]
+
+
+def timeline_record(row: int, result: WeightChangeResult, day: int) -> Dict[str, Any]:
+    return {
+        "row": row,
+        "day": day,
+        "date": format_date(result.start_date + timedelta(days=day)),
+        "weight": result.weights[day],
+        "bmi": result.bmis[day],
+    }
@@ -0,0 +1,258 @@
+import bisect
+import math
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import WeightChangeInput, WeightChangeResult
+from core.energy import decay_powers_at, equilibrium_weight
+from core.timeline import round_array
+
+
+# ------------------------------------------------------------------
+# PACE THRESHOLDS
+# ------------------------------------------------------------------
+
+MAX_DAILY_LOSS = 0.15  # kg/day; faster loss is flagged as "danger"
+MAX_DAILY_GAIN = 0.10  # kg/day; faster gain is flagged as "warning"
+
+# round(x, 4) <= limit holds up to half a unit of the 4th decimal above
+# limit; closed forms below solve against this and are then corrected
+# by one step with the exact check.
+_HALF_UNIT = 0.00005
+
+
+def pace_level(daily_change: float) -> Optional[str]:
+    """
+    "danger" for too fast a loss, "warning" for too fast a gain, None
+    for a safe pace. daily_change is WeightChangeResult.daily_change.
+    """
+    if daily_change < -MAX_DAILY_LOSS:
+        return "danger"
+    if daily_change > MAX_DAILY_GAIN:
+        return "warning"
+    return None
+
+
+def _is_safe(difference: float, days: int) -> bool:
+    # same rounding as WeightChangeResult.daily_change
+    return pace_level(round(difference / days, 4)) is None
+
+
+def _limit(difference):
+    return MAX_DAILY_GAIN if difference > 0 else MAX_DAILY_LOSS
+
+
+# ------------------------------------------------------------------
+# EARLIEST SAFE END DATE
+# ------------------------------------------------------------------
+
+def earliest_safe_days(start_weight: float, end_weight: float) -> int:
+    """
+    Shortest plan length (>= 1 day) whose daily change is not flagged.
+    """
+    difference = end_weight - start_weight
+    days = max(1, math.ceil(abs(difference) / (_limit(difference) + _HALF_UNIT)))
+
+    while days > 1 and _is_safe(difference, days - 1):
+        days -= 1
+    while not _is_safe(difference, days):
+        days += 1
+    return days
+
+
+def earliest_safe_end_date(
+    start_weight: float, end_weight: float, start_date: datetime
+) -> datetime:
+    return start_date + timedelta(days=earliest_safe_days(start_weight, end_weight))
+
+
+# ------------------------------------------------------------------
+# SAFE TARGETS
+# ------------------------------------------------------------------
+
+def safe_target_range(start_weight: float, days: int) -> Tuple[float, float]:
+    """
+    Lowest and highest end weight (to 0.01 kg) reachable in days
+    without a pace warning. The lowest weight never drops below 0.01 kg.
+    """
+    if days <= 0:
+        raise ValueError("Date range must be at least 1 day.")
+
+    low = math.ceil((start_weight - (MAX_DAILY_LOSS + _HALF_UNIT) * days) * 100)
+    low = max(low, 1)
+    while low > 1 and _is_safe((low - 1) / 100 - start_weight, days):
+        low -= 1
+    while not _is_safe(low / 100 - start_weight, days):
+        low += 1
+
+    high = math.floor((start_weight + (MAX_DAILY_GAIN + _HALF_UNIT) * days) * 100)
+    while _is_safe((high + 1) / 100 - start_weight, days):
+        high += 1
+    while not _is_safe(high / 100 - start_weight, days):
+        high -= 1
+
+    return low / 100, high / 100
+
+
+# ------------------------------------------------------------------
+# BMI MILESTONES
+# ------------------------------------------------------------------
+
+def bmi_reached_day(
+    data: WeightChangeInput, bmi: float, model: str = "linear"
+) -> Optional[int]:
+    """
+    First day of the plan on which the daily BMI reaches bmi (falls to
+    it when bmi is at or below the start BMI, rises to it otherwise),
+    or None if it never does.
+
+    Bisects the O(1)-memory lazy series, so only ~log2(days) days are
+    ever computed.
+    """
+    result = WeightChangeCalculator(engine="lazy", model=model).calculate(data)
+    return bmi_reached_day_in(result, bmi)
+
+
+def bmi_reached_day_in(result: WeightChangeResult, bmi: float) -> Optional[int]:
+    """
+    bmi_reached_day for an already calculated result; O(log days) reads
+    of result.bmis.
+    """
+    bmis = result.bmis
+    falling = bmi <= bmis[0]
+
+    def reached(day: int) -> bool:
+        return bmis[day] <= bmi if falling else bmis[day] >= bmi
+
+    if reached(0):
+        return 0
+    if not reached(result.days):
+        return None
+    # the series is monotonic, so reached() flips once from False to True
+    return bisect.bisect_left(range(result.days + 1), True, key=reached)
+
+
+def bmi_reached_date(
+    data: WeightChangeInput, bmi: float, model: str = "linear"
+) -> Optional[datetime]:
+    day = bmi_reached_day(data, bmi, model)
+    return None if day is None else data.start_date + timedelta(days=day)
+
+
+# ------------------------------------------------------------------
+# BATCH FORMS
+# ------------------------------------------------------------------
+
+def _safe_many(difference, days):
+    import numpy as np
+
+    daily_change = round_array(difference / np.maximum(days, 1), 4)
+    return (days >= 1) & (daily_change >= -MAX_DAILY_LOSS) & (daily_change <= MAX_DAILY_GAIN)
+
+
+def earliest_safe_days_many(start_weight, end_weight):
+    """
+    earliest_safe_days for arrays of start and end weights (int64 array).
+    """
+    import numpy as np
+
+    difference = np.asarray(end_weight, dtype=np.float64) - np.asarray(start_weight, dtype=np.float64)
+    limit = np.where(difference > 0, MAX_DAILY_GAIN, MAX_DAILY_LOSS)
+    estimate = np.maximum(1, np.ceil(np.abs(difference) / (limit + _HALF_UNIT))).astype(np.int64)
+
+    # the estimate is at most one day off either way; keep the shortest safe
+    days = estimate + 1
+    for candidate in (estimate, estimate - 1):
+        days = np.where(_safe_many(difference, candidate), candidate, days)
+    return days
+
+
+def safe_target_range_many(start_weight, days):
+    """
+    safe_target_range for arrays of start weights and plan lengths;
+    returns (lowest, highest) float64 arrays.
+    """
+    import numpy as np
+
+    start_weight = np.asarray(start_weight, dtype=np.float64)
+    days = np.asarray(days, dtype=np.int64)
+    if np.any(days <= 0):
+        raise ValueError("Date range must be at least 1 day.")
+
+    low = np.ceil((start_weight - (MAX_DAILY_LOSS + _HALF_UNIT) * days) * 100)
+    low = np.maximum(low, 1)
+    lowest = low + 1
+    for candidate in (low, low - 1):
+        ok = (candidate >= 1) & _safe_many(candidate / 100 - start_weight, days)
+        lowest = np.where(ok, candidate, lowest)
+
+    high = np.floor((start_weight + (MAX_DAILY_GAIN + _HALF_UNIT) * days) * 100)
+    highest = high - 1
+    for candidate in (high, high + 1):
+        ok = _safe_many(candidate / 100 - start_weight, days)
+        highest = np.where(ok, candidate, highest)
+
+    return lowest / 100, highest / 100
+
+
+def bmi_reached_days_many(data, bmi, model: str = "linear"):
+    """
+    bmi_reached_day for many plans (same inputs as calculate_many);
+    bmi is a scalar or one target per row.
+
+    Returns an int64 array with -1 where the BMI is never reached or the
+    row failed validation. All rows are bisected together, evaluating
+    the model only at the probed days.
+    """
+    import numpy as np
+
+    from core.validation import validate_columns
+
+    checked = validate_columns(data, model)
+    valid = checked.valid
+    days = checked.days
+    start = np.where(valid, checked.start_weight, 1.0)
+    end = np.where(valid, checked.end_weight, 1.0)
+    height_m2 = (np.where(valid, checked.height_cm, 100.0) / 100) ** 2
+    target = np.broadcast_to(np.asarray(bmi, dtype=np.float64), days.shape)
+    plan_days = np.maximum(days, 1)
+
+    if model == "energy":
+        equilibrium = equilibrium_weight(start, end, decay_powers_at(plan_days))
+
+        def weights_on(day):
+            return round_array(equilibrium + (start - equilibrium) * decay_powers_at(day))
+    elif model == "linear":
+        daily_change = (end - start) / plan_days
+
+        def weights_on(day):
+            return round_array(start + daily_change * day)
+    else:
+        # same message as the calculator
+        WeightChangeCalculator(model=model)
+
+    def bmis_on(day):
+        return round_array(weights_on(day) / height_m2)
+
+    falling = target <= bmis_on(np.zeros_like(days))
+
+    def reached(day):
+        bmis = bmis_on(day)
+        return np.where(falling, bmis <= target, bmis >= target)
+
+    at_start = reached(np.zeros_like(days))
+    at_end = reached(days)
+
+    # reached(low) is False and reached(high) True for every open row
+    low = np.zeros_like(days)
+    high = days.copy()
+    while np.any(high - low > 1):
+        middle = (low + high) // 2
+        hit = reached(middle)
+        high = np.where(hit, middle, high)
+        low = np.where(hit, low, middle)
+
+    result = np.where(at_start, 0, np.where(at_end, high, -1))
+    result[~valid] = -1
+    return result
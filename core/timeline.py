@@ -0,0 +1,406 @@
+import abc
+import bisect
+import importlib.util
+import itertools
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, Union
+
+from core.data_models import BmiCategory, BmiSegment
+
+
+# NumPy is optional (the Python and lazy engines need nothing) and is
+# only imported by the functions that use it, to keep core imports fast.
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+Timeline = Tuple[Sequence[float], Sequence[float]]
+TimelineEngine = Callable[[float, float, float, int], Timeline]
+
+# WHO adult categories: a BMI equal to a boundary belongs to the upper one
+BMI_BOUNDARIES = (18.5, 25, 30)
+BMI_CATEGORIES = tuple(BmiCategory)
+
+
+# ------------------------------------------------------------------
+# BMI
+# ------------------------------------------------------------------
+
+def calculate_bmi(weight: float, height_cm: float) -> float:
+    """
+    BMI = weight (kg) / height (m)^2
+    """
+    height_m = height_cm / 100
+    bmi = weight / (height_m ** 2)
+    return round(bmi, 2)
+
+
+def bmi_category(bmi: float) -> BmiCategory:
+    return BMI_CATEGORIES[bisect.bisect_right(BMI_BOUNDARIES, bmi)]
+
+
+def bmi_segments(bmis: Sequence[float]) -> Tuple[BmiSegment, ...]:
+    """
+    Splits a BMI series into runs of one BMI category.
+
+    Plan timelines are monotonic (both models), so every category change
+    is found by bisecting for the day a boundary is crossed: O(categories
+    * log days) lookups instead of a scan, which also keeps lazy series
+    lazy. Categories the series skips within one day get no segment.
+    """
+    last_day = len(bmis) - 1
+    first = BMI_CATEGORIES.index(bmi_category(bmis[0]))
+    final = BMI_CATEGORIES.index(bmi_category(bmis[last_day]))
+    step = 1 if final >= first else -1
+
+    segments = []
+    start = 0
+    for index in range(first, final, step):
+        if step > 0:
+            boundary = BMI_BOUNDARIES[index]
+            def crossed(day): return bmis[day] >= boundary
+        else:
+            boundary = BMI_BOUNDARIES[index - 1]
+            def crossed(day): return bmis[day] < boundary
+
+        days = range(start, last_day + 1)
+        change = start + bisect.bisect_left(days, True, key=crossed)
+        if change > start:
+            segments.append(BmiSegment(start, change - 1, BMI_CATEGORIES[index]))
+        start = change
+
+    segments.append(BmiSegment(start, last_day, BMI_CATEGORIES[final]))
+    return tuple(segments)
+
+
+# ------------------------------------------------------------------
+# PYTHON ENGINE (reference implementation)
+# ------------------------------------------------------------------
+
+def build_timeline_python(
+    start_weight: float,
+    daily_change: float,
+    height_cm: float,
+    total_days: int,
+) -> Timeline:
+    """
+    Builds the daily weight and BMI series one day at a time.
+
+    This is the reference engine: every other engine must return
+    exactly the same values.
+    """
+    weights: List[float] = []
+    bmis: List[float] = []
+
+    for day in range(total_days + 1):
+        current_weight = start_weight + daily_change * day
+        current_weight = round(current_weight, 2)
+
+        weights.append(current_weight)
+        bmis.append(calculate_bmi(current_weight, height_cm))
+
+    return weights, bmis
+
+
+# ------------------------------------------------------------------
+# NUMPY ENGINE
+# ------------------------------------------------------------------
+
+def round_array(values, ndigits: int = 2):
+    """
+    Rounds a float64 array exactly like the built-in round().
+
+    round() rounds the exact binary value of each float, whereas
+    rint(x * 10**n) rounds the already-rounded product. The two only
+    disagree when the product lands next to a .5 tie, so those few
+    elements are re-rounded with round() itself.
+    """
+    import numpy as np
+
+    scale = 10.0 ** ndigits
+    scaled = values * scale
+    rounded = np.rint(scaled) / scale
+
+    distance_to_tie = np.abs(scaled - np.floor(scaled) - 0.5)
+    for index in np.flatnonzero(distance_to_tie < 1e-6):
+        rounded[index] = round(float(values[index]), ndigits)
+
+    return rounded
+
+
+def build_timeline_arrays(
+    start_weight: float,
+    daily_change: float,
+    height_cm: float,
+    total_days: int,
+):
+    """
+    Builds the weight and BMI series as float64 arrays in one pass.
+    """
+    import numpy as np
+
+    days = np.arange(total_days + 1, dtype=np.float64)
+    weights = round_array(start_weight + daily_change * days)
+
+    height_m = height_cm / 100
+    bmis = round_array(weights / (height_m ** 2))
+
+    return weights, bmis
+
+
+def build_timeline_numpy(
+    start_weight: float,
+    daily_change: float,
+    height_cm: float,
+    total_days: int,
+) -> Timeline:
+    """
+    Vectorized engine, returning the same lists as the Python engine.
+    """
+    weights, bmis = build_timeline_arrays(
+        start_weight, daily_change, height_cm, total_days
+    )
+    return weights.tolist(), bmis.tolist()
+
+
+# ------------------------------------------------------------------
+# LAZY ENGINE
+# ------------------------------------------------------------------
+
+class _LazySeries(Sequence):
+    """
+    Read-only sequence whose items are computed from the day index.
+
+    The days are held as a range, so slicing returns another lazy view
+    and memory stays O(1) whatever the plan length.
+    """
+
+    def __init__(self, days: range):
+        self._days = days
+
+    @abc.abstractmethod
+    def _value(self, day: int) -> float:
+        """
+        The item of the given day.
+        """
+
+    @abc.abstractmethod
+    def _view(self, days: range) -> "_LazySeries":
+        """
+        The same series over other days (a slice of self._days).
+        """
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self._view(self._days[index])
+        return self._value(self._days[index])
+
+    def __iter__(self) -> Iterator[float]:
+        return map(self._value, self._days)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, tuple, _LazySeries)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        if len(self) <= 6:
+            values = ", ".join(map(str, self))
+        else:
+            head = ", ".join(map(str, self[:3]))
+            values = f"{head}, ..., {self[-1]}"
+        return f"{type(self).__name__}([{values}], len={len(self)})"
+
+
+class WeightSeries(_LazySeries):
+    """
+    Daily weights of a linear plan: round(start + daily_change * day, 2).
+    """
+
+    def __init__(self, start_weight: float, daily_change: float, days: range):
+        super().__init__(days)
+        self.start_weight = start_weight
+        self.daily_change = daily_change
+
+    def _value(self, day: int) -> float:
+        return round(self.start_weight + self.daily_change * day, 2)
+
+    def _view(self, days: range) -> "WeightSeries":
+        return WeightSeries(self.start_weight, self.daily_change, days)
+
+
+class BmiSeries(_LazySeries):
+    """
+    Daily BMIs derived from a WeightSeries and a height.
+    """
+
+    def __init__(self, weights: WeightSeries, height_cm: float):
+        super().__init__(weights._days)
+        self.weights = weights
+        self.height_cm = height_cm
+
+    def _value(self, day: int) -> float:
+        return calculate_bmi(self.weights._value(day), self.height_cm)
+
+    def _view(self, days: range) -> "BmiSeries":
+        return BmiSeries(self.weights._view(days), self.height_cm)
+
+
+def build_timeline_lazy(
+    start_weight: float,
+    daily_change: float,
+    height_cm: float,
+    total_days: int,
+) -> Timeline:
+    """
+    Lazy engine: O(1) memory series computing each day on access.
+    """
+    weights = WeightSeries(start_weight, daily_change, range(total_days + 1))
+    return weights, BmiSeries(weights, height_cm)
+
+
+# ------------------------------------------------------------------
+# INCREMENTAL UPDATES
+# ------------------------------------------------------------------
+
+class PrefixedSeries(Sequence):
+    """
+    Read-only series made of the first known values of a shared base
+    series followed by newly computed values.
+
+    Lets recalculate() reuse a previous timeline without copying it;
+    the base is kept alive as long as the series. Prefixes of prefixed
+    series share the original base instead of nesting.
+    """
+
+    def __init__(self, base: Sequence[float], known: int, tail: List[float]):
+        if isinstance(base, PrefixedSeries):
+            if known > base.known:
+                tail = base.tail[:known - base.known] + tail
+            known = min(known, base.known)
+            base = base.base
+        self.base = base
+        self.known = known
+        self.tail = tail
+
+    def __len__(self) -> int:
+        return self.known + len(self.tail)
+
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return list(self)[index]
+            head = list(self.base[start:min(stop, self.known)])
+            return head + self.tail[max(start - self.known, 0):max(stop - self.known, 0)]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("series index out of range")
+        if index < self.known:
+            return self.base[index]
+        return self.tail[index - self.known]
+
+    def __iter__(self) -> Iterator[float]:
+        return itertools.chain(itertools.islice(self.base, self.known), self.tail)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, tuple, PrefixedSeries, _LazySeries)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            a == b for a, b in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return f"PrefixedSeries(known={self.known}, new={len(self.tail)})"
+
+
+def _with_tail(known_values: Sequence[float], known: int, tail: List[float]):
+    if not tail and known == len(known_values):
+        return known_values
+    if known == 0:
+        return tail
+    return PrefixedSeries(known_values, known, tail)
+
+
+def extend_weights(
+    weights: Sequence[float],
+    start_weight: float,
+    daily_change: float,
+    total_days: int,
+) -> Sequence[float]:
+    """
+    Daily weights of a linear plan of total_days, given the weights of a
+    plan with the same start weight and daily change: known days are
+    shared and only the days past them are computed.
+    """
+    known = min(len(weights), total_days + 1)
+
+    if HAS_NUMPY:
+        import numpy as np
+
+        days = np.arange(known, total_days + 1, dtype=np.float64)
+        tail = round_array(start_weight + daily_change * days).tolist()
+    else:
+        tail = [
+            round(start_weight + daily_change * day, 2)
+            for day in range(known, total_days + 1)
+        ]
+    return _with_tail(weights, known, tail)
+
+
+def rescale_bmis(
+    weights: Sequence[float],
+    height_cm: float,
+    known: Sequence[float] = (),
+) -> Sequence[float]:
+    """
+    BMI series of weights at height_cm. known holds BMIs already
+    computed at that height for the first days, which are shared.
+    """
+    reused = min(len(known), len(weights))
+    rest = weights[reused:]
+
+    if HAS_NUMPY:
+        import numpy as np
+
+        rest = np.fromiter(rest, dtype=np.float64, count=len(rest))
+        tail = round_array(rest / ((height_cm / 100) ** 2)).tolist()
+    else:
+        tail = [calculate_bmi(w, height_cm) for w in rest]
+    return _with_tail(known, reused, tail)
+
+
+# ------------------------------------------------------------------
+# ENGINE SELECTION
+# ------------------------------------------------------------------
+
+ENGINES: Dict[str, TimelineEngine] = {
+    "python": build_timeline_python,
+    "numpy": build_timeline_numpy,
+    "lazy": build_timeline_lazy,
+}
+
+
+def get_engine(name: str) -> TimelineEngine:
+    """
+    Returns the timeline engine registered under name.
+
+    "auto" selects the NumPy engine when NumPy is installed and falls
+    back to the Python engine otherwise.
+    """
+    if name == "auto":
+        name = "numpy" if HAS_NUMPY else "python"
+
+    if name not in ENGINES:
+        choices = ", ".join(["auto", *ENGINES])
+        raise ValueError(f"Unknown engine '{name}'. Choose one of: {choices}.")
+
+    if name == "numpy" and not HAS_NUMPY:
+        raise ImportError(
+            "The 'numpy' engine requires NumPy (pip install numpy)."
+        )
+
+    return ENGINES[name]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any
+from typing import Any, Iterable, List, Optional
 
 
 DATE_FORMAT = "%d-%m-%Y"
@@ -24,9 +24,10 @@ def to_float(value: Any, field_name: str) -> float:
     """
     Converts value to float or raises a clear ValueError.
     """
-    if not is_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
         raise ValueError(f"{field_name} must be a valid number.")
-    return float(value)
 
 
 def validate_positive(value: Any, field_name: str) -> float:
@@ -48,6 +49,8 @@ def validate_gender(value: str) -> str:
     Validates gender string input.
     Returns normalized lowercase value.
     """
+    if value is not None and not isinstance(value, str):
+        raise ValueError("Gender must be 'male' or 'female'.")
     gender = (value or "").strip().lower()
     if gender not in ("male", "female"):
         raise ValueError("Gender must be 'male' or 'female'.")
@@ -58,18 +61,94 @@ def validate_gender(value: str) -> str:
 # DATE HELPERS
 # ------------------------------------------------------------------
 
+def _parse_dmy(date_str: str) -> datetime:
+    """
+    DD-MM-YYYY parser. Zero-padded strings are sliced directly; anything
+    else (e.g. "1-2-2024") goes through strptime so the accepted inputs
+    are exactly those of strptime(date_str, DATE_FORMAT).
+    """
+    if (
+        isinstance(date_str, str)
+        and len(date_str) == 10
+        and date_str[2] == "-"
+        and date_str[5] == "-"
+        and date_str.isascii()
+    ):
+        day, month, year = date_str[:2], date_str[3:5], date_str[6:]
+        if day.isdigit() and month.isdigit() and year.isdigit():
+            return datetime(int(year), int(month), int(day))
+    return datetime.strptime(date_str, DATE_FORMAT)
+
+
+def _parse_iso(date_str: str) -> datetime:
+    # fromisoformat also accepts week dates, times and offsets
+    if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+        raise ValueError(date_str)
+    return datetime.fromisoformat(date_str)
+
+
 def parse_date(date_str: str, field_name: str) -> datetime:
     """
     Parses a date string in DD-MM-YYYY format.
     """
     try:
-        return datetime.strptime(date_str, DATE_FORMAT)
+        return _parse_dmy(date_str)
     except (TypeError, ValueError):
         raise ValueError(
             f"{field_name} must be in DD-MM-YYYY format."
         )
 
 
+def parse_iso_date(date_str: str, field_name: str) -> datetime:
+    """
+    Parses a date string in ISO 8601 YYYY-MM-DD format.
+    """
+    try:
+        return _parse_iso(date_str)
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"{field_name} must be in YYYY-MM-DD format."
+        )
+
+
+def parse_dates(
+    values: Iterable[str],
+    field_name: str,
+    iso: bool = False,
+    errors: str = "raise",
+) -> List[Optional[datetime]]:
+    """
+    Parses a whole column of date strings (DD-MM-YYYY, or YYYY-MM-DD
+    when iso is True). Each distinct string is parsed once.
+
+    errors="raise" raises the parse_date error for the first invalid
+    value; errors="coerce" returns None in its place instead.
+    """
+    if errors not in ("raise", "coerce"):
+        raise ValueError("errors must be 'raise' or 'coerce'.")
+
+    parse, expected = (_parse_iso, "YYYY-MM-DD") if iso else (_parse_dmy, "DD-MM-YYYY")
+
+    cache = {}
+    dates = []
+    for value in values:
+        try:
+            date = cache[value]
+        except KeyError:
+            try:
+                date = parse(value)
+            except (TypeError, ValueError):
+                date = None
+            cache[value] = date
+        except TypeError:  # unhashable value
+            date = None
+
+        if date is None and errors == "raise":
+            raise ValueError(f"{field_name} must be in {expected} format.")
+        dates.append(date)
+    return dates
+
+
 def format_date(date_obj: datetime) -> str:
     """
     Formats datetime to DD-MM-YYYY string.
@@ -77,6 +156,18 @@ def format_date(date_obj: datetime) -> str:
     return date_obj.strftime(DATE_FORMAT)
 
 
+def format_bmi_segments(segments) -> str:
+    """
+    One-line summary of BMI segments, e.g.
+    "Obese (days 0-51) → Overweight (days 52-365)".
+    """
+    return " → ".join(
+        f"{segment.category.value.capitalize()} "
+        f"(days {segment.start_day}-{segment.end_day})"
+        for segment in segments
+    )
+
+
 def validate_date_range(start: datetime, end: datetime) -> None:
     """
     Ensures end date is after start date.
@@ -0,0 +1,116 @@
+import pytest
+from dataclasses import replace
+from datetime import datetime
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, RowError, WeightChangeInput
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.fixture
+def calculator():
+    return WeightChangeCalculator()
+
+
+def make_input(start_weight=80, end_weight=75, height_cm=170,
+               end_date=datetime(2024, 2, 1)):
+    return WeightChangeInput(
+        start_weight=start_weight,
+        end_weight=end_weight,
+        height_cm=height_cm,
+        gender=Gender.FEMALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=end_date,
+    )
+
+
+### HAPPY PATH ###
+
+def test_batch_rows_match_single_calculation(calculator):
+    inputs = [
+        make_input(),
+        make_input(70, 75, 175, datetime(2024, 1, 11)),
+        make_input(95.5, 68.25, 162.5, datetime(2026, 6, 30)),
+    ]
+
+    batch = calculator.calculate_many(inputs)
+
+    assert len(batch) == 3
+    assert batch.errors == []
+    for row, data in enumerate(inputs):
+        assert batch.result(row) == calculator.calculate(data)
+
+
+def test_batch_shares_timeline_buffers(calculator):
+    batch = calculator.calculate_many([make_input(), make_input()])
+
+    assert batch.offsets.tolist() == [0, 32, 64]
+    assert len(batch.weights) == len(batch.bmis) == 64
+
+    weights, bmis = batch.timeline(1)
+    assert weights[0] == 80 and weights[-1] == 75
+    assert bmis[0] == batch.bmi_start[1]
+
+
+def test_columnar_input(calculator):
+    batch = calculator.calculate_many({
+        "start_weight": ["80", 70],
+        "end_weight": [75, "75"],
+        "height_cm": [170, 175],
+        "gender": ["female", Gender.MALE],
+        "start_date": [datetime(2024, 1, 1)] * 2,
+        "end_date": [datetime(2024, 2, 1), datetime(2024, 1, 11)],
+    })
+
+    assert batch.valid.tolist() == [True, True]
+    assert batch.days.tolist() == [31, 10]
+    assert batch.weight_difference.tolist() == [-5, 5]
+
+
+### INVALID ROWS ###
+
+def test_invalid_rows_do_not_abort_batch(calculator):
+    inputs = [
+        make_input(start_weight=-70),
+        make_input(),
+        make_input(height_cm="abc"),
+        make_input(end_date=datetime(2024, 1, 1)),
+    ]
+
+    batch = calculator.calculate_many(inputs)
+
+    assert batch.valid.tolist() == [False, True, False, False]
+    assert [(e.row, e.field) for e in batch.errors] == [
+        (0, "start_weight"),
+        (2, "height_cm"),
+        (3, "end_date"),
+    ]
+    assert batch.errors[0].message == "Start weight must be greater than zero."
+    assert batch.errors[1].message == "Height must be a valid number."
+    assert batch.offsets.tolist() == [0, 0, 32, 32, 32]
+
+    with pytest.raises(ValueError, match="End date"):
+        batch.result(3)
+
+
+@pytest.mark.parametrize("model", ["linear", "energy"])
+def test_bad_gender_matches_single_calculation(model):
+    calculator = WeightChangeCalculator(model=model)
+    data = replace(make_input(), gender="other")
+
+    batch = calculator.calculate_many([data, make_input()])
+
+    if model == "linear":  # gender is not used, as in calculate()
+        assert batch.errors == []
+        assert batch.result(0) == calculator.calculate(data)
+    else:
+        with pytest.raises(ValueError) as error:
+            calculator.calculate(data)
+        assert batch.errors == [RowError(0, "gender", str(error.value))]
+    assert batch.result(1) == calculator.calculate(make_input())
+
+
+def test_missing_column_raises_error(calculator):
+    with pytest.raises(ValueError, match="Missing input columns"):
+        calculator.calculate_many({"start_weight": [80]})
@@ -0,0 +1,48 @@
+import json
+
+from benchmarks import suite
+
+
+### COMPARE ###
+
+def test_compare_flags_slowdowns_beyond_threshold():
+    baseline = {"a": 1.0, "b": 1.0, "c": 1.0, "gone": 1.0}
+    current = {"a": 1.05, "b": 1.2, "c": 0.5, "added": 1.0}
+
+    statuses = {c.name: c.status for c in suite.compare(baseline, current, 0.10)}
+
+    assert statuses == {
+        "a": "ok",
+        "b": "regression",
+        "c": "improvement",
+        "added": "new",
+        "gone": "missing",
+    }
+
+
+def test_compare_command_exit_status(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    current = tmp_path / "current.json"
+    baseline.write_text(json.dumps({"results": {"calculate/x": 1e-3}}))
+
+    current.write_text(json.dumps({"results": {"calculate/x": 1.05e-3}}))
+    assert suite.main(["compare", str(baseline), str(current)]) == 0
+
+    current.write_text(json.dumps({"results": {"calculate/x": 2e-3}}))
+    assert suite.main(["compare", str(baseline), str(current)]) == 1
+    assert "regression" in capsys.readouterr().out
+
+
+### RUN ###
+
+def test_run_writes_machine_readable_results(tmp_path, monkeypatch):
+    monkeypatch.setattr(suite, "PLAN_LENGTHS", (7,))
+    output = tmp_path / "results.json"
+
+    assert suite.main(["run", "--group", "calculate", "--repeat", "1",
+                       "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())
+    assert "calculate/python/7" in report["results"]
+    assert report["results"]["calculate/python/7"] > 0
+    assert report["meta"]["repeat"] == 1
@@ -0,0 +1,103 @@
+import pytest
+from dataclasses import replace
+from datetime import datetime
+
+from core.cache import CachingCalculator, timeline_bytes
+from core.calculator import WeightChangeCalculator
+from core.data_models import WeightChangeInput, Gender
+from core.timeline import PrefixedSeries
+
+
+def make_input(start_weight=80):
+    return WeightChangeInput(
+        start_weight=start_weight,
+        end_weight=75,
+        height_cm=170,
+        gender=Gender.FEMALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 2, 1),
+    )
+
+
+@pytest.fixture
+def calculator():
+    return CachingCalculator(max_entries=2, max_bytes=None)
+
+
+### HITS & MISSES ###
+
+def test_repeated_query_is_served_from_cache(calculator):
+    first = calculator.calculate(make_input(80))
+    second = calculator.calculate(make_input("80"))  # same plan, normalized
+
+    stats = calculator.stats()
+    assert second is first
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert first == WeightChangeCalculator().calculate(make_input(80))
+
+
+def test_recalculate_is_cached(calculator):
+    previous = calculator.calculate(make_input(80))
+    longer = replace(make_input(80), end_weight=70, end_date=datetime(2024, 3, 3))
+
+    first = calculator.recalculate(previous, longer)
+    assert calculator.recalculate(previous, longer) is first
+    assert calculator.calculate(longer) is first
+    assert first == WeightChangeCalculator().calculate(longer)
+
+
+def test_invalid_input_raises_usual_error(calculator):
+    with pytest.raises(ValueError, match="Start weight must be a valid number"):
+        calculator.calculate(make_input("abc"))
+
+    assert calculator.stats().entries == 0
+
+
+### EVICTION ###
+
+def test_least_recently_used_entry_is_evicted(calculator):
+    calculator.calculate(make_input(80))
+    calculator.calculate(make_input(81))
+    calculator.calculate(make_input(80))  # 80 becomes most recent
+    calculator.calculate(make_input(82))  # evicts 81
+
+    calculator.calculate(make_input(80))
+    stats = calculator.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (2, 3, 1)
+
+    calculator.calculate(make_input(81))
+    assert calculator.stats().misses == 4
+
+
+def test_byte_budget_bounds_timeline_memory():
+    one = WeightChangeCalculator().calculate(make_input(80))
+    calculator = CachingCalculator(max_entries=None,
+                                   max_bytes=int(timeline_bytes(one) * 2.5))
+
+    for start_weight in range(80, 90):
+        calculator.calculate(make_input(start_weight))
+
+    stats = calculator.stats()
+    assert stats.entries == 2
+    assert stats.evictions == 8
+    assert stats.timeline_bytes <= calculator.max_bytes
+
+
+def test_shared_timeline_base_is_counted_once_while_held():
+    calculator = CachingCalculator(max_entries=2, max_bytes=None)
+    previous = calculator.calculate(make_input(80))
+    longer = replace(make_input(80), end_weight=70, end_date=datetime(2024, 3, 3))
+
+    # both cached: the previous timeline is the extended result's base,
+    # counted once
+    extended = calculator.recalculate(previous, longer)
+    assert isinstance(extended.weights, PrefixedSeries)
+    assert extended.weights.base is previous.weights
+    assert calculator.stats().timeline_bytes == timeline_bytes(extended)
+    assert timeline_bytes(extended) < timeline_bytes(previous) * 2
+
+    # once the previous result is evicted, the base still counts
+    other = calculator.calculate(make_input(90))
+    assert calculator.calculate(longer) is extended
+    assert calculator.stats().evictions == 1
+    assert calculator.stats().timeline_bytes == timeline_bytes(extended) + timeline_bytes(other)
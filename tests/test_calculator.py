@@ -1,8 +1,10 @@
 import pytest
-from datetime import datetime
+from dataclasses import replace
+from datetime import datetime, timedelta
 
 from core.calculator import WeightChangeCalculator
 from core.data_models import WeightChangeInput, Gender
+from core.timeline import PrefixedSeries
 
 @pytest.fixture
 def calculator():
@@ -86,6 +88,86 @@ def test_negative_weight_raises_error(calculator):
     with pytest.raises(ValueError, match="weight"):
         calculator.calculate(data)
 
+def test_prevalidated_skips_validation(calculator):
+    data = WeightChangeInput(
+        start_weight=80.0,
+        end_weight=75.0,
+        height_cm=170.0,
+        gender=Gender.FEMALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 2, 1),
+    )
+
+    assert calculator.calculate(data, prevalidated=True) == calculator.calculate(data)
+
+    # the day count is still checked, it is needed for the daily change
+    same_day = WeightChangeInput(80.0, 75.0, 170.0, Gender.FEMALE,
+                                 datetime(2024, 1, 1), datetime(2024, 1, 1))
+    with pytest.raises(ValueError, match="at least 1 day"):
+        calculator.calculate(same_day, prevalidated=True)
+
+### INCREMENTAL UPDATES ###
+
+def plan(end_weight=80.0, days=200, height_cm=180.0, gender=Gender.MALE):
+    return WeightChangeInput(
+        start_weight=100.0,
+        end_weight=end_weight,
+        height_cm=height_cm,
+        gender=gender,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 1, 1) + timedelta(days=days),
+    )
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy", "lazy"])
+@pytest.mark.parametrize("model", ["linear", "energy"])
+@pytest.mark.parametrize("change", [
+    dict(end_weight=70.0, days=300),  # longer plan, same pace
+    dict(end_weight=90.0, days=100),  # shorter plan, same pace
+    dict(days=250),                   # new end date
+    dict(end_weight=78.5),            # new target
+    dict(height_cm=165.0),
+    dict(gender=Gender.FEMALE),
+    dict(end_weight=70.0, days=300, height_cm=165.0),
+])
+def test_recalculate_equals_calculate(engine, model, change):
+    calculator = WeightChangeCalculator(engine=engine, model=model)
+    previous = calculator.calculate(plan())
+
+    data = plan(**change)
+    assert calculator.recalculate(previous, data) == calculator.calculate(data)
+
+
+def test_recalculate_only_computes_new_days(calculator):
+    previous = calculator.calculate(plan())
+
+    longer = calculator.recalculate(previous, plan(end_weight=70.0, days=300))
+    assert isinstance(longer.weights, PrefixedSeries)
+    assert longer.weights.base is previous.weights
+    assert (longer.weights.known, len(longer.weights.tail)) == (201, 100)
+
+    # a further extension shares the same base instead of nesting
+    longest = calculator.recalculate(longer, plan(end_weight=60.0, days=400))
+    assert longest.weights.base is previous.weights
+    assert longest.weights[-1] == 60.0
+
+
+def test_recalculate_height_only_rescales_bmis(calculator):
+    previous = calculator.calculate(plan())
+
+    result = calculator.recalculate(previous, plan(height_cm=165.0))
+
+    assert result.weights is previous.weights
+    assert result.bmis != previous.bmis
+    assert result.bmi_start == round(100 / 1.65 ** 2, 2)
+
+
+def test_recalculate_validates_input(calculator):
+    previous = calculator.calculate(plan())
+
+    with pytest.raises(ValueError, match="End weight"):
+        calculator.recalculate(previous, replace(plan(), end_weight=-1))
+
 ### SMOKE TEST ###
 
 def test_result_type(calculator):
@@ -0,0 +1,366 @@
+import gc
+import threading
+import tracemalloc
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from matplotlib.backend_bases import MouseEvent  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+from matplotlib.figure import Figure  # noqa: E402
+
+from core.calculator import WeightChangeCalculator  # noqa: E402
+from core.data_models import Gender, WeightChangeInput  # noqa: E402
+from core.timeline import build_timeline_python  # noqa: E402
+from ui.chart import (  # noqa: E402
+    ChartExporter,
+    DayHover,
+    FigurePool,
+    LodTrajectory,
+    PreviewChart,
+    WeightChart,
+    bmi_color,
+    draw_weight_line,
+    render_chart,
+    trajectory_segments,
+)
+
+
+@pytest.fixture
+def timeline():
+    # 120 kg → 60 kg at 170 cm crosses every BMI category
+    return build_timeline_python(120, -60 / 400, 170, 400)
+
+
+### TRAJECTORY ###
+
+def test_segment_colors_follow_bmi(timeline):
+    weights, bmis = timeline
+
+    segments, colors = trajectory_segments(weights, bmis)
+
+    assert segments.shape == (400, 2, 2)
+    assert colors.tolist() == [bmi_color(b) for b in bmis[:-1]]
+    assert segments[10].tolist() == [[10, weights[10]], [11, weights[11]]]
+
+
+def test_weight_line_is_a_single_artist(timeline):
+    fig = Figure()
+    ax = fig.add_subplot()
+
+    draw_weight_line(ax, *timeline)
+
+    assert len(ax.collections) == 1
+    assert len(ax.lines) == 0
+    assert ax.get_xlim()[0] < 0 < 400 < ax.get_xlim()[1]
+
+
+### LEVEL OF DETAIL ###
+
+def test_lod_keeps_category_changes_exact():
+    weights, bmis = build_timeline_python(120, -60 / 20000, 170, 20000)
+    ax = Figure(figsize=(7, 4.5)).add_subplot()
+
+    lod = LodTrajectory(ax, weights, bmis)
+    indices = lod.visible_indices(0, 20000, buckets=500)
+    segments = lod.line.get_segments()
+
+    assert len(indices) < 2100
+    assert indices[0] == 0 and indices[-1] == 20000
+    assert len(segments) == len(lod.visible_indices(*ax.get_xlim(),
+                                                    int(ax.bbox.width))) - 1
+    # every drawn segment is colored like the full-resolution segment
+    # starting on the same day, and never spans a category change
+    for start, stop in zip(indices[:-1], indices[1:]):
+        colors = {bmi_color(b) for b in bmis[start:stop]}
+        assert colors == {bmi_color(bmis[start])}
+
+
+def test_lod_recomputes_full_resolution_on_zoom():
+    weights, bmis = build_timeline_python(120, -60 / 20000, 170, 20000)
+    ax = Figure(figsize=(7, 4.5)).add_subplot()
+    lod = LodTrajectory(ax, weights, bmis)
+
+    ax.set_xlim(1000, 1100)
+
+    segments = lod.line.get_segments()
+    assert len(segments) == 100
+    assert segments[0].tolist() == [[1000, weights[1000]], [1001, weights[1001]]]
+
+
+### LIVE PREVIEW ###
+
+def preview_plan(end_weight=80.0, days=365, height_cm=180.0):
+    return WeightChangeCalculator().calculate(WeightChangeInput(
+        start_weight=100.0,
+        end_weight=end_weight,
+        height_cm=height_cm,
+        gender=Gender.MALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 1, 1) + timedelta(days=days),
+    ))
+
+
+def test_preview_updates_artists_in_place():
+    preview = PreviewChart()
+    FigureCanvasAgg(preview.figure)
+    preview.show(preview_plan())
+    line, bands = preview.trajectory.line, list(preview.bands)
+
+    preview.show(preview_plan(end_weight=60.0, days=730, height_cm=165.0))
+    preview.figure.canvas.draw()
+
+    assert preview.trajectory.line is line
+    assert preview.bands == bands
+    assert len(preview.ax.collections) == 1 and len(preview.ax.patches) == 4
+    assert preview.ax.get_xlim() == (0, 730)
+    assert preview.ax.get_ylim()[0] < 60 < 100 < preview.ax.get_ylim()[1]
+
+    segments = line.get_segments()
+    assert segments[0][0].tolist() == [0, 100]
+    assert segments[-1][1].tolist() == [730, 60]
+    # normal band starts at BMI 18.5 for the new height
+    assert preview.bands[1].get_y() == pytest.approx(18.5 * 1.65 ** 2)
+
+
+def test_preview_colors_follow_new_plan():
+    preview = PreviewChart()
+    preview.show(preview_plan(end_weight=95.0))  # stays Obese
+    preview.show(preview_plan(end_weight=60.0, height_cm=200.0))  # BMI 25 -> 15
+
+    colors = {tuple(c) for c in preview.trajectory.line.get_colors()}
+    assert len(colors) == 3
+
+
+### HOVER ###
+
+def test_hover_maps_cursor_to_day(timeline):
+    weights, bmis = timeline
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    draw_weight_line(ax, weights, bmis)
+    hover = DayHover(ax, weights, bmis)
+    fig.canvas.draw()
+
+    x, y = ax.transData.transform((123.4, weights[123]))
+    fig.canvas.callbacks.process(
+        "motion_notify_event",
+        MouseEvent("motion_notify_event", fig.canvas, x, y),
+    )
+
+    assert hover.day == 123
+    assert hover.annotation.get_text() == (
+        f"Day 123\nWeight: {weights[123]:.1f} kg\n"
+        f"BMI: {bmis[123]:.1f} (Obese)"
+    )
+    assert hover.day_at(-3) is None
+    assert hover.day_at(400.4) == 400
+
+
+### RESULTS CHART ###
+
+def test_weight_chart_prerenders_on_worker_thread():
+    result = WeightChangeCalculator().calculate(WeightChangeInput(
+        start_weight=80,
+        end_weight=75,
+        height_cm=170,
+        gender=Gender.FEMALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2029, 1, 1),
+    ))
+    charts = []
+
+    def build():
+        chart = WeightChart(result)
+        chart.prerender()
+        charts.append(chart)
+
+    worker = threading.Thread(target=build)
+    worker.start()
+    worker.join()
+
+    chart = charts[0]
+    assert chart.figure.canvas.get_renderer() is not None
+    assert len(chart.ax.collections) == 1
+
+
+### FIGURE LIFECYCLE ###
+
+def test_reused_chart_matches_new_chart():
+    chart = WeightChart(preview_plan())
+    chart.ax.set_xlim(10, 20)  # zoomed in the previous window
+    chart.figure.set_size_inches(9, 8)
+
+    result = preview_plan(end_weight=60.0, days=730, height_cm=165.0)
+    chart.show(result)
+    new = WeightChart(result)
+
+    assert chart.ax.get_xlim() == new.ax.get_xlim()
+    assert chart.ax.get_ylim() == pytest.approx(new.ax.get_ylim())
+    assert tuple(chart.figure.get_size_inches()) == WeightChart.FIGSIZE
+    assert len(chart.ax.patches) == 4 and len(chart.ax.collections) == 1
+    assert all(
+        (a == b).all()
+        for a, b in zip(chart.trajectory.line.get_segments(), new.trajectory.line.get_segments())
+    )
+
+
+def test_figure_pool_keeps_at_most_size_charts():
+    pool = FigurePool(size=1)
+    first, second = pool.acquire(preview_plan()), pool.acquire(preview_plan())
+    FigureCanvasAgg(first.figure)
+    canvas = first.figure.canvas
+
+    pool.release(first)
+    pool.release(second)
+
+    assert len(pool) == 1
+    assert first.figure.canvas is not canvas  # detached from the window canvas
+    assert second.figure.axes == []           # not pooled: cleared
+    assert pool.acquire(preview_plan(days=30)) is first
+    assert len(pool) == 0
+
+
+class TkCanvasStandIn(FigureCanvasAgg):
+    """
+    FigureCanvasTkAgg without Tk. draw() is a no-op: rendering every
+    window would make the test slow, so it renders some with render().
+    """
+
+    def __init__(self, figure, master=None):
+        super().__init__(figure)
+        self.widget = SimpleNamespace(pack=lambda **options: None)
+
+    def get_tk_widget(self):
+        return self.widget
+
+    def draw(self):
+        pass
+
+    def render(self):
+        super().draw()
+
+
+def open_and_close_window(modules, result, render):
+    # the real ResultsWindow chart steps, on a window object without Tk
+    from ui.results_window import ResultsWindow
+
+    window = SimpleNamespace(result=result, chart=None)
+    with patch("ui.results_window.load_chart_modules", return_value=modules):
+        ResultsWindow._build_weight_chart(window, parent=None)
+        window.hover.show(5)
+        if render:
+            window.canvas.render()
+        ResultsWindow._release_chart(window)
+    assert window.chart is None and window.shown is None
+
+
+@pytest.mark.parametrize("pool_size", [0, 2])
+def test_closed_windows_leave_nothing_behind(pool_size):
+    pytest.importorskip("customtkinter")
+    import ui.chart
+
+    pool = FigurePool(pool_size)
+    modules = SimpleNamespace(
+        FigureCanvasTkAgg=TkCanvasStandIn,
+        NavigationToolbar2Tk=lambda canvas, parent: SimpleNamespace(update=lambda: None),
+        chart=ui.chart,
+        figure_pool=pool,
+    )
+    plans = [preview_plan(), preview_plan(60.0, 730, 165.0), preview_plan(90.0, 30)]
+
+    def open_windows(count):
+        for i in range(count):
+            open_and_close_window(modules, plans[i % 3], render=i % 20 == 0)
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+
+    tracemalloc.start()
+    try:
+        # warm-up under tracing: the pool's first charts, fonts, text layout
+        before = open_windows(20)
+        after = open_windows(200)
+    finally:
+        tracemalloc.stop()
+
+    # a figure left behind per window would add well over 100 KiB each
+    assert after - before < 64 * 1024
+    assert sum(isinstance(o, Figure) for o in gc.get_objects()) <= pool_size
+    # one window at a time: its chart is all the pool ever holds
+    assert len(pool) == min(pool_size, 1) and all(not c.ax.texts for c in pool._charts)
+
+
+def test_window_whose_ui_fails_still_releases_its_chart():
+    ctk = pytest.importorskip("customtkinter")
+    from ui.results_window import ResultsWindow
+
+    pool = FigurePool(2)
+    result = preview_plan()
+    chart = pool.acquire(result)
+
+    def fail(window):
+        raise RuntimeError("chart failed")
+
+    # Tk itself left out; Tk destroys the half-built window afterwards
+    with patch.object(ctk.CTkToplevel, "__init__", lambda window, master: None), \
+            patch.object(ctk.CTkToplevel, "destroy", lambda window: None), \
+            patch.multiple(ResultsWindow, _build_ui=fail,
+                           title=lambda window, text: None,
+                           geometry=lambda window, size: None,
+                           resizable=lambda window, width, height: None), \
+            patch("ui.results_window.load_chart_modules",
+                  return_value=SimpleNamespace(figure_pool=pool)):
+        window = ResultsWindow.__new__(ResultsWindow)
+        with pytest.raises(RuntimeError, match="chart failed"):
+            window.__init__(None, result, chart=chart)
+        window.destroy()
+
+    assert window.chart is None
+    assert pool.acquire(result) is chart
+
+
+### EXPORT ###
+
+@pytest.mark.parametrize("fmt, magic", [
+    ("png", b"\x89PNG"), ("svg", b"<?xml"), ("pdf", b"%PDF"),
+])
+def test_render_chart_formats(fmt, magic):
+    assert render_chart(preview_plan(days=90), fmt, dpi=50).startswith(magic)
+
+
+def test_render_chart_uses_dpi():
+    data = render_chart(preview_plan(days=90), "png", dpi=60)
+    width = int.from_bytes(data[16:20], "big")  # PNG IHDR
+
+    assert width == WeightChart.FIGSIZE[0] * 60
+
+
+def test_render_chart_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        render_chart(preview_plan(), "gif")
+
+
+def test_exporter_caches_unchanged_views(monkeypatch, tmp_path):
+    renders = []
+    monkeypatch.setattr(
+        "ui.chart.render_chart",
+        lambda result, fmt, dpi, xlim, ylim: renders.append((fmt, dpi, xlim)) or b"data",
+    )
+    exporter = ChartExporter(preview_plan(), max_entries=2)
+
+    exporter.export(tmp_path / "a.png", 150, (0, 365), (60, 110))
+    exporter.export(tmp_path / "b.png", 150, (0.0, 365.0), (60, 110))
+    exporter.export(tmp_path / "c.png", 150, (10, 20), (60, 110))  # zoomed
+    exporter.export(tmp_path / "d.pdf", 300)
+
+    assert renders == [("png", 150, (0, 365)), ("png", 150, (10, 20)), ("pdf", 300, None)]
+    assert (exporter.hits, exporter.misses) == (1, 3)
+    assert (tmp_path / "b.png").read_bytes() == b"data"
+
+    exporter.export(tmp_path / "e.png", 150, (0, 365), (60, 110))  # evicted
+    assert exporter.misses == 4
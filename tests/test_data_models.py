@@ -0,0 +1,49 @@
+import pytest
+from datetime import datetime
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import (
+    CompactWeightChangeResult,
+    WeightChangeInput,
+    Gender,
+)
+
+
+@pytest.fixture
+def result():
+    data = WeightChangeInput(
+        start_weight=112.4,
+        end_weight=78.9,
+        height_cm=181,
+        gender=Gender.MALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2025, 1, 1),
+    )
+    return WeightChangeCalculator(engine="python").calculate(data)
+
+
+### COMPACT RESULT ###
+
+def test_compact_result_round_trip(result):
+    compact = result.compact()
+
+    assert compact.weights.typecode == "d"
+    assert compact.to_result() == result
+    assert compact.is_weight_loss is True
+
+
+def test_compact_float32_round_trip_is_lossless(result):
+    compact = result.compact(float32=True)
+
+    assert compact.is_float32
+    assert compact.weights.itemsize == 4
+    assert compact.to_result() == result
+
+
+def test_compact_result_is_slotted_and_exposes_buffers(result):
+    compact = CompactWeightChangeResult.from_result(result)
+
+    assert not hasattr(compact, "__dict__")
+    view = memoryview(compact.bmis)
+    assert view.format == "d"
+    assert view.nbytes == 8 * (result.days + 1)
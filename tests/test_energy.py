@@ -0,0 +1,108 @@
+import pytest
+import random
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import WeightChangeInput, Gender
+from core.energy import DECAY, bmr, decay_power, required_intake, tdee
+
+
+def make_input(start_weight=100, end_weight=80, height_cm=180,
+               gender=Gender.MALE, days=365):
+    return WeightChangeInput(
+        start_weight=start_weight,
+        end_weight=end_weight,
+        height_cm=height_cm,
+        gender=gender,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 1, 1) + timedelta(days=days),
+    )
+
+
+def random_inputs(count, seed=0):
+    rng = random.Random(seed)
+    return [
+        make_input(
+            rng.uniform(50, 140), rng.uniform(50, 140), rng.uniform(150, 200),
+            rng.choice(list(Gender)), rng.randint(1, 1_500),
+        )
+        for _ in range(count)
+    ]
+
+
+### EXPENDITURE ###
+
+def test_mifflin_st_jeor():
+    assert bmr(80, 180, Gender.MALE, age=35) == 1755
+    assert bmr(80, 180, Gender.FEMALE, age=35) == 1589
+    assert tdee(80, 180, "male", age=35) == pytest.approx(1.4 * 1755)
+
+
+def test_decay_power_matches_pow():
+    for day in (0, 1, 2, 365, 36_500):
+        assert decay_power(day) == pytest.approx(DECAY ** day, rel=1e-12)
+
+
+### ENERGY MODEL ###
+
+def test_energy_plan_reaches_target_front_loaded():
+    result = WeightChangeCalculator(engine="python", model="energy").calculate(make_input())
+
+    weights = result.weights
+    assert weights[0] == 100 and weights[-1] == 80
+    assert result.daily_change == round(-20 / 365, 4)
+    # adaptation slows the loss: first half loses more than the second
+    assert weights[0] - weights[182] > weights[182] - weights[-1]
+    assert all(a >= b for a, b in zip(weights, weights[1:]))
+
+
+def test_energy_intake_depends_on_gender():
+    calculator = WeightChangeCalculator(model="energy")
+
+    male = calculator.calculate(make_input(gender=Gender.MALE))
+    female = calculator.calculate(make_input(gender=Gender.FEMALE))
+
+    assert male.weights == female.weights
+    assert male.energy_intake - female.energy_intake == pytest.approx(1.4 * 166, abs=0.1)
+    assert male.energy_intake == round(required_intake(100, 80, 180, Gender.MALE, 365), 1)
+    assert WeightChangeCalculator().calculate(make_input()).energy_intake is None
+
+
+def test_energy_model_validates_gender():
+    with pytest.raises(ValueError, match="Gender"):
+        WeightChangeCalculator(model="energy").calculate(make_input(gender="other"))
+
+
+def test_unknown_model():
+    with pytest.raises(ValueError, match="Unknown model"):
+        WeightChangeCalculator(model="quadratic")
+
+
+### ENGINES ###
+
+@pytest.mark.parametrize("engine", ["lazy", "numpy"])
+def test_engines_match_python_reference(engine):
+    if engine == "numpy":
+        pytest.importorskip("numpy")
+    reference = WeightChangeCalculator(engine="python", model="energy")
+    calculator = WeightChangeCalculator(engine=engine, model="energy")
+
+    for data in random_inputs(60):
+        expected = reference.calculate(data)
+        actual = calculator.calculate(data)
+        assert list(actual.weights) == expected.weights
+        assert list(actual.bmis) == expected.bmis
+        assert actual.energy_intake == expected.energy_intake
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+def test_batch_matches_single_calculation(engine):
+    pytest.importorskip("numpy")
+    inputs = random_inputs(80, seed=1) + [make_input(start_weight=-1)]
+    reference = WeightChangeCalculator(engine="python", model="energy")
+
+    batch = WeightChangeCalculator(engine=engine, model="energy").calculate_many(inputs)
+
+    assert [e.row for e in batch.errors] == [80]
+    for row, data in enumerate(inputs[:-1]):
+        assert batch.result(row) == reference.calculate(data)
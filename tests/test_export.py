@@ -0,0 +1,152 @@
+import csv
+import io
+import json
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import BmiCategory, Gender, RowError, WeightChangeInput
+from core.export import (
+    ParquetTimelineWriter,
+    TimelineWriter,
+    detect_export_format,
+    export_timeline,
+    iter_batch_timeline,
+    iter_timeline,
+)
+from core.plan_io import read_plans
+from core.timeline import bmi_category
+
+
+START = datetime(2024, 1, 1)
+
+
+def make_input(start_weight=100, end_weight=80, height_cm=180, days=200):
+    return WeightChangeInput(
+        start_weight=start_weight,
+        end_weight=end_weight,
+        height_cm=height_cm,
+        gender=Gender.MALE,
+        start_date=START,
+        end_date=START + timedelta(days=days),
+    )
+
+
+### ROWS ###
+
+@pytest.mark.parametrize("model", ["linear", "energy"])
+def test_iter_timeline_matches_calculator(model):
+    data = make_input()
+    result = WeightChangeCalculator(engine="python", model=model).calculate(data)
+    rows = list(iter_timeline(data, model, row=7))
+
+    assert len(rows) == result.days + 1
+    assert [r.weight for r in rows] == result.weights
+    assert [r.bmi for r in rows] == result.bmis
+    assert [r.category for r in rows] == [bmi_category(b) for b in result.bmis]
+    assert rows[0].row == 7
+    assert rows[-1].day == result.days
+    assert rows[-1].date == data.end_date
+
+
+def test_iter_timeline_validates_eagerly():
+    with pytest.raises(ValueError):
+        iter_timeline(make_input(start_weight=-1))
+
+
+def test_iter_batch_timeline_skips_rejected_rows():
+    text = (
+        "start_weight,end_weight,height_cm,gender,start_date,end_date\n"
+        "80,75,170,female,01-01-2024,08-01-2024\n"
+        "abc,75,170,female,01-01-2024,08-01-2024\n"
+        "80,75,170,female,08-01-2024,01-01-2024\n"
+        "90,85,180,male,01-01-2024,04-01-2024\n"
+    )
+    errors = []
+    rows = list(iter_batch_timeline(read_plans(io.StringIO(text), "csv"), on_error=errors.append))
+
+    assert [(r.row, r.day) for r in rows] == [(1, d) for d in range(8)] + [(4, d) for d in range(4)]
+    assert [(e.row, e.field) for e in errors] == [(2, "start_weight"), (3, "end_date")]
+    assert all(isinstance(e, RowError) for e in errors)
+
+
+### WRITERS ###
+
+def test_csv_and_jsonl_writers_agree(tmp_path):
+    data = make_input(days=30)
+    assert export_timeline(iter_timeline(data), tmp_path / "plan.csv") == 31
+    assert export_timeline(iter_timeline(data), tmp_path / "plan.jsonl") == 31
+
+    with open(tmp_path / "plan.csv", newline="", encoding="utf-8") as f:
+        from_csv = list(csv.DictReader(f))
+    with open(tmp_path / "plan.jsonl", encoding="utf-8") as f:
+        from_jsonl = [json.loads(line) for line in f]
+
+    assert from_jsonl[0] == {
+        "row": 0, "day": 0, "date": "01-01-2024",
+        "weight": 100.0, "bmi": 30.86, "category": "obese",
+    }
+    assert [r["date"] for r in from_csv] == [r["date"] for r in from_jsonl]
+    assert [float(r["weight"]) for r in from_csv] == [r["weight"] for r in from_jsonl]
+
+
+def test_timeline_writer_rejects_unknown_format():
+    with pytest.raises(ValueError):
+        TimelineWriter(io.StringIO(), "xml")
+    with pytest.raises(ValueError):
+        export_timeline([], "plan.csv", fmt="xml")
+
+
+def test_detect_export_format():
+    assert detect_export_format("out.parquet") == "parquet"
+    assert detect_export_format("out.ndjson") == "jsonl"
+    assert detect_export_format("out.txt") == "csv"
+
+
+def export_peak(path, days):
+    data = make_input(start_weight=1_000, end_weight=400, days=days)
+    tracemalloc.start()
+    count = export_timeline(iter_timeline(data), path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert count == days + 1
+    return peak
+
+
+@pytest.mark.parametrize("name", ["plan.csv", "plan.jsonl"])
+def test_export_memory_is_flat(tmp_path, name):
+    # materialized, the weights and BMIs of 100 years alone take ~2 MB
+    one_year = export_peak(tmp_path / name, 365)
+    hundred_years = export_peak(tmp_path / name, 36_500)
+
+    assert hundred_years < one_year + 16 * 1024
+    assert hundred_years < 512 * 1024
+
+
+def test_parquet_without_pyarrow(monkeypatch, tmp_path):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="pip install pyarrow"):
+        ParquetTimelineWriter(tmp_path / "plan.parquet")
+
+
+def test_parquet_round_trip(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    data = make_input(days=100)
+    path = tmp_path / "plan.parquet"
+
+    writer = ParquetTimelineWriter(path, batch_rows=16)
+    for row in iter_timeline(data):
+        writer.write(row)
+    writer.close()
+
+    table = pq.read_table(path)
+    result = WeightChangeCalculator().calculate(data)
+    assert table.num_rows == 101
+    assert pq.ParquetFile(path).num_row_groups == 7
+    assert table.column("weight").to_pylist() == result.weights
+    assert set(table.column("category").to_pylist()) == {
+        BmiCategory.OBESE.value, BmiCategory.OVERWEIGHT.value, BmiCategory.NORMAL.value,
+    }
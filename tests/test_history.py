@@ -0,0 +1,131 @@
+import pytest
+from datetime import date, datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import WeightChangeInput, Gender
+from core.history import HistoryStore
+
+
+def make_input(start_weight=80.0, end_weight=75.0):
+    return WeightChangeInput(
+        start_weight=start_weight,
+        end_weight=end_weight,
+        height_cm=170,
+        gender=Gender.FEMALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 2, 1),
+    )
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "history.json"
+
+
+@pytest.fixture
+def store(path):
+    return HistoryStore(path, recent_count=3)
+
+
+def save(store, data, saved_at=datetime(2024, 5, 1, 12)):
+    return store.append(data, WeightChangeCalculator().calculate(data), saved_at)
+
+
+### APPEND & RECENT ###
+
+def test_append_and_reopen(store, path):
+    for i in range(5):
+        save(store, make_input(80 + i))
+
+    reopened = HistoryStore(path, recent_count=3)
+
+    assert len(reopened) == 5
+    assert [e.id for e in reopened.entries] == [2, 3, 4]
+    assert reopened.entries[-1].input == make_input(84).normalized()
+    assert reopened.entries[-1].weight_difference == -9
+
+
+def test_recent_entries_track_appends(store):
+    for i in range(4):
+        save(store, make_input(80 + i))
+
+    assert [e.id for e in store.entries] == [1, 2, 3]
+    assert store.entries == store.recent()
+
+
+### LOOKUPS ###
+
+def test_find_by_key(store):
+    save(store, make_input(80))
+    save(store, make_input(90))
+    save(store, make_input(80.0))
+
+    key = make_input(80).plan_key
+    assert [e.id for e in store.find_by_key(key)] == [0, 2]
+    assert store.find_by_key("0" * 40) == []
+
+
+def test_find_by_date(store):
+    start = datetime(2024, 5, 1, 9)
+    for i in range(10):
+        save(store, make_input(70 + i), start + timedelta(days=i // 2))
+
+    assert [e.id for e in store.find_by_date(date(2024, 5, 2))] == [2, 3]
+    assert len(store.find_by_date(date(2024, 5, 2), date(2024, 5, 4))) == 6
+    assert store.find_by_date(date(2023, 1, 1)) == []
+
+
+### CRASH SAFETY ###
+
+def test_torn_log_tail_is_discarded(store, path):
+    save(store, make_input(80))
+    with open(path, "ab") as log:
+        log.write(b'{"id":1,"saved_at":"2024-05')
+
+    reopened = HistoryStore(path)
+
+    assert len(reopened) == 1
+    save(reopened, make_input(81))
+    assert [e.input.start_weight for e in HistoryStore(path).entries] == [80, 81]
+
+
+def test_unindexed_log_records_are_recovered(store, path):
+    save(store, make_input(80))
+    save(store, make_input(81))
+    index_path = path.with_suffix(".idx")
+    index_path.write_bytes(index_path.read_bytes()[:-5])  # crash mid-index
+
+    reopened = HistoryStore(path)
+
+    assert len(reopened) == 2
+    assert reopened.find_by_key(make_input(81).plan_key)[0].id == 1
+
+
+def test_corrupt_indexed_record_is_skipped(store, path):
+    for i in range(3):
+        save(store, make_input(80 + i))
+
+    # flip one byte inside the (already indexed) second record
+    lines = path.read_bytes().splitlines(keepends=True)
+    lines[1] = lines[1].replace(b'"days"', b'"dayz"')
+    path.write_bytes(b"".join(lines))
+
+    reopened = HistoryStore(path, recent_count=3)
+
+    assert [e.input.start_weight for e in reopened.entries] == [80, 82]
+    assert len(reopened) == 3
+
+
+def test_json_array_lines_are_corrupt_records(store, path):
+    for i in range(2):
+        save(store, make_input(80 + i))
+
+    # an indexed record and an unindexed tail that parse as JSON arrays
+    lines = path.read_bytes().splitlines(keepends=True)
+    lines[0] = b"[" + b" " * (len(lines[0]) - 3) + b"]\n"
+    path.write_bytes(b"".join(lines) + b"[]\n")
+
+    reopened = HistoryStore(path)
+
+    assert [e.input.start_weight for e in reopened.entries] == [81]
+    assert path.read_bytes().endswith(lines[1])  # tail cut by recovery
@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import pytest
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import WeightChangeInput, Gender
+
+np = pytest.importorskip("numpy")
+
+import core.parallel  # noqa: E402
+from core.parallel import ParallelCalculator  # noqa: E402
+
+
+def make_inputs(count):
+    start = datetime(2024, 1, 1)
+    return [
+        WeightChangeInput(
+            start_weight=-1 if i % 17 == 5 else 70 + i % 40,
+            end_weight=65 + i % 25,
+            height_cm=160 + i % 30,
+            gender=Gender.MALE if i % 2 else Gender.FEMALE,
+            start_date=start,
+            end_date=start + timedelta(days=1 + i % 90),
+        )
+        for i in range(count)
+    ]
+
+
+### ORDER & EQUIVALENCE ###
+
+def test_parallel_matches_serial_batch():
+    inputs = make_inputs(250)
+    expected = WeightChangeCalculator().calculate_many(inputs)
+
+    with ParallelCalculator(workers=2, chunk_size=40) as calculator:
+        actual = calculator.calculate_many(inputs)
+
+    assert actual.offsets.tolist() == expected.offsets.tolist()
+    assert np.array_equal(actual.weights, expected.weights)
+    assert np.array_equal(actual.bmis, expected.bmis)
+    assert actual.valid.tolist() == expected.valid.tolist()
+    assert actual.errors == expected.errors
+    assert actual.result(249) == expected.result(249)
+
+
+def test_small_batches_run_in_process():
+    with ParallelCalculator(workers=4, chunk_size=100) as calculator:
+        result = calculator.calculate_many(make_inputs(10))
+        assert calculator._pool is None
+
+    assert len(result) == 10
+
+
+def test_invalid_chunk_size_raises_error():
+    with pytest.raises(ValueError, match="Chunk size"):
+        ParallelCalculator(chunk_size=0)
+
+
+### SHARED MEMORY CLEANUP ###
+
+_calculate_chunk = core.parallel._calculate_chunk
+
+
+def failing_chunk(columns, engine, model):
+    # runs in a (forked) worker: the second chunk fails
+    if columns["height_cm"][0] == 199:
+        raise RuntimeError("chunk failed")
+    return _calculate_chunk(columns, engine, model)
+
+
+def shared_blocks():
+    return {name for name in os.listdir("/dev/shm") if name.startswith("psm_")}
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/dev/shm") or multiprocessing.get_start_method() != "fork",
+    reason="needs /dev/shm and forked workers",
+)
+def test_failed_chunk_releases_blocks_of_finished_chunks(monkeypatch):
+    monkeypatch.setattr(core.parallel, "_calculate_chunk", failing_chunk)
+    data = make_inputs(300)
+    data[100] = replace(data[100], height_cm=199)
+    before = shared_blocks()
+
+    with ParallelCalculator(workers=2, chunk_size=100) as calculator:
+        with pytest.raises(RuntimeError, match="chunk failed"):
+            calculator.calculate_many(data)
+
+    assert shared_blocks() == before
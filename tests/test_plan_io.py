@@ -0,0 +1,117 @@
+import io
+import itertools
+import json
+
+import pytest
+
+from core.data_models import RowError, WeightChangeInput
+from core.plan_io import PlanWriter, read_plans
+from ui.ui_batch import BatchUI
+
+
+CSV_INPUT = (
+    "start_weight,end_weight,height_cm,gender,start_date,end_date\n"
+    "80,75,170,female,01-01-2024,01-02-2024\n"
+    "abc,75,170,female,01-01-2024,01-02-2024\n"
+    "90,85,180,MALE,01-01-2024,15-01-2024\n"
+    "80,75,170,female,01-02-2024,01-01-2024\n"
+)
+
+
+def run_batch(text, input_format="csv", output_format="jsonl", detail="summary"):
+    output, errors = io.StringIO(), io.StringIO()
+    counts = BatchUI(
+        io.StringIO(text), output, errors,
+        input_format=input_format,
+        output_format=output_format,
+        detail=detail,
+    ).run()
+    return counts, output.getvalue(), errors.getvalue()
+
+
+### READING ###
+
+def test_read_plans_reports_bad_fields():
+    rows = list(read_plans(io.StringIO(CSV_INPUT), "csv"))
+
+    assert [row for row, _ in rows] == [1, 2, 3, 4]
+    assert isinstance(rows[0][1], WeightChangeInput)
+    assert rows[1][1] == RowError(2, "start_weight", "Start weight must be a valid number.")
+
+
+def test_read_plans_jsonl_with_invalid_lines():
+    text = (
+        '{"start_weight": 80, "end_weight": 75, "height_cm": 170, '
+        '"gender": "female", "start_date": "01-01-2024", "end_date": "01-02-2024"}\n'
+        "\n"
+        "not json\n"
+        "[1, 2]\n"
+    )
+
+    rows = list(read_plans(io.StringIO(text), "jsonl"))
+
+    assert isinstance(rows[0][1], WeightChangeInput)
+    assert [(e.row, e.field) for _, e in rows[1:]] == [(2, "record"), (3, "record")]
+
+
+def test_read_plans_is_lazy():
+    header = "start_weight,end_weight,height_cm,gender,start_date,end_date\n"
+    line = "80,75,170,female,01-01-2024,01-02-2024\n"
+    endless = itertools.chain([header], itertools.repeat(line))
+
+    first = list(itertools.islice(read_plans(endless, "csv"), 3))
+
+    assert [row for row, _ in first] == [1, 2, 3]
+
+
+### BATCH RUN ###
+
+def test_batch_run_streams_results_and_errors():
+    (written, rejected), output, errors = run_batch(CSV_INPUT)
+
+    assert (written, rejected) == (2, 2)
+    results = [json.loads(line) for line in output.splitlines()]
+    assert [r["row"] for r in results] == [1, 3]
+    assert results[0]["bmi_end"] == 25.95
+    assert [json.loads(line)["field"] for line in errors.splitlines()] == [
+        "start_weight",
+        "end_date",
+    ]
+
+
+def test_batch_run_continues_after_non_string_values():
+    valid = (
+        '{"start_weight": 80, "end_weight": 75, "height_cm": 170, '
+        '"gender": "female", "start_date": "01-01-2024", "end_date": "01-02-2024"}\n'
+    )
+    text = (
+        valid.replace('"female"', "1")
+        + valid.replace('"01-01-2024"', '["0", "1", "-", "0", "1", "-", "2", "0", "2", "4"]')
+        + valid
+    )
+
+    (written, rejected), output, errors = run_batch(text, input_format="jsonl")
+
+    assert (written, rejected) == (1, 2)
+    assert json.loads(output)["row"] == 3
+    assert [json.loads(line)["field"] for line in errors.splitlines()] == [
+        "gender",
+        "start_date",
+    ]
+
+
+def test_batch_detail_levels():
+    _, weekly, _ = run_batch(CSV_INPUT, output_format="csv", detail="weekly")
+    _, daily, _ = run_batch(CSV_INPUT, output_format="csv", detail="daily")
+
+    weekly_rows = weekly.splitlines()
+    assert weekly_rows[0] == "row,day,date,weight,bmi"
+    # plan 1: days 0, 7, 14, 21, 28 and 31; plan 3: days 0, 7 and 14
+    assert len(weekly_rows) == 1 + 6 + 3
+    assert weekly_rows[6] == "1,31,01-02-2024,75.0,25.95"
+    assert len(daily.splitlines()) == 1 + 32 + 15
+
+
+def test_plan_writer_rejects_unknown_detail():
+    with pytest.raises(ValueError, match="detail"):
+        PlanWriter(io.StringIO(), "csv", detail="hourly")
@@ -0,0 +1,201 @@
+import asyncio
+import json
+import threading
+
+from ui.ui_server import PlannerServer
+
+
+PLAN = {
+    "start_weight": 80,
+    "end_weight": 70,
+    "height_cm": 180,
+    "gender": "male",
+    "start_date": "01-01-2024",
+    "end_date": "01-03-2024",
+}
+
+
+def request(path, body=None, method="POST", headers=""):
+    payload = json.dumps(body).encode() if body is not None else b""
+    return (
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\n{headers}"
+        f"Content-Length: {len(payload)}\r\n\r\n"
+    ).encode() + payload
+
+
+async def read_response(reader):
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) != b"\r\n":
+        name, _, value = line.decode().partition(":")
+        headers[name.lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        chunks = []
+        while (size := int(await reader.readline(), 16)):
+            chunks.append(await reader.readexactly(size))
+            await reader.readline()
+        await reader.readline()
+        return status, headers, b"".join(chunks)
+    return status, headers, await reader.readexactly(int(headers["content-length"]))
+
+
+def run(scenario, **options):
+    async def main():
+        server = PlannerServer(port=0, **options)
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        try:
+            return await scenario(server, reader, writer)
+        finally:
+            writer.close()
+            await server.close()
+
+    return asyncio.run(main())
+
+
+### REQUESTS ###
+
+def test_plan_summary():
+    async def scenario(server, reader, writer):
+        writer.write(request("/plan", PLAN))
+        return await read_response(reader)
+
+    status, headers, body = run(scenario)
+    summary = json.loads(body)
+
+    assert status == 200
+    assert headers["connection"] == "keep-alive"
+    assert summary["days"] == 60
+    assert summary["weight_difference"] == -10
+    assert summary["end_date"] == "01-03-2024"
+    assert summary["bmi_segments"] == [{
+        "start_day": 0, "end_day": 60,
+        "start_date": "01-01-2024", "end_date": "01-03-2024",
+        "category": "normal",
+    }]
+
+
+def test_invalid_plan_reports_field():
+    async def scenario(server, reader, writer):
+        writer.write(request("/plan", {**PLAN, "height_cm": "abc"}))
+        return await read_response(reader)
+
+    status, _, body = run(scenario)
+
+    assert status == 400
+    assert json.loads(body) == {"error": "Height must be a valid number.", "field": "height_cm"}
+
+
+def test_non_string_values_are_client_errors():
+    bad_values = [
+        ("gender", 1),
+        ("gender", ["male"]),
+        ("start_date", 20240101),
+        ("end_date", {"day": 1}),
+        ("start_weight", [80]),
+    ]
+
+    async def scenario(server, reader, writer):
+        for field, value in bad_values:
+            writer.write(request("/plan", {**PLAN, field: value}))
+        return [await read_response(reader) for _ in bad_values]
+
+    responses = run(scenario)
+
+    assert [status for status, _, _ in responses] == [400] * len(bad_values)
+    assert [json.loads(body)["field"] for _, _, body in responses] == [
+        field for field, _ in bad_values
+    ]
+
+
+def test_unknown_path_and_wrong_method():
+    async def scenario(server, reader, writer):
+        writer.write(request("/nope", method="GET") + request("/plan", method="GET"))
+        return [(await read_response(reader))[0] for _ in range(2)]
+
+    assert run(scenario) == [404, 405]
+
+
+def test_internal_errors_are_logged_not_sent(caplog):
+    class BrokenCalculator:
+        def calculate(self, data):
+            raise RuntimeError("secret at /srv/planner/core.py")
+
+    async def scenario(server, reader, writer):
+        server.calculator = BrokenCalculator()
+        writer.write(request("/plan", PLAN))
+        return await read_response(reader)
+
+    status, _, body = run(scenario)
+
+    assert status == 500
+    assert json.loads(body) == {"error": "Internal server error."}
+    assert "secret" in caplog.text
+
+
+### KEEP-ALIVE & PIPELINING ###
+
+def test_pipelined_requests_answered_in_order():
+    plans = [{**PLAN, "end_weight": 70 + i} for i in range(5)]
+
+    async def scenario(server, reader, writer):
+        writer.write(b"".join(request("/plan", plan) for plan in plans))
+        return [json.loads((await read_response(reader))[2]) for _ in plans]
+
+    summaries = run(scenario, workers=3)
+
+    assert [s["end_weight"] for s in summaries] == [70, 71, 72, 73, 74]
+
+
+def test_connection_close_is_honoured():
+    async def scenario(server, reader, writer):
+        writer.write(request("/health", method="GET", headers="Connection: close\r\n"))
+        status, headers, _ = await read_response(reader)
+        return status, headers, await reader.read()
+
+    status, headers, rest = run(scenario)
+
+    assert status == 200
+    assert headers["connection"] == "close"
+    assert rest == b""
+
+
+### STREAMING ###
+
+def test_daily_timeline_is_streamed_in_chunks():
+    async def scenario(server, reader, writer):
+        writer.write(request("/plan?detail=daily", PLAN))
+        return await read_response(reader)
+
+    status, headers, body = run(scenario, chunk_days=7)
+    lines = [json.loads(line) for line in body.splitlines()]
+
+    assert status == 200
+    assert headers["transfer-encoding"] == "chunked"
+    assert lines[0]["days"] == 60
+    assert [line["day"] for line in lines[1:]] == list(range(61))
+    assert lines[1]["weight"] == 80
+    assert lines[-1]["weight"] == 70
+
+
+### BACKPRESSURE ###
+
+def test_busy_server_answers_503():
+    release = threading.Event()
+
+    async def scenario(server, reader, writer):
+        # occupy the only slot with a calculation that waits for release
+        calculate = server.calculator.calculate
+        server.calculator.calculate = lambda data: release.wait() and calculate(data)
+
+        writer.write(request("/plan", PLAN) + request("/health", method="GET"))
+        await asyncio.sleep(0.1)
+        release.set()
+        return [(await read_response(reader)) for _ in range(2)]
+
+    first, second = run(scenario, max_pending=1)
+
+    assert first[0] == 200
+    assert second[0] == 503
+    assert second[1]["retry-after"] == "1"
@@ -0,0 +1,176 @@
+import pytest
+import random
+from datetime import datetime, timedelta
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import WeightChangeInput, Gender
+from core.solver import (
+    MAX_DAILY_GAIN,
+    MAX_DAILY_LOSS,
+    bmi_reached_date,
+    bmi_reached_day,
+    bmi_reached_day_in,
+    bmi_reached_days_many,
+    earliest_safe_days,
+    earliest_safe_days_many,
+    earliest_safe_end_date,
+    pace_level,
+    safe_target_range,
+    safe_target_range_many,
+)
+
+
+START = datetime(2024, 1, 1)
+
+
+def make_input(start_weight=100, end_weight=80, height_cm=180,
+               gender=Gender.MALE, days=365):
+    return WeightChangeInput(
+        start_weight=start_weight,
+        end_weight=end_weight,
+        height_cm=height_cm,
+        gender=gender,
+        start_date=START,
+        end_date=START + timedelta(days=days),
+    )
+
+
+def daily_change(start_weight, end_weight, days):
+    result = WeightChangeCalculator(engine="lazy").calculate(
+        make_input(start_weight, end_weight, days=days)
+    )
+    return result.daily_change
+
+
+### PACE ###
+
+def test_pace_level_thresholds():
+    assert pace_level(-MAX_DAILY_LOSS) is None
+    assert pace_level(-0.1501) == "danger"
+    assert pace_level(MAX_DAILY_GAIN) is None
+    assert pace_level(0.1001) == "warning"
+    assert pace_level(0) is None
+
+
+### EARLIEST SAFE END DATE ###
+
+def test_earliest_safe_days_matches_calculator():
+    rng = random.Random(0)
+    for _ in range(300):
+        start = round(rng.uniform(40, 150), rng.choice([0, 1, 2]))
+        end = round(rng.uniform(40, 150), rng.choice([0, 1, 2]))
+        days = earliest_safe_days(start, end)
+
+        assert pace_level(daily_change(start, end, days)) is None
+        if days > 1:
+            assert pace_level(daily_change(start, end, days - 1)) is not None
+
+
+def test_earliest_safe_end_date():
+    # 20 kg at 0.15 kg/day is 133.3 days; 0.15037 still rounds to 0.1504
+    assert earliest_safe_days(100, 80) == 134
+    assert earliest_safe_end_date(100, 80, START) == START + timedelta(days=134)
+    assert earliest_safe_days(60, 70) == 100
+    assert earliest_safe_days(70, 70) == 1
+
+
+def test_earliest_safe_days_many_matches_scalar():
+    rng = random.Random(1)
+    starts = [rng.uniform(40, 150) for _ in range(500)]
+    ends = [rng.uniform(40, 150) for _ in range(500)]
+
+    assert earliest_safe_days_many(starts, ends).tolist() == [
+        earliest_safe_days(s, e) for s, e in zip(starts, ends)
+    ]
+
+
+### SAFE TARGETS ###
+
+def test_safe_target_range_bounds_are_tight():
+    rng = random.Random(2)
+    for _ in range(200):
+        start = round(rng.uniform(40, 150), 1)
+        days = rng.randint(1, 400)
+        lowest, highest = safe_target_range(start, days)
+
+        assert pace_level(daily_change(start, lowest, days)) is None
+        assert pace_level(daily_change(start, highest, days)) is None
+        assert pace_level(daily_change(start, round(highest + 0.01, 2), days)) == "warning"
+        if lowest > 0.01:
+            assert pace_level(daily_change(start, round(lowest - 0.01, 2), days)) == "danger"
+
+
+def test_safe_target_range_many_matches_scalar():
+    rng = random.Random(3)
+    starts = [rng.uniform(40, 150) for _ in range(500)]
+    days = [rng.randint(1, 5_000) for _ in range(500)]
+
+    lowest, highest = safe_target_range_many(starts, days)
+    assert list(zip(lowest.tolist(), highest.tolist())) == [
+        safe_target_range(s, d) for s, d in zip(starts, days)
+    ]
+
+
+def test_safe_target_range_rejects_empty_range():
+    with pytest.raises(ValueError):
+        safe_target_range(80, 0)
+
+
+### BMI MILESTONES ###
+
+def first_day(bmis, bmi):
+    falling = bmi <= bmis[0]
+    return next(
+        (day for day, value in enumerate(bmis)
+         if (value <= bmi if falling else value >= bmi)),
+        None,
+    )
+
+
+@pytest.mark.parametrize("model", ["linear", "energy"])
+def test_bmi_reached_day_matches_timeline(model):
+    calculator = WeightChangeCalculator(engine="python", model=model)
+    rng = random.Random(4)
+    for _ in range(100):
+        data = make_input(
+            rng.uniform(50, 130), rng.uniform(50, 130), rng.uniform(150, 200),
+            rng.choice(list(Gender)), rng.randint(1, 600),
+        )
+        result = calculator.calculate(data)
+        bmis = result.bmis
+        for bmi in (rng.uniform(17, 45), bmis[rng.randint(0, len(bmis) - 1)]):
+            assert bmi_reached_day(data, bmi, model) == first_day(bmis, bmi)
+            assert bmi_reached_day_in(result, bmi) == first_day(bmis, bmi)
+
+
+def test_bmi_reached_date():
+    data = make_input(100, 80, 180, days=200)  # BMI 30.86 -> 24.69
+
+    assert bmi_reached_date(data, 30) == START + timedelta(days=28)
+    assert bmi_reached_date(data, 30.86) == START  # the start BMI
+    assert bmi_reached_date(data, 20) is None      # below the end BMI
+    assert bmi_reached_date(data, 35) is None      # BMI only falls
+
+
+@pytest.mark.parametrize("model", ["linear", "energy"])
+def test_bmi_reached_days_many_matches_scalar(model):
+    rng = random.Random(5)
+    inputs = [
+        make_input(
+            rng.uniform(50, 130), rng.uniform(50, 130), rng.uniform(150, 200),
+            rng.choice(list(Gender)), rng.randint(1, 2_000),
+        )
+        for _ in range(200)
+    ]
+    targets = [rng.uniform(17, 45) for _ in inputs]
+
+    expected = [bmi_reached_day(d, t, model) for d, t in zip(inputs, targets)]
+    assert bmi_reached_days_many(inputs, targets, model).tolist() == [
+        -1 if day is None else day for day in expected
+    ]
+
+
+def test_bmi_reached_days_many_marks_invalid_rows():
+    inputs = [make_input(100, 80), make_input(-5, 80)]
+
+    assert bmi_reached_days_many(inputs, 30).tolist() == [51, -1]
@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative import time budgets in milliseconds (best of three runs).
+# They leave headroom for slow machines but fail as soon as NumPy or
+# matplotlib (~100 ms / ~500 ms) end up on the core or CLI import path.
+IMPORT_BUDGETS_MS = {
+    "core.calculator": 75,
+    "ui.ui_console": 100,
+}
+
+HEAVY_MODULES = ("numpy", "matplotlib", "customtkinter", "tkinter")
+
+
+def import_time_ms(module: str) -> float:
+    """
+    Returns the cumulative import time of module via python -X importtime.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # lines look like "import time:  self [us] | cumulative | module"
+    for line in completed.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == module:
+            return int(fields[1]) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+@pytest.mark.parametrize("module, budget_ms", IMPORT_BUDGETS_MS.items())
+def test_import_time_within_budget(module, budget_ms):
+    best = min(import_time_ms(module) for _ in range(3))
+    assert best <= budget_ms, f"{module} took {best:.1f} ms (budget {budget_ms} ms)"
+
+
+def test_cli_path_does_not_import_heavy_modules():
+    code = (
+        "import sys, app; app.load_cli(); "
+        f"print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == ""
+
+
+def test_results_window_defers_matplotlib():
+    pytest.importorskip("customtkinter")
+    code = (
+        "import sys, ui.results_window; "
+        "print('matplotlib' in sys.modules)"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "False"
@@ -0,0 +1,180 @@
+import pytest
+from datetime import datetime
+
+from core.calculator import WeightChangeCalculator
+import random
+from datetime import timedelta
+
+from core.data_models import BmiCategory, BmiSegment, WeightChangeInput, Gender
+from core.timeline import (
+    _LazySeries,
+    bmi_category,
+    bmi_segments,
+    build_timeline_lazy,
+    build_timeline_python,
+    get_engine,
+)
+
+np = pytest.importorskip("numpy")
+
+from core.timeline import build_timeline_numpy, round_array  # noqa: E402
+
+
+### ENGINE EQUIVALENCE ###
+
+@pytest.mark.parametrize(
+    "start_weight, end_weight, height_cm, days",
+    [
+        (80, 75, 170, 31),
+        (70, 75, 175, 10),
+        (70, 70, 180, 9),
+        (95.5, 68.25, 162.5, 3650),
+        (80, 78.5, 170, 300),    # 0.005 kg/day: every other day is a .5 tie
+        (120.3, 58.7, 199, 36500),
+    ],
+)
+def test_numpy_engine_matches_python_engine(
+    start_weight, end_weight, height_cm, days
+):
+    daily_change = (end_weight - start_weight) / days
+
+    expected = build_timeline_python(start_weight, daily_change, height_cm, days)
+    actual = build_timeline_numpy(start_weight, daily_change, height_cm, days)
+
+    assert actual == expected
+
+
+def test_round_array_matches_builtin_round():
+    values = np.array([2.675, 1.005, 0.285, 80.125, 79.995, 0.5, 1e-9])
+    assert round_array(values).tolist() == [round(v, 2) for v in values.tolist()]
+
+
+def test_calculator_engines_return_identical_results():
+    data = WeightChangeInput(
+        start_weight=91.3,
+        end_weight=72.8,
+        height_cm=168,
+        gender=Gender.FEMALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2026, 6, 30),
+    )
+
+    reference = WeightChangeCalculator(engine="python").calculate(data)
+    vectorized = WeightChangeCalculator(engine="numpy").calculate(data)
+
+    assert vectorized == reference
+
+
+### LAZY ENGINE ###
+
+def test_lazy_engine_matches_python_engine():
+    daily_change = (68.25 - 95.5) / 3650
+    weights, bmis = build_timeline_lazy(95.5, daily_change, 162.5, 3650)
+    expected_weights, expected_bmis = build_timeline_python(
+        95.5, daily_change, 162.5, 3650
+    )
+
+    assert len(weights) == len(bmis) == 3651
+    assert list(weights) == expected_weights
+    assert list(bmis) == expected_bmis
+    assert weights[-1] == expected_weights[-1]
+
+
+def test_lazy_series_slicing():
+    weights, bmis = build_timeline_lazy(80, -5 / 31, 170, 31)
+    expected_weights, expected_bmis = build_timeline_python(80, -5 / 31, 170, 31)
+
+    assert weights[3:5] == expected_weights[3:5]
+    assert bmis[::-7] == expected_bmis[::-7]
+    assert list(weights[10:][2:4]) == expected_weights[12:14]
+    assert len(weights[100:]) == 0
+
+    with pytest.raises(IndexError):
+        weights[32]
+
+
+def test_calculator_lazy_engine_result_equals_eager():
+    data = WeightChangeInput(
+        start_weight=80,
+        end_weight=75,
+        height_cm=170,
+        gender=Gender.FEMALE,
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 2, 1),
+    )
+
+    lazy = WeightChangeCalculator(engine="lazy").calculate(data)
+
+    assert lazy == WeightChangeCalculator(engine="python").calculate(data)
+    assert lazy.bmi_start == lazy.bmis[0]
+
+
+def test_lazy_series_subclass_must_define_value_and_view():
+    class ValuesOnly(_LazySeries):
+        def _value(self, day):
+            return float(day)
+
+    with pytest.raises(TypeError, match="_view"):
+        ValuesOnly(range(3))
+
+
+### BMI SEGMENTS ###
+
+def scanned_segments(bmis):
+    segments = []
+    for day, bmi in enumerate(bmis):
+        category = bmi_category(bmi)
+        if segments and segments[-1].category == category:
+            segments[-1] = BmiSegment(segments[-1].start_day, day, category)
+        else:
+            segments.append(BmiSegment(day, day, category))
+    return tuple(segments)
+
+
+def test_bmi_category_boundaries():
+    assert bmi_category(18.49) == BmiCategory.UNDERWEIGHT
+    assert bmi_category(18.5) == BmiCategory.NORMAL
+    assert bmi_category(25) == BmiCategory.OVERWEIGHT
+    assert bmi_category(30) == BmiCategory.OBESE
+
+
+@pytest.mark.parametrize("model", ["linear", "energy"])
+def test_bmi_segments_match_full_scan(model):
+    calculator = WeightChangeCalculator(engine="lazy", model=model)
+    rng = random.Random(0)
+    start = datetime(2024, 1, 1)
+    for _ in range(200):
+        data = WeightChangeInput(
+            start_weight=rng.uniform(40, 150),
+            end_weight=rng.uniform(40, 150),
+            height_cm=rng.uniform(150, 200),
+            gender=rng.choice(list(Gender)),
+            start_date=start,
+            end_date=start + timedelta(days=rng.choice([1, 2, rng.randint(3, 900)])),
+        )
+        result = calculator.calculate(data)
+
+        assert result.bmi_segments == scanned_segments(list(result.bmis))
+
+
+def test_bmi_segments_of_stable_and_skipping_plans():
+    weights, bmis = build_timeline_python(80, 0, 180, 30)
+    assert bmi_segments(bmis) == (BmiSegment(0, 30, BmiCategory.NORMAL),)
+
+    # 31.2 -> 24.7 in one day skips Overweight
+    weights, bmis = build_timeline_python(101, -21, 180, 1)
+    assert bmi_segments(bmis) == (
+        BmiSegment(0, 0, BmiCategory.OBESE),
+        BmiSegment(1, 1, BmiCategory.NORMAL),
+    )
+
+
+### ENGINE SELECTION ###
+
+def test_auto_engine_prefers_numpy():
+    assert get_engine("auto") is build_timeline_numpy
+
+
+def test_unknown_engine_raises_error():
+    with pytest.raises(ValueError, match="Unknown engine"):
+        WeightChangeCalculator(engine="fortran")
@@ -7,6 +7,8 @@ from core.utils import (
     validate_positive,
     validate_gender,
     parse_date,
+    parse_iso_date,
+    parse_dates,
     format_date,
     validate_date_range,
 )
@@ -34,6 +36,18 @@ def test_to_float_valid():
     assert to_float(2.5, "value") == 2.5
 
 
+def test_to_float_converts_once():
+    class Number:
+        calls = 0
+
+        def __float__(self):
+            Number.calls += 1
+            return 4.0
+
+    assert to_float(Number(), "value") == 4.0
+    assert Number.calls == 1
+
+
 def test_to_float_invalid():
     with pytest.raises(ValueError):
         to_float("abc", "value")
@@ -72,6 +86,9 @@ def test_validate_gender_invalid():
     with pytest.raises(ValueError):
         validate_gender(None)
 
+    with pytest.raises(ValueError):
+        validate_gender(1)
+
 ### DATE HELPERS ###
 
 # parse_date
@@ -94,6 +111,53 @@ def test_parse_date_invalid():
     with pytest.raises(ValueError):
         parse_date(None, "start_date")
 
+
+def test_parse_date_matches_strptime():
+    samples = [
+        "01-02-2024", "1-2-2024", "29-02-2024", "29-02-2023", "31-04-2024",
+        "00-01-2024", "01-13-2024", "01-02-0000", "01-02-0999", "01-02-24",
+        " 01-02-2024", "01-02-2024 ", "01/02/2024", "ab-cd-efgh", "+1-02-2024",
+        "0_-02-2024", "\u0661\u0662-02-2024",
+    ]
+    for sample in samples:
+        try:
+            expected = datetime.strptime(sample, "%d-%m-%Y")
+        except ValueError:
+            expected = None
+
+        try:
+            actual = parse_date(sample, "Start date")
+        except ValueError as e:
+            assert str(e) == "Start date must be in DD-MM-YYYY format."
+            actual = None
+
+        assert actual == expected, sample
+
+# parse_iso_date
+
+def test_parse_iso_date():
+    assert parse_iso_date("2024-02-01", "Start date") == datetime(2024, 2, 1)
+
+    for invalid in ("01-02-2024", "2024-W05-1", "2024-02-01T10:00", "2024-02-30", None):
+        with pytest.raises(ValueError, match="Start date must be in YYYY-MM-DD format."):
+            parse_iso_date(invalid, "Start date")
+
+# parse_dates
+
+def test_parse_dates_column():
+    dates = parse_dates(["01-02-2024", "1-2-2024", "01-02-2024", "15-03-2024"], "Start date")
+    assert dates == [datetime(2024, 2, 1)] * 3 + [datetime(2024, 3, 15)]
+
+    assert parse_dates(["2024-02-01"], "Start date", iso=True) == [datetime(2024, 2, 1)]
+
+
+def test_parse_dates_invalid():
+    with pytest.raises(ValueError, match="End date must be in DD-MM-YYYY format."):
+        parse_dates(["01-02-2024", "2024-02-01"], "End date")
+
+    coerced = parse_dates(["01-02-2024", "bad", None, ["unhashable"]], "End date", errors="coerce")
+    assert coerced == [datetime(2024, 2, 1), None, None, None]
+
 # format_date
 
 def test_format_date():
@@ -0,0 +1,86 @@
+import pytest
+from datetime import datetime
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import Gender, RowError
+
+np = pytest.importorskip("numpy")
+
+from core.validation import validate_columns  # noqa: E402
+
+
+def make_columns(**overrides):
+    columns = {
+        "start_weight": [80, "72.5", 90],
+        "end_weight": [75, 70, "85"],
+        "height_cm": [170, 165, 180],
+        "gender": ["female", "MALE ", Gender.MALE],
+        "start_date": ["01-01-2024", "1-1-2024", datetime(2024, 1, 1)],
+        "end_date": ["01-02-2024", "15-01-2024", datetime(2024, 3, 1)],
+    }
+    columns.update(overrides)
+    return columns
+
+
+### TYPED COLUMNS ###
+
+def test_validate_columns_returns_typed_arrays():
+    checked = validate_columns(make_columns())
+
+    assert checked.errors == []
+    assert checked.valid.tolist() == [True, True, True]
+    assert checked.start_weight.dtype == np.float64
+    assert checked.start_weight.tolist() == [80, 72.5, 90]
+    assert checked.gender.tolist() == [Gender.FEMALE, Gender.MALE, Gender.MALE]
+    assert checked.start_date.dtype == np.dtype("datetime64[us]")
+    assert checked.days.tolist() == [31, 14, 60]
+
+
+def test_inputs_feed_prevalidated_calculation():
+    checked = validate_columns(make_columns())
+    calculator = WeightChangeCalculator()
+
+    for row, data in checked.inputs():
+        assert data.start_date == datetime(2024, 1, 1)
+        assert calculator.calculate(data, prevalidated=True) == calculator.calculate(data)
+
+
+### ERROR TABLE ###
+
+def test_first_error_per_row_with_calculator_messages():
+    checked = validate_columns(make_columns(
+        start_weight=[-1, 70, "abc"],
+        gender=["female", "other", "male"],
+        end_date=["31-12-2023", "15-01-2024", "2024-03-01"],
+    ), model="energy")
+
+    assert checked.valid.tolist() == [False, False, False]
+    assert checked.errors == [
+        RowError(0, "start_weight", "Start weight must be greater than zero."),
+        RowError(1, "gender", "Gender must be 'male' or 'female'."),
+        RowError(2, "start_weight", "Start weight must be a valid number."),
+    ]
+
+
+def test_gender_is_only_checked_for_the_energy_model():
+    columns = make_columns(gender=["female", "other", None])
+
+    assert validate_columns(columns).errors == []
+    assert validate_columns(columns).gender.tolist() == [Gender.FEMALE, None, None]
+    assert [e.row for e in validate_columns(columns, model="energy").errors] == [1, 2]
+
+
+def test_date_errors():
+    checked = validate_columns(make_columns(
+        start_date=["01-01-2024", None, "01-01-2024"],
+        end_date=["2024/02/01", "01-02-2024", "01-01-2024"],
+    ))
+
+    assert checked.errors == [
+        RowError(0, "end_date", "End date must be in DD-MM-YYYY format."),
+        RowError(1, "start_date", "Start date must be a valid date."),
+        RowError(2, "end_date", "End date must be after start date."),
+    ]
+    assert np.isnat(checked.end_date[0])
+    assert checked.days.tolist() == [0, 0, 0]
+    assert list(checked.inputs()) == []
@@ -0,0 +1,165 @@
+import threading
+import time
+
+import pytest
+
+from ui.workers import Debouncer, JobQueue, LatestJobRunner
+
+
+class ManualScheduler:
+    """
+    Stands in for a Tk widget: after() callbacks run when pump() is called.
+    """
+
+    def __init__(self):
+        self.pending = []
+
+    def after(self, ms, callback):
+        self.pending.append(callback)
+        return callback
+
+    def after_cancel(self, after_id):
+        self.pending.remove(after_id)
+
+    def pump(self, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while self.pending and time.monotonic() < deadline:
+            callbacks, self.pending = self.pending, []
+            for callback in callbacks:
+                callback()
+            time.sleep(0.005)
+
+
+@pytest.fixture
+def scheduler():
+    return ManualScheduler()
+
+
+@pytest.fixture
+def runner(scheduler):
+    runner = LatestJobRunner(scheduler, poll_ms=1)
+    yield runner
+    runner.shutdown()
+
+
+### DELIVERY ###
+
+def test_result_is_delivered_through_polling(runner, scheduler):
+    delivered = []
+    worker_threads = []
+
+    def job(cancelled):
+        worker_threads.append(threading.current_thread())
+        return 42
+
+    runner.submit(job, delivered.append, pytest.fail)
+    scheduler.pump()
+
+    assert delivered == [42]
+    assert worker_threads[0] is not threading.current_thread()
+    assert not runner.busy
+
+
+def test_errors_are_delivered_to_error_callback(runner, scheduler):
+    errors = []
+
+    def job(cancelled):
+        raise ValueError("bad input")
+
+    runner.submit(job, pytest.fail, errors.append)
+    scheduler.pump()
+
+    assert [str(e) for e in errors] == ["bad input"]
+
+
+### SUPERSEDED REQUESTS ###
+
+def test_only_latest_job_is_delivered(runner, scheduler):
+    release = threading.Event()
+    delivered = []
+    first_cancelled = []
+
+    def slow_job(cancelled):
+        release.wait(2)
+        first_cancelled.append(cancelled.is_set())
+        return "stale"
+
+    runner.submit(slow_job, delivered.append, pytest.fail)
+    runner.submit(lambda cancelled: "fresh", delivered.append, pytest.fail)
+    release.set()
+    scheduler.pump()
+
+    assert delivered == ["fresh"]
+    assert first_cancelled == [True]
+
+
+def test_superseded_results_are_discarded(runner, scheduler):
+    release = threading.Event()
+    delivered, discarded = [], []
+
+    def slow_job(cancelled):
+        release.wait(2)
+        return "stale"
+
+    runner.submit(slow_job, delivered.append, pytest.fail, discarded.append)
+    runner.submit(lambda cancelled: "never started", pytest.fail, pytest.fail,
+                  discarded.append)  # cancelled while queued
+    runner.submit(lambda cancelled: "fresh", delivered.append, pytest.fail,
+                  discarded.append)
+    release.set()
+    scheduler.pump()
+
+    assert delivered == ["fresh"]
+    assert discarded == ["stale"]
+
+
+### QUEUED JOBS ###
+
+def test_job_queue_delivers_every_job_in_order(scheduler):
+    queue = JobQueue(scheduler, poll_ms=1)
+    release = threading.Event()
+    delivered = []
+
+    def slow_job():
+        release.wait(2)
+        return "first"
+
+    def failing_job():
+        raise OSError("disk full")
+
+    queue.submit(slow_job, delivered.append, pytest.fail)
+    queue.submit(failing_job, pytest.fail, lambda e: delivered.append(str(e)))
+    queue.submit(lambda: "third", delivered.append, pytest.fail)
+    assert queue.pending == 3
+
+    release.set()
+    scheduler.pump()
+    queue.shutdown()
+
+    assert delivered == ["first", "disk full", "third"]
+    assert queue.pending == 0
+
+
+### DEBOUNCING ###
+
+def test_debouncer_fires_once_after_a_burst(scheduler):
+    calls = []
+    debouncer = Debouncer(scheduler, 150, lambda: calls.append(len(calls)))
+
+    for _ in range(5):
+        debouncer.trigger(object())  # Tk passes the event
+
+    assert debouncer.pending
+    assert len(scheduler.pending) == 1
+    scheduler.pump()
+    assert calls == [0]
+    assert not debouncer.pending
+
+
+def test_debouncer_cancel(scheduler):
+    debouncer = Debouncer(scheduler, 150, pytest.fail)
+
+    debouncer.trigger()
+    debouncer.cancel()
+
+    assert scheduler.pending == []
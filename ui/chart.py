@@ -0,0 +1,600 @@
+import io
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.patches import Rectangle
+from matplotlib.transforms import Bbox
+
+from core.timeline import BMI_BOUNDARIES, BMI_CATEGORIES, bmi_category, bmi_segments
+
+
+# ---------------------------------------------------------------------
+# BMI styling
+# ---------------------------------------------------------------------
+
+BMI_COLORS = ("#3b82f6", "#22c55e", "#eab308", "#ef4444")  # blue → red
+BMI_LABELS = ("Underweight", "Normal", "Overweight", "Obese")
+
+
+def bmi_color(bmi: float) -> str:
+    return BMI_COLORS[BMI_CATEGORIES.index(bmi_category(bmi))]
+
+
+def bmi_label(bmi: float) -> str:
+    return BMI_LABELS[BMI_CATEGORIES.index(bmi_category(bmi))]
+
+
+# ---------------------------------------------------------------------
+# Drawing
+# ---------------------------------------------------------------------
+
+BMI_BAND_RANGE = (0, 60)  # BMI span of the outer bands
+
+
+def bmi_band_limits(height_cm: float):
+    """
+    (lowest, highest) weight of each BMI category band at height_cm.
+    """
+    height_m2 = (height_cm / 100) ** 2
+    edges = (BMI_BAND_RANGE[0], *BMI_BOUNDARIES, BMI_BAND_RANGE[1])
+    return [(low * height_m2, high * height_m2) for low, high in zip(edges[:-1], edges[1:])]
+
+
+def draw_bmi_bands(ax, height_cm: float) -> list:
+    """
+    Draws one full-width band per BMI category and returns the patches.
+    """
+    return [
+        ax.axhspan(low, high, color=color, alpha=0.08, zorder=0)
+        for (low, high), color in zip(bmi_band_limits(height_cm), BMI_COLORS)
+    ]
+
+
+def move_bmi_bands(bands, height_cm: float) -> None:
+    """
+    Moves the bands of draw_bmi_bands (or any patches with a y extent)
+    to a new height.
+    """
+    for band, (low, high) in zip(bands, bmi_band_limits(height_cm)):
+        band.set_y(low)
+        band.set_height(high - low)
+
+
+def segment_categories(segments, days):
+    """
+    Returns the BMI category index (0 = Underweight … 3 = Obese) of
+    every day in days, looked up in the result's BMI segments.
+    """
+    starts = [segment.start_day for segment in segments]
+    indices = [BMI_CATEGORIES.index(segment.category) for segment in segments]
+    return np.asarray(indices)[np.searchsorted(starts, days, side="right") - 1]
+
+
+def _segments(days, weights, categories):
+    points = np.column_stack([days, weights])
+    segments = np.stack([points[:-1], points[1:]], axis=1)
+    colors = np.asarray(BMI_COLORS)[categories[:-1]]
+    return segments, colors
+
+
+def trajectory_segments(weights, bmis, segments=None):
+    """
+    Returns the (n - 1, 2, 2) day/weight segments of the trajectory and
+    the color of each segment, taken from the BMI at its first day.
+
+    segments are the BMI segments of the plan (result.bmi_segments);
+    they are computed from bmis when not given.
+    """
+    if segments is None:
+        segments = bmi_segments(bmis)
+    weights = np.fromiter(weights, dtype=float, count=len(weights))
+    days = np.arange(len(weights))
+    return _segments(days, weights, segment_categories(segments, days))
+
+
+def _new_weight_line(segments, colors) -> LineCollection:
+    return LineCollection(
+        segments,
+        colors=colors,
+        linewidths=3,
+        capstyle="projecting",
+        joinstyle="round",
+        zorder=3,
+    )
+
+
+def draw_weight_line(ax, weights, bmis, segments=None) -> LineCollection:
+    """
+    Draws the BMI-colored trajectory as a single LineCollection artist.
+    """
+    line = _new_weight_line(*trajectory_segments(weights, bmis, segments))
+    ax.add_collection(line)
+    ax.autoscale_view()
+    return line
+
+
+class LodTrajectory:
+    """
+    BMI-colored trajectory drawn at screen resolution.
+
+    Only the visible day range is drawn, reduced to the first, last,
+    minimum and maximum point of each pixel-wide bucket. Both days
+    around every BMI category change are always kept, so color changes
+    stay exactly where the full-resolution line has them. The line is
+    recomputed whenever the x limits change (zoom / pan), which gives
+    full resolution once few enough days are visible.
+
+    Colors come from the plan's BMI segments, so they cost
+    O(categories) to set up and O(visible points) per update.
+    """
+
+    POINTS_PER_BUCKET = 4
+
+    def __init__(self, ax, weights, bmis, segments=None):
+        self.ax = ax
+        self.set_data(weights, bmis, segments)
+
+        self.line = _new_weight_line(np.empty((0, 2, 2)), [])
+        ax.add_collection(self.line, autolim=False)
+
+        self.autoscale()
+        self.update(*ax.get_xlim())
+        ax.callbacks.connect("xlim_changed", self._on_xlim_changed)
+
+    def autoscale(self) -> None:
+        """
+        Adds the plan's extent to the data limits and autoscales the view.
+        """
+        last_day = len(self.weights) - 1
+        self.ax.update_datalim([
+            (0, self.weights.min()),
+            (last_day, self.weights.max()),
+        ])
+        self.ax.autoscale_view()
+
+    def set_data(self, weights, bmis, segments=None) -> None:
+        """
+        Replaces the plotted plan. The line itself is rebuilt by the next
+        update(), e.g. through the xlim_changed callback of set_xlim().
+        """
+        self.weights = np.fromiter(weights, dtype=float, count=len(weights))
+        self.segments = bmi_segments(bmis) if segments is None else segments
+
+        changes = np.array([s.start_day for s in self.segments[1:]], dtype=int)
+        self.category_changes = np.union1d(changes - 1, changes)
+
+    def visible_indices(self, x0: float, x1: float, buckets: int):
+        """
+        Returns the sorted day indices to draw for the x range [x0, x1].
+        """
+        last_day = len(self.weights) - 1
+        lo = min(max(int(np.floor(x0)), 0), last_day)
+        hi = max(min(int(np.ceil(x1)), last_day), lo)
+
+        count = hi - lo + 1
+        if count <= self.POINTS_PER_BUCKET * max(buckets, 1):
+            return np.arange(lo, hi + 1)
+
+        size = -(-count // buckets)
+        rows = -(-count // size)
+        window = np.full(rows * size, np.nan)
+        window[:count] = self.weights[lo:hi + 1]
+        window = window.reshape(rows, size)
+
+        starts = lo + np.arange(rows) * size
+        candidates = (
+            starts,
+            np.minimum(starts + size - 1, hi),
+            starts + np.nanargmin(window, axis=1),
+            starts + np.nanargmax(window, axis=1),
+            self.category_changes[
+                (self.category_changes >= lo) & (self.category_changes <= hi)
+            ],
+        )
+        return np.unique(np.concatenate(candidates))
+
+    def update(self, x0: float, x1: float) -> None:
+        indices = self.visible_indices(x0, x1, int(self.ax.bbox.width))
+        segments, colors = _segments(
+            indices, self.weights[indices],
+            segment_categories(self.segments, indices),
+        )
+        self.line.set_segments(segments)
+        self.line.set_color(colors)
+
+    def _on_xlim_changed(self, ax) -> None:
+        self.update(*ax.get_xlim())
+
+
+def style_axes(ax) -> None:
+    ax.set_title("Weight Change Over Time (BMI Zones)")
+    ax.set_xlabel("Days")
+    ax.set_ylabel("Weight (kg)")
+    ax.grid(True, linestyle="--", alpha=0.4)
+    legend_elements = [
+        Line2D([0], [0], color=color, lw=4, label=label)
+        for color, label in zip(BMI_COLORS, BMI_LABELS)
+    ]
+    ax.legend(handles=legend_elements, loc="best")
+
+
+# ---------------------------------------------------------------------
+# Results chart
+# ---------------------------------------------------------------------
+
+class WeightChart:
+    """
+    The results chart of one WeightChangeResult.
+
+    Built with the object-oriented Figure API (no pyplot state), so it
+    can be created and pre-rendered on a worker thread and attached to
+    a Tk canvas afterwards.
+    """
+
+    FIGSIZE = (7, 4.5)
+
+    def __init__(self, result):
+        self.result = result
+        self.figure = Figure(figsize=self.FIGSIZE)
+        self.ax = self.figure.add_subplot()
+
+        self.bands = draw_bmi_bands(self.ax, result.height_cm)
+        self.trajectory = LodTrajectory(
+            self.ax, result.weights, result.bmis, result.bmi_segments
+        )
+        style_axes(self.ax)
+
+    def show(self, result) -> None:
+        """
+        Replaces the plotted plan in place, with the same limits a new
+        WeightChart of result would have; the figure, axes, bands and
+        styling are kept.
+        """
+        self.result = result
+        self.figure.set_size_inches(self.FIGSIZE)  # a window canvas may have resized it
+        self.trajectory.set_data(result.weights, result.bmis, result.bmi_segments)
+
+        # Start from empty data limits (as a cleared axes does) and redraw
+        # the bands, so the limits come out exactly as in a new chart;
+        # this also drops the zoom / pan of the previous window.
+        self.ax.dataLim = Bbox.null()
+        self.ax.ignore_existing_data_limits = True
+        self.ax.set_autoscale_on(True)
+        for band in self.bands:
+            band.remove()
+        self.bands = draw_bmi_bands(self.ax, result.height_cm)
+
+        self.trajectory.autoscale()
+        self.trajectory.update(*self.ax.get_xlim())
+
+    def detach(self) -> None:
+        """
+        Gives the figure a fresh Agg canvas, dropping the window canvas
+        it was shown on together with that canvas' event connections.
+        """
+        FigureCanvasAgg(self.figure)
+
+    def prerender(self) -> None:
+        """
+        Draws the figure once on an Agg canvas, so layout and text are
+        already computed when the Tk canvas first shows it.
+        """
+        FigureCanvasAgg(self.figure).draw()
+
+
+class FigurePool:
+    """
+    WeightCharts released by closed results windows, kept for reuse.
+
+    acquire() shows the plan on a pooled chart when there is one, so
+    opening a window reuses its figure, axes, legend and styling instead
+    of building new ones; release() keeps at most size charts and clears
+    the figure of any other, so closed windows never add up. size=0
+    disables reuse. Safe to use from worker threads.
+    """
+
+    def __init__(self, size: int = 2):
+        self.size = size
+        self._charts = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._charts)
+
+    def acquire(self, result) -> WeightChart:
+        with self._lock:
+            chart = self._charts.pop() if self._charts else None
+        if chart is None:
+            return WeightChart(result)
+        chart.show(result)
+        return chart
+
+    def release(self, chart: WeightChart) -> None:
+        chart.detach()
+        with self._lock:
+            if len(self._charts) < self.size:
+                self._charts.append(chart)
+                return
+        # not pooled: break the artist / figure cycles now instead of
+        # leaving the figure to the cyclic garbage collector
+        chart.figure.clear()
+
+
+class ChartWindow:
+    """
+    A pooled WeightChart while a window shows it.
+
+    attach() puts the figure on the window's canvas and adds the hover
+    tooltip; close() removes the tooltip and gives the chart back to the
+    pool, so nothing of the window stays reachable from the figure.
+    ResultsWindow uses it with FigureCanvasTkAgg; any canvas class works.
+    """
+
+    def __init__(self, pool: FigurePool, chart: WeightChart):
+        self.pool = pool
+        self.chart = chart
+        self.canvas = None
+        self.hover: Optional["DayHover"] = None
+
+    def attach(self, canvas_class, **options):
+        result = self.chart.result
+        self.canvas = canvas_class(self.chart.figure, **options)
+        self.hover = DayHover(self.chart.ax, result.weights, result.bmis)
+        return self.canvas
+
+    def close(self) -> None:
+        if self.chart is None:
+            return
+        if self.hover is not None:
+            self.hover.remove()
+        self.pool.release(self.chart)
+        self.chart = self.canvas = self.hover = None
+
+
+# ---------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------
+
+EXPORT_FORMATS = ("png", "svg", "pdf")
+
+
+def render_chart(result, fmt: str = "png", dpi: int = 150, xlim=None, ylim=None) -> bytes:
+    """
+    Renders the results chart of result as PNG, SVG or PDF bytes.
+
+    The chart is a new snapshot built from the result and the window's
+    view limits, never the figure shown by Tk, so this can run on a
+    worker thread while the window keeps drawing. The level-of-detail
+    line is computed for the output width at dpi.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported format '{fmt}'.")
+
+    chart = WeightChart(result)
+    chart.figure.set_dpi(dpi)
+    if ylim is not None:
+        chart.ax.set_ylim(ylim)
+    # also rebuilds the trajectory line for the new width (xlim_changed)
+    chart.ax.set_xlim(chart.ax.get_xlim() if xlim is None else xlim)
+
+    buffer = io.BytesIO()
+    chart.figure.savefig(buffer, format=fmt, dpi=dpi)
+    chart.figure.clear()
+    return buffer.getvalue()
+
+
+class ChartExporter:
+    """
+    Chart exports of one result, with rendered files kept in an LRU.
+
+    render() is keyed by format, DPI and view limits: exporting an
+    unchanged view again returns the cached bytes without rendering.
+    Safe to call from worker threads.
+    """
+
+    def __init__(self, result, max_entries: int = 8):
+        self.result = result
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, fmt: str = "png", dpi: int = 150, xlim=None, ylim=None) -> bytes:
+        key = (
+            fmt,
+            dpi,
+            None if xlim is None else tuple(map(float, xlim)),
+            None if ylim is None else tuple(map(float, ylim)),
+        )
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        data = render_chart(self.result, fmt, dpi, xlim, ylim)
+        with self._lock:
+            self._entries[key] = data
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def export(self, path: Union[str, Path], dpi: int = 150, xlim=None, ylim=None) -> Path:
+        """
+        Writes the chart to path, in the format of its extension.
+        """
+        path = Path(path)
+        path.write_bytes(self.render(path.suffix.lstrip(".").lower(), dpi, xlim, ylim))
+        return path
+
+
+# ---------------------------------------------------------------------
+# Live preview
+# ---------------------------------------------------------------------
+
+class PreviewChart:
+    """
+    Compact chart of the plan being edited in the main window.
+
+    The figure, axes, BMI bands and trajectory are created once; show()
+    only swaps artist data and axis limits, so an update costs one LOD
+    line of the new plan plus one redraw, never a new figure (~10 ms
+    for a one-year plan, see benchmarks/bench_preview.py).
+    """
+
+    FIGSIZE = (4.2, 3.0)
+
+    def __init__(self):
+        self.figure = Figure(figsize=self.FIGSIZE)
+        # Tick labels are most of the cost of a redraw (text layout and
+        # glyph rendering), so the preview only shows the shape of the
+        # plan; the numbers are shown next to it by the window.
+        self.figure.subplots_adjust(left=0.02, right=0.98, top=0.98, bottom=0.02)
+        self.ax = self.figure.add_subplot()
+        self.ax.set_xticks([])
+        self.ax.set_yticks([])
+
+        # Rectangles in (axes x, data y) coordinates: a new height only
+        # moves their y extent.
+        transform = self.ax.get_yaxis_transform()
+        self.bands = [
+            self.ax.add_patch(Rectangle(
+                (0, 0), 1, 0, transform=transform,
+                color=color, alpha=0.08, zorder=0,
+            ))
+            for color in BMI_COLORS
+        ]
+        self.trajectory: Optional[LodTrajectory] = None
+        self.result = None
+
+    def show(self, result) -> None:
+        self.result = result
+        move_bmi_bands(self.bands, result.height_cm)
+
+        if self.trajectory is None:
+            self.trajectory = LodTrajectory(
+                self.ax, result.weights, result.bmis, result.bmi_segments
+            )
+        else:
+            self.trajectory.set_data(result.weights, result.bmis, result.bmi_segments)
+
+        # plans are monotonic: the extremes are the first and last day
+        first, last = result.weights[0], result.weights[-1]
+        low, high = min(first, last), max(first, last)
+        margin = max((high - low) * 0.1, 0.5)
+        self.ax.set_ylim(low - margin, high + margin)
+        # also rebuilds the trajectory line (xlim_changed)
+        self.ax.set_xlim(0, result.days)
+
+
+# ---------------------------------------------------------------------
+# Hover tooltip
+# ---------------------------------------------------------------------
+
+def tooltip_text(day: int, weight: float, bmi: float) -> str:
+    return (
+        f"Day {day}\n"
+        f"Weight: {weight:.1f} kg\n"
+        f"BMI: {bmi:.1f} ({bmi_label(bmi)})"
+    )
+
+
+class DayHover:
+    """
+    Hover tooltip for a chart whose x axis is the integer day index.
+
+    The hovered day is the cursor's x data coordinate rounded, so each
+    mouse move is O(1) whatever the plan length. The annotation is an
+    animated artist blitted over a cached background instead of
+    redrawing the whole figure.
+    """
+
+    def __init__(self, ax, weights, bmis):
+        self.ax = ax
+        self.canvas = ax.figure.canvas
+        self.weights = weights
+        self.bmis = bmis
+
+        self.annotation = ax.annotate(
+            "",
+            xy=(0, 0),
+            xytext=(15, 15),
+            textcoords="offset points",
+            bbox=dict(boxstyle="round", fc="white", alpha=0.95),
+            arrowprops=dict(arrowstyle="->"),
+            zorder=10,
+            animated=True,
+            visible=False,
+        )
+
+        self.day: Optional[int] = None
+        self._background = None
+        self._connections = [
+            self.canvas.mpl_connect("draw_event", self._on_draw),
+            self.canvas.mpl_connect("motion_notify_event", self._on_move),
+        ]
+
+    def day_at(self, x: Optional[float]) -> Optional[int]:
+        if x is None:
+            return None
+        day = int(round(x))
+        return day if 0 <= day < len(self.weights) else None
+
+    def show(self, day: Optional[int]) -> None:
+        if day == self.day:
+            return
+        self.day = day
+
+        if day is None:
+            self.annotation.set_visible(False)
+        else:
+            weight, bmi = self.weights[day], self.bmis[day]
+            self.annotation.xy = (day, weight)
+            self.annotation.set_text(tooltip_text(day, weight, bmi))
+            self.annotation.set_visible(True)
+
+        self._blit()
+
+    def disconnect(self) -> None:
+        for cid in self._connections:
+            self.canvas.mpl_disconnect(cid)
+        self._connections = []
+
+    def remove(self) -> None:
+        """
+        Disconnects and removes the annotation, leaving the axes as they
+        were before the hover was added.
+        """
+        self.disconnect()
+        self.annotation.remove()
+        self._background = None
+
+    # -----------------------------------------------------------------
+    def _on_draw(self, event) -> None:
+        self._background = self.canvas.copy_from_bbox(self.ax.figure.bbox)
+        if self.annotation.get_visible():
+            self.ax.draw_artist(self.annotation)
+
+    def _on_move(self, event) -> None:
+        if event.inaxes is not self.ax:
+            self.show(None)
+        else:
+            self.show(self.day_at(event.xdata))
+
+    def _blit(self) -> None:
+        if self._background is None:
+            return
+        self.canvas.restore_region(self._background)
+        if self.annotation.get_visible():
+            self.ax.draw_artist(self.annotation)
+        self.canvas.blit(self.ax.figure.bbox)
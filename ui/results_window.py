@@ -1,51 +1,80 @@
 import customtkinter as ctk
+import threading
 from datetime import datetime
 from tkinter import messagebox
+from types import SimpleNamespace
 
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.lines import Line2D
-import mplcursors
+from core.export import export_timeline, iter_result_timeline
+from core.solver import pace_level
+from core.utils import format_bmi_segments
+from ui.workers import JobQueue
 
 
 # ---------------------------------------------------------------------
-# Helpers
+# Deferred chart imports
 # ---------------------------------------------------------------------
+# matplotlib, its Tk backend and ui.chart (NumPy) take most of the GUI
+# import time, so they are loaded when the first ResultsWindow opens,
+# or earlier in the background through warm_up_charts().
+
+_chart_modules = None
+_chart_modules_lock = threading.Lock()
+
+# Charts of closed windows kept for the next ones (0 disables reuse)
+FIGURE_POOL_SIZE = 2
+
+EXPORT_DPIS = (100, 150, 300, 600)
+DEFAULT_EXPORT_DPI = 150
+EXPORT_LABEL = "📤 Export Plot"
+
+
+def load_chart_modules() -> SimpleNamespace:
+    global _chart_modules
+    with _chart_modules_lock:
+        if _chart_modules is None:
+            from matplotlib.backends.backend_tkagg import (
+                FigureCanvasTkAgg,
+                NavigationToolbar2Tk,
+            )
+            from ui import chart
+
+            _chart_modules = SimpleNamespace(
+                FigureCanvasTkAgg=FigureCanvasTkAgg,
+                NavigationToolbar2Tk=NavigationToolbar2Tk,
+                chart=chart,
+                figure_pool=chart.FigurePool(FIGURE_POOL_SIZE),
+            )
+        return _chart_modules
 
-def format_date(d: datetime) -> str:
-    return d.strftime("%d-%m-%Y")
 
+def warm_up_charts() -> threading.Thread:
+    """
+    Starts importing the chart modules on a daemon thread.
+    """
+    thread = threading.Thread(
+        target=load_chart_modules, name="chart-warm-up", daemon=True
+    )
+    thread.start()
+    return thread
 
-def bmi_color(bmi: float) -> str:
-    if bmi < 18.5:
-        return "#3b82f6"  # blue
-    elif bmi < 25:
-        return "#22c55e"  # green
-    elif bmi < 30:
-        return "#eab308"  # yellow
-    else:
-        return "#ef4444"  # red
 
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
 
-def bmi_label(bmi: float) -> str:
-    if bmi < 18.5:
-        return "Underweight"
-    elif bmi < 25:
-        return "Normal"
-    elif bmi < 30:
-        return "Overweight"
-    else:
-        return "Obese"
+def format_date(d: datetime) -> str:
+    return d.strftime("%d-%m-%Y")
 
 
 def pace_warning(daily_change: float):
-    if daily_change < -0.15:
+    level = pace_level(daily_change)
+    if level == "danger":
         return (
             "danger",
             "Your average weight loss rate appears higher than commonly recommended.\n"
             "Rapid weight loss may affect muscle mass and metabolic health."
         )
-    if daily_change > 0.10:
+    if level == "warning":
         return (
             "warning",
             "Your average weight gain rate appears higher than commonly recommended.\n"
@@ -58,15 +87,31 @@ def pace_warning(daily_change: float):
 # Results Window
 # ---------------------------------------------------------------------
 
+def prepare_chart(result):
+    """
+    Builds (or takes from the figure pool) and pre-renders the chart of
+    result. Safe to call from a worker thread; pass the returned chart
+    to ResultsWindow.
+    """
+    chart = load_chart_modules().figure_pool.acquire(result)
+    chart.prerender()
+    return chart
+
+
 class ResultsWindow(ctk.CTkToplevel):
-    def __init__(self, master, result):
+    def __init__(self, master, result, chart=None):
         super().__init__(master)
         self.result = result
+        self.chart = chart
 
         self.title("Results")
         self.geometry("900x900")
         self.resizable(False, False)
 
+        # exports render on a worker thread; created first so destroy()
+        # can always shut it down, even if building the UI fails
+        self.export_jobs = JobQueue(self, name="export")
+
         self._build_ui()
 
     # -----------------------------------------------------------------
@@ -80,7 +125,7 @@ class ResultsWindow(ctk.CTkToplevel):
         title.pack(pady=15)
 
         # Health pace warning
-        daily_change = self.result.weight_difference / self.result.days
+        daily_change = self.result.daily_change
         level, message = pace_warning(daily_change)
         if level:
             color = "#ef4444" if level == "danger" else "#eab308"
@@ -102,6 +147,7 @@ class ResultsWindow(ctk.CTkToplevel):
         self._row(info, 1, "End Weight:", f"{self.result.end_weight:.1f} kg")
         self._row(info, 2, "Duration:", f"{self.result.days} days")
         self._row(info, 3, "Daily Change:", f"{daily_change:+.2f} kg/day")
+        self._row(info, 4, "BMI Zones:", format_bmi_segments(self.result.bmi_segments))
 
         # Chart frame
         chart_frame = ctk.CTkFrame(self)
@@ -109,13 +155,38 @@ class ResultsWindow(ctk.CTkToplevel):
 
         self._build_weight_chart(chart_frame)
 
-        # Export button
-        export_btn = ctk.CTkButton(
-            self,
-            text="📤 Export Plot",
+        # Export controls
+        mpl = load_chart_modules()
+        self.exporter = mpl.chart.ChartExporter(self.result)
+
+        export_row = ctk.CTkFrame(self, fg_color="transparent")
+        export_row.pack(pady=5)
+        self.export_format = ctk.CTkOptionMenu(
+            export_row,
+            values=[fmt.upper() for fmt in mpl.chart.EXPORT_FORMATS],
+            width=80,
+        )
+        self.export_format.pack(side="left", padx=5)
+        self.export_dpi = ctk.CTkOptionMenu(
+            export_row,
+            values=[f"{dpi} dpi" for dpi in EXPORT_DPIS],
+            width=100,
+        )
+        self.export_dpi.set(f"{DEFAULT_EXPORT_DPI} dpi")
+        self.export_dpi.pack(side="left", padx=5)
+        self.export_btn = ctk.CTkButton(
+            export_row,
+            text=EXPORT_LABEL,
             command=self._export_plot
         )
-        export_btn.pack(pady=5)
+        self.export_btn.pack(side="left", padx=5)
+
+        data_btn = ctk.CTkButton(
+            self,
+            text="📄 Export Data (CSV)",
+            command=self._export_data
+        )
+        data_btn.pack(pady=5)
 
     # -----------------------------------------------------------------
     def _row(self, parent, row, label, value):
@@ -126,78 +197,85 @@ class ResultsWindow(ctk.CTkToplevel):
 
     # -----------------------------------------------------------------
     def _build_weight_chart(self, parent):
-        self.days = list(range(len(self.result.weights)))
+        mpl = load_chart_modules()
+
         self.weights = self.result.weights
         self.bmis = self.result.bmis
         self.height_m = self.result.height_cm / 100
 
-        self.fig, self.ax = plt.subplots(figsize=(7, 4.5))
-
-        # BMI bands
-        def weight_for_bmi(bmi): return bmi * (self.height_m ** 2)
-        bands = [
-            (0, 18.5, "#3b82f6"),  # Underweight
-            (18.5, 25, "#22c55e"), # Normal
-            (25, 30, "#eab308"),   # Overweight
-            (30, 60, "#ef4444"),   # Obese
-        ]
-        for bmi_min, bmi_max, color in bands:
-            self.ax.axhspan(weight_for_bmi(bmi_min),
-                            weight_for_bmi(bmi_max),
-                            color=color, alpha=0.08, zorder=0)
-
-        # BMI-colored line
-        for i in range(len(self.weights) - 1):
-            self.ax.plot(
-                self.days[i:i + 2],
-                self.weights[i:i + 2],
-                color=bmi_color(self.bmis[i]),
-                linewidth=3, zorder=3
-            )
+        # BMI bands, BMI-colored line (downsampled to the visible pixel
+        # width) and styling; usually already built by a worker thread
+        if self.chart is None:
+            self.chart = mpl.figure_pool.acquire(self.result)
+        self.fig = self.chart.figure
+        self.ax = self.chart.ax
+        self.trajectory = self.chart.trajectory
+
+        # Canvas & hover tooltips (day = rounded cursor x, annotation is
+        # blitted); released through self.shown when the window closes
+        self.shown = mpl.chart.ChartWindow(mpl.figure_pool, self.chart)
+        self.canvas = self.shown.attach(mpl.FigureCanvasTkAgg, master=parent)
+        self.hover = self.shown.hover
 
-        # Hover tooltips
-        scatter = self.ax.scatter(self.days, self.weights, s=40, alpha=0)
-        cursor = mplcursors.cursor(scatter, hover=True)
-
-        @cursor.connect("add")
-        def on_add(sel):
-            idx = sel.index
-            bmi = self.bmis[idx]
-            sel.annotation.set(
-                text=(
-                    f"Day {idx}\n"
-                    f"Weight: {self.weights[idx]:.1f} kg\n"
-                    f"BMI: {bmi:.1f} ({bmi_label(bmi)})"
-                )
-            )
-            sel.annotation.get_bbox_patch().set(fc="white", alpha=0.95)
-
-        # Styling
-        self.ax.set_title("Weight Change Over Time (BMI Zones)")
-        self.ax.set_xlabel("Days")
-        self.ax.set_ylabel("Weight (kg)")
-        self.ax.grid(True, linestyle="--", alpha=0.4)
-        legend_elements = [
-            Line2D([0], [0], color="#3b82f6", lw=4, label="Underweight"),
-            Line2D([0], [0], color="#22c55e", lw=4, label="Normal"),
-            Line2D([0], [0], color="#eab308", lw=4, label="Overweight"),
-            Line2D([0], [0], color="#ef4444", lw=4, label="Obese"),
-        ]
-        self.ax.legend(handles=legend_elements, loc="best")
-
-        # Canvas & toolbar
-        self.canvas = FigureCanvasTkAgg(self.fig, master=parent)
         self.canvas.draw()
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
-        self.toolbar = NavigationToolbar2Tk(self.canvas, parent)
+        self.toolbar = mpl.NavigationToolbar2Tk(self.canvas, parent)
         self.toolbar.update()
         self.canvas.get_tk_widget().pack(fill="both", expand=True)
 
     # -----------------------------------------------------------------
-    def _export_plot(self):
+    def destroy(self):
+        # a running export still writes its file, without a message
         try:
-            filename = f"weight_chart_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-            self.fig.savefig(filename, dpi=150)
-            messagebox.showinfo("Saved", f"Plot saved as {filename}")
-        except Exception as e:
-            messagebox.showerror("Error", str(e))
+            self.export_jobs.shutdown()
+            super().destroy()
+        finally:
+            self._release_chart()
+
+    def _release_chart(self):
+        # The figure goes back to the pool (or is cleared) once the Tk
+        # canvas is gone, so closed windows leave nothing behind.
+        shown = getattr(self, "shown", None)
+        if shown is not None:
+            shown.close()
+        elif self.chart is not None:  # closed before the chart was shown
+            load_chart_modules().figure_pool.release(self.chart)
+        self.chart = self.fig = self.ax = self.trajectory = None
+        self.canvas = self.toolbar = self.hover = self.shown = None
+
+    # -----------------------------------------------------------------
+    def _export_plot(self):
+        fmt = self.export_format.get().lower()
+        dpi = int(self.export_dpi.get().split()[0])
+        filename = f"weight_chart_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{fmt}"
+        # the current zoom / pan is part of the export (and of its cache key)
+        xlim, ylim = self.ax.get_xlim(), self.ax.get_ylim()
+
+        self.export_jobs.submit(
+            lambda: self.exporter.export(filename, dpi, xlim, ylim),
+            self._on_plot_exported,
+            self._on_export_failed,
+        )
+        self.export_btn.configure(text=f"⏳ Exporting ({self.export_jobs.pending})...")
+
+    def _on_plot_exported(self, path):
+        self._reset_export_button()
+        messagebox.showinfo("Saved", f"Plot saved as {path}")
+
+    def _on_export_failed(self, error):
+        self._reset_export_button()
+        messagebox.showerror("Error", str(error))
+
+    def _reset_export_button(self):
+        pending = self.export_jobs.pending
+        text = f"⏳ Exporting ({pending})..." if pending else EXPORT_LABEL
+        self.export_btn.configure(text=text)
+
+    # -----------------------------------------------------------------
+    def _export_data(self):
+        filename = f"weight_timeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        self.export_jobs.submit(
+            lambda: export_timeline(iter_result_timeline(self.result), filename),
+            lambda rows: messagebox.showinfo("Saved", f"{rows} days saved as {filename}"),
+            lambda e: messagebox.showerror("Error", str(e)),
+        )
@@ -0,0 +1,53 @@
+from typing import IO, Tuple
+
+from core.calculator import WeightChangeCalculator
+from core.data_models import RowError
+from core.plan_io import ErrorWriter, PlanWriter, read_plans
+
+
+class BatchUI:
+    """
+    Streaming batch interface: reads plans from a CSV / JSONL stream and
+    writes results as they are calculated.
+    Responsible ONLY for:
+    - moving rows between the input, output and error streams
+
+    Rows are parsed and calculated one at a time with the lazy timeline
+    engine, so memory stays flat whatever the input size. Bad rows go
+    to the error stream and never stop the run.
+    """
+
+    def __init__(
+        self,
+        source: IO[str],
+        output: IO[str],
+        errors: IO[str],
+        input_format: str = "csv",
+        output_format: str = "csv",
+        detail: str = "summary",
+    ):
+        self.calculator = WeightChangeCalculator(engine="lazy")
+        self.source = source
+        self.input_format = input_format
+        self.writer = PlanWriter(output, output_format, detail)
+        self.errors = ErrorWriter(errors)
+
+    def run(self) -> Tuple[int, int]:
+        """
+        Processes every row; returns (plans written, rows rejected).
+        """
+        written = 0
+        for row, plan in read_plans(self.source, self.input_format):
+            if isinstance(plan, RowError):
+                self.errors.write(plan)
+                continue
+            try:
+                result = self.calculator.calculate(plan)
+            except ValueError as e:
+                # fields are already valid here: only the date range can fail
+                self.errors.write(RowError(row, "end_date", str(e)))
+                continue
+            self.writer.write(row, plan, result)
+            written += 1
+
+        return written, self.errors.count
@@ -1,8 +1,11 @@
 from datetime import datetime
+from typing import Optional
 
 from core.calculator import WeightChangeCalculator
 from core.data_models import WeightChangeInput, Gender
+from core.history import HistoryStore
 from core.utils import (
+    format_bmi_segments,
     validate_positive,
     validate_gender,
     parse_date,
@@ -20,16 +23,29 @@ class ConsoleUI:
     All validation & calculations are delegated to core modules.
     """
 
-    def __init__(self):
+    def __init__(self, history: Optional[HistoryStore] = None):
         self.calculator = WeightChangeCalculator()
+        self.history = history
 
     def run(self):
         try:
             data = self._collect_input()
-            result = self.calculator.calculate(data)
+            # _collect_input already ran every domain check
+            result = self.calculator.calculate(data, prevalidated=True)
             self._display_result(result)
         except ValueError as e:
             print(f"\n[ERROR] {e}")
+            return
+
+        self._save_history(data, result)
+
+    def _save_history(self, data, result):
+        try:
+            if self.history is None:
+                self.history = HistoryStore()
+            self.history.append(data, result)
+        except (OSError, ValueError) as e:
+            print(f"\n[WARNING] Plan not saved to history: {e}")
 
     # ------------------------------------------------------------------
     # INPUT
@@ -81,6 +97,7 @@ class ConsoleUI:
         print(f"Days         : {result.days}")
         print(f"Start BMI    : {result.bmi_start:.1f}")
         print(f"End BMI      : {result.bmi_end:.1f}")
+        print(f"BMI zones    : {format_bmi_segments(result.bmi_segments)}")
 
         if result.is_weight_loss:
             print("Status       : Weight loss ✅")
@@ -1,22 +1,38 @@
 import customtkinter as ctk
 from tkinter import messagebox
 
-# -----------------------------------------------------------------------------
-# CustomTkinter global configuration
-# MUST be set before creating any CTk instance
-# -----------------------------------------------------------------------------
-ctk.set_appearance_mode("System")
-ctk.set_default_color_theme("blue")
-
-from core.calculator import WeightChangeCalculator
+from core.cache import CachingCalculator
 from core.data_models import WeightChangeInput, Gender
+from core.history import HistoryStore
+from core.solver import pace_level
 from core.utils import (
+    format_bmi_segments,
     validate_positive,
     validate_gender,
     parse_date,
     validate_date_range,
 )
-from ui.results_window import ResultsWindow
+from ui.results_window import (
+    ResultsWindow,
+    load_chart_modules,
+    prepare_chart,
+    warm_up_charts,
+)
+from ui.workers import Debouncer, LatestJobRunner
+
+
+# Quiet time after the last keystroke before the preview is recomputed
+PREVIEW_DELAY_MS = 150
+
+
+# -----------------------------------------------------------------------------
+# CustomTkinter global configuration
+# MUST be called before creating any CTk instance (done by MainApp), not at
+# import time, so importing this module stays cheap.
+# -----------------------------------------------------------------------------
+def configure_appearance():
+    ctk.set_appearance_mode("System")
+    ctk.set_default_color_theme("blue")
 
 
 # -----------------------------------------------------------------------------
@@ -39,34 +55,74 @@ class LabeledEntry(ctk.CTkFrame):
     def get(self) -> str:
         return self.entry.get().strip()
 
+    def on_change(self, callback) -> None:
+        """
+        Calls callback(event) after every key press in the entry.
+        """
+        self.entry.bind("<KeyRelease>", callback, add="+")
+
+
+def preview_text(result) -> str:
+    text = (
+        f"{result.days} days: {result.start_weight:.1f} → "
+        f"{result.end_weight:.1f} kg ({result.daily_change:+.3f} kg/day)\n"
+        f"{format_bmi_segments(result.bmi_segments)}"
+    )
+    if pace_level(result.daily_change):
+        text += "\n⚠ Faster than commonly recommended"
+    return text
+
 
 # -----------------------------------------------------------------------------
 # Main Application Window
 # -----------------------------------------------------------------------------
 class MainApp(ctk.CTk):
     def __init__(self):
+        configure_appearance()
         super().__init__()
 
         self.title("Weight Change Planner")
-        self.geometry("480x600")
+        self.geometry("940x640")
         self.resizable(False, False)
 
-        self.calculator = WeightChangeCalculator()
+        # Users often tweak a field and change it back: reuse those results
+        self.calculator = CachingCalculator(max_entries=64)
+        self.runner = LatestJobRunner(self, name="calculate")
+
+        # Live preview: recomputed once typing pauses; a newer request
+        # drops the outcome of an older one still running
+        self.preview_runner = LatestJobRunner(self, poll_ms=5, name="preview")
+        self.preview_debouncer = Debouncer(self, PREVIEW_DELAY_MS, self._update_preview)
+        self.preview = None  # PreviewChart, created for the first valid plan
+        self._preview_input = None
+        self._preview_result = None
+
+        # Opening the store reads only the most recent plans
+        try:
+            self.history = HistoryStore()
+        except (OSError, ValueError):
+            self.history = None
 
         self._build_ui()
 
+        # Load matplotlib while the user fills in the form
+        warm_up_charts()
+
     # -------------------------------------------------------------------------
     # UI construction
     # -------------------------------------------------------------------------
     def _build_ui(self):
+        column = ctk.CTkFrame(self, fg_color="transparent")
+        column.pack(side="left", fill="y", padx=10)
+
         title = ctk.CTkLabel(
-            self,
+            column,
             text="Weight Change Planner",
             font=("Segoe UI", 22, "bold"),
         )
         title.pack(pady=20)
 
-        form = ctk.CTkFrame(self)
+        form = ctk.CTkFrame(column)
         form.pack(pady=10)
 
         self.start_weight = LabeledEntry(form, "Start Weight (kg)", "e.g. 80")
@@ -78,6 +134,7 @@ class MainApp(ctk.CTk):
             form,
             values=["male", "female"],
             width=220,
+            command=self.preview_debouncer.trigger,
         )
         self.gender_combo.set("female")
 
@@ -101,60 +158,192 @@ class MainApp(ctk.CTk):
         self.start_date.pack(pady=6)
         self.end_date.pack(pady=6)
 
+        for widget in (
+            self.start_weight,
+            self.end_weight,
+            self.height_cm,
+            self.start_date,
+            self.end_date,
+        ):
+            widget.on_change(self.preview_debouncer.trigger)
+        self.gender_combo.bind("<KeyRelease>", self.preview_debouncer.trigger, add="+")
+
         calculate_btn = ctk.CTkButton(
-            self,
+            column,
             text="Calculate",
             command=self.on_calculate,
             width=200,
         )
-        calculate_btn.pack(pady=30)
+        calculate_btn.pack(pady=(30, 10))
+
+        # Shown while a calculation runs in the background
+        self.progress = ctk.CTkProgressBar(column, mode="indeterminate", width=200)
+
+        # Live preview; its chart is created with the first valid plan
+        self.preview_frame = ctk.CTkFrame(self)
+        self.preview_frame.pack(side="right", fill="both", expand=True, padx=(0, 20), pady=20)
+        preview_title = ctk.CTkLabel(
+            self.preview_frame,
+            text="Live Preview",
+            font=("Segoe UI", 16, "bold"),
+        )
+        preview_title.pack(pady=(10, 5))
+        self.preview_info = ctk.CTkLabel(
+            self.preview_frame,
+            text="Fill in the form to preview your plan.",
+            justify="left",
+            wraplength=400,
+        )
+        self.preview_info.pack(side="bottom", pady=10)
 
     # -------------------------------------------------------------------------
     # Event handlers
     # -------------------------------------------------------------------------
     def on_calculate(self):
         try:
-            start_weight = validate_positive(
-                self.start_weight.get(), "Start weight"
-            )
-            end_weight = validate_positive(
-                self.end_weight.get(), "End weight"
-            )
-            height_cm = validate_positive(
-                self.height_cm.get(), "Height"
-            )
+            data = self._read_input()
+        except ValueError as e:
+            messagebox.showerror("Input Error", str(e))
+            return
+        except Exception as e:
+            messagebox.showerror("Unexpected Error", str(e))
+            return
 
-            gender_str = validate_gender(self.gender_combo.get())
-            gender = Gender(gender_str)
+        # Calculation and chart rendering run off the Tk thread; pressing
+        # Calculate again supersedes a request that is still running.
+        self._show_progress()
+        self.runner.submit(
+            lambda cancelled: self._compute(data, cancelled),
+            on_done=self._on_result_ready,
+            on_error=self._on_calculation_error,
+            on_discard=self._discard_result,
+        )
 
-            start_date = parse_date(
-                self.start_date.get(), "Start date"
-            )
-            end_date = parse_date(
-                self.end_date.get(), "End date"
-            )
+    def destroy(self):
+        self.preview_debouncer.cancel()
+        self.preview_runner.shutdown()
+        self.runner.shutdown()
+        super().destroy()
+
+    # -------------------------------------------------------------------------
+    # Live preview
+    # -------------------------------------------------------------------------
+    def _update_preview(self):
+        try:
+            data = self._read_input()
+        except ValueError as e:
+            self.preview_runner.cancel()
+            self._preview_input = None
+            self.preview_info.configure(text=str(e))
+            return
+
+        if data == self._preview_input:
+            return  # e.g. arrow keys or a field changed back
+        self._preview_input = data
 
-            validate_date_range(start_date, end_date)
+        previous = self._preview_result
+        self.preview_runner.submit(
+            lambda cancelled: self._compute_preview(data, previous),
+            on_done=self._show_preview,
+            on_error=lambda error: self.preview_info.configure(text=str(error)),
+        )
 
-            data = WeightChangeInput(
-                start_weight=start_weight,
-                end_weight=end_weight,
-                height_cm=height_cm,
-                gender=gender,
-                start_date=start_date,
-                end_date=end_date,
+    def _compute_preview(self, data, previous):
+        # Worker thread: reuse the previous preview's timeline where valid
+        if previous is None:
+            return self.calculator.calculate(data, prevalidated=True)
+        return self.calculator.recalculate(previous, data, prevalidated=True)
+
+    def _show_preview(self, result):
+        self._preview_result = result
+        if self.preview is None:
+            mpl = load_chart_modules()
+            self.preview = mpl.chart.PreviewChart()
+            self.preview_canvas = mpl.FigureCanvasTkAgg(
+                self.preview.figure, master=self.preview_frame
             )
+            self.preview_canvas.get_tk_widget().pack(fill="both", expand=True, padx=10)
 
-            result = self.calculator.calculate(data)
+        self.preview.show(result)
+        self.preview_canvas.draw_idle()
+        self.preview_info.configure(text=preview_text(result))
 
-        except ValueError as e:
-            messagebox.showerror("Input Error", str(e))
-            return
-        except Exception as e:
-            messagebox.showerror("Unexpected Error", str(e))
-            return
+    # -------------------------------------------------------------------------
+    # Background calculation
+    # -------------------------------------------------------------------------
+    def _compute(self, data, cancelled):
+        # Runs on the worker thread: no Tk calls here. data comes from
+        # _read_input, which already ran every domain check.
+        result = self.calculator.calculate(data, prevalidated=True)
+        if self.history is not None:
+            try:
+                self.history.append(data, result)
+            except (OSError, ValueError):
+                pass  # history is best effort; never block a result
+        if cancelled.is_set():
+            return None
+        return result, prepare_chart(result)
+
+    def _discard_result(self, outcome):
+        # Runs on the worker thread: a superseded request's chart goes
+        # back to the figure pool instead of being dropped with it.
+        if outcome is not None:
+            load_chart_modules().figure_pool.release(outcome[1])
+
+    def _on_result_ready(self, outcome):
+        self._hide_progress()
+        result, chart = outcome
+        ResultsWindow(self, result, chart=chart)
+
+    def _on_calculation_error(self, error):
+        self._hide_progress()
+        if isinstance(error, ValueError):
+            messagebox.showerror("Input Error", str(error))
+        else:
+            messagebox.showerror("Unexpected Error", str(error))
 
-        ResultsWindow(self, result)
+    def _show_progress(self):
+        self.progress.pack(pady=5)
+        self.progress.start()
+
+    def _hide_progress(self):
+        self.progress.stop()
+        self.progress.pack_forget()
+
+    # -------------------------------------------------------------------------
+    # Input
+    # -------------------------------------------------------------------------
+    def _read_input(self) -> WeightChangeInput:
+        start_weight = validate_positive(
+            self.start_weight.get(), "Start weight"
+        )
+        end_weight = validate_positive(
+            self.end_weight.get(), "End weight"
+        )
+        height_cm = validate_positive(
+            self.height_cm.get(), "Height"
+        )
+
+        gender_str = validate_gender(self.gender_combo.get())
+        gender = Gender(gender_str)
+
+        start_date = parse_date(
+            self.start_date.get(), "Start date"
+        )
+        end_date = parse_date(
+            self.end_date.get(), "End date"
+        )
+
+        validate_date_range(start_date, end_date)
+
+        return WeightChangeInput(
+            start_weight=start_weight,
+            end_weight=end_weight,
+            height_cm=height_cm,
+            gender=gender,
+            start_date=start_date,
+            end_date=end_date,
+        )
 
 
 # -----------------------------------------------------------------------------
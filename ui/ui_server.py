@@ -0,0 +1,342 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from core.cache import CachingCalculator
+from core.calculator import WeightChangeCalculator
+from core.data_models import RowError
+from core.plan_io import parse_plan, segment_records, summary_record, timeline_record
+
+
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 64 * 1024
+
+logger = logging.getLogger(__name__)
+
+
+# ---------------------------------------------------------------------
+# HTTP messages
+# ---------------------------------------------------------------------
+
+class HttpError(Exception):
+    def __init__(self, status: HTTPStatus, message: str, field: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.field = field
+
+
+@dataclass
+class Request:
+    method: str
+    path: str
+    query: Dict[str, list]
+    version: str
+    headers: Dict[str, str]
+    body: bytes = b""
+
+    @property
+    def keep_alive(self) -> bool:
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+
+
+@dataclass
+class Response:
+    status: HTTPStatus
+    body: bytes = b""
+    content_type: str = "application/json"
+    # streamed with chunked transfer encoding when set
+    chunks: Optional[AsyncIterator[bytes]] = None
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(cls, status: HTTPStatus, payload) -> "Response":
+        return cls(status, (json.dumps(payload) + "\n").encode())
+
+    @classmethod
+    def error(cls, error: HttpError) -> "Response":
+        payload = {"error": error.message}
+        if error.field:
+            payload["field"] = error.field
+        response = cls.json(error.status, payload)
+        if error.status == HTTPStatus.SERVICE_UNAVAILABLE:
+            response.headers["Retry-After"] = "1"
+        return response
+
+
+# ---------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------
+
+class PlannerServer:
+    """
+    HTTP/JSON interface to the calculator, built on asyncio streams.
+    Responsible ONLY for:
+    - HTTP framing, keep-alive and pipelining
+    - scheduling calculations on a bounded worker pool
+
+    Endpoints:
+        GET  /health
+        POST /plan[?detail=daily]   body: plan fields as JSON (DD-MM-YYYY dates)
+
+    Pipelined requests on one connection are processed concurrently and
+    answered in order; at most pipeline_depth are read ahead before the
+    connection stops reading. When max_pending requests are in flight
+    server-wide, new ones get 503 with Retry-After. detail=daily streams
+    the timeline as NDJSON in chunks of chunk_days days.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        workers: int = 4,
+        max_pending: int = 64,
+        pipeline_depth: int = 8,
+        chunk_days: int = 512,
+        idle_timeout: float = 15.0,
+        executor: Optional[Executor] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.max_pending = max_pending
+        self.pipeline_depth = pipeline_depth
+        self.chunk_days = chunk_days
+        self.idle_timeout = idle_timeout
+
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="planner"
+        )
+        self.calculator = CachingCalculator(
+            WeightChangeCalculator(engine="lazy"), max_entries=4096
+        )
+        self.pending = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # -----------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # -----------------------------------------------------------------
+    # Connections
+    # -----------------------------------------------------------------
+    async def _handle_connection(self, reader, writer) -> None:
+        responses: asyncio.Queue = asyncio.Queue(maxsize=self.pipeline_depth)
+        sender = asyncio.create_task(self._send_responses(writer, responses))
+
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(
+                        self._read_request(reader), self.idle_timeout
+                    )
+                except HttpError as e:
+                    await responses.put((None, _ready(Response.error(e)), False))
+                    break
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError,
+                        ConnectionError):
+                    break
+                if request is None:
+                    break
+
+                if self.pending >= self.max_pending:
+                    busy = HttpError(HTTPStatus.SERVICE_UNAVAILABLE, "Server busy, retry later.")
+                    await responses.put((request, _ready(Response.error(busy)), False))
+                else:
+                    self.pending += 1
+                    task = asyncio.create_task(self._dispatch(request))
+                    # blocks once pipeline_depth responses are queued
+                    await responses.put((request, task, True))
+
+                if not request.keep_alive:
+                    break
+        finally:
+            await responses.put(None)
+            await sender
+            writer.close()
+
+    async def _send_responses(self, writer, responses: asyncio.Queue) -> None:
+        broken = False
+        while (item := await responses.get()) is not None:
+            request, task, admitted = item
+            try:
+                response = await task
+                if not broken:
+                    await self._write_response(writer, request, response)
+            except Exception:
+                # A half-written response cannot be recovered: drop the
+                # connection and only drain what is still queued.
+                broken = True
+                writer.close()
+            finally:
+                if admitted:
+                    self.pending -= 1
+
+    async def _read_request(self, reader) -> Optional[Request]:
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, version = line.decode("latin-1").split()
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Malformed request line.")
+
+        headers = {}
+        for _ in range(MAX_HEADER_LINES):
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise HttpError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Too many headers.")
+
+        if "transfer-encoding" in headers:
+            raise HttpError(HTTPStatus.LENGTH_REQUIRED, "Chunked request bodies are not supported.")
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid Content-Length.")
+        if length > MAX_BODY_BYTES:
+            raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large.")
+
+        body = await reader.readexactly(length) if length else b""
+        url = urlsplit(target)
+        return Request(method.upper(), url.path, parse_qs(url.query), version, headers, body)
+
+    async def _write_response(self, writer, request: Optional[Request], response: Response) -> None:
+        keep_alive = request is not None and request.keep_alive
+        lines = [
+            f"HTTP/1.1 {response.status.value} {response.status.phrase}",
+            f"Content-Type: {response.content_type}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        lines += [f"{name}: {value}" for name, value in response.headers.items()]
+
+        if response.chunks is None:
+            lines.append(f"Content-Length: {len(response.body)}")
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + response.body)
+            await writer.drain()
+            return
+
+        lines.append("Transfer-Encoding: chunked")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        async for chunk in response.chunks:
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            await writer.drain()  # backpressure from slow clients
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    # -----------------------------------------------------------------
+    # Routes
+    # -----------------------------------------------------------------
+    async def _dispatch(self, request: Request) -> Response:
+        try:
+            if request.path == "/health":
+                _require_method(request, "GET")
+                return Response.json(HTTPStatus.OK, {"status": "ok", "pending": self.pending})
+            if request.path == "/plan":
+                _require_method(request, "POST")
+                return await self._plan(request)
+            raise HttpError(HTTPStatus.NOT_FOUND, f"Unknown path '{request.path}'.")
+        except HttpError as e:
+            return Response.error(e)
+        except Exception:
+            # details go to the log, never to the client
+            logger.exception("Error handling %s %s", request.method, request.path)
+            return Response.error(
+                HttpError(HTTPStatus.INTERNAL_SERVER_ERROR, "Internal server error.")
+            )
+
+    async def _plan(self, request: Request) -> Response:
+        try:
+            record = json.loads(request.body or b"{}")
+        except json.JSONDecodeError as e:
+            raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e.msg}.")
+        if not isinstance(record, dict):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object.")
+
+        detail = request.query.get("detail", [record.get("detail", "summary")])[0]
+        if detail not in ("summary", "daily"):
+            raise HttpError(HTTPStatus.BAD_REQUEST, "detail must be 'summary' or 'daily'.", "detail")
+
+        data = parse_plan(1, record)
+        if isinstance(data, RowError):
+            raise HttpError(HTTPStatus.BAD_REQUEST, data.message, data.field)
+
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self.executor, self.calculator.calculate, data)
+        except ValueError as e:
+            raise HttpError(HTTPStatus.BAD_REQUEST, str(e), "end_date")
+
+        summary = summary_record(0, data, result)
+        del summary["row"]
+        summary["bmi_segments"] = segment_records(result)
+        if detail == "summary":
+            return Response.json(HTTPStatus.OK, summary)
+
+        return Response(
+            HTTPStatus.OK,
+            content_type="application/x-ndjson",
+            chunks=self._timeline_chunks(summary, result),
+        )
+
+    async def _timeline_chunks(self, summary, result) -> AsyncIterator[bytes]:
+        yield (json.dumps(summary) + "\n").encode()
+
+        loop = asyncio.get_running_loop()
+        for start in range(0, result.days + 1, self.chunk_days):
+            stop = min(start + self.chunk_days, result.days + 1)
+            yield await loop.run_in_executor(
+                self.executor, _render_days, result, start, stop
+            )
+
+
+# ---------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------
+
+def _ready(response: Response) -> "asyncio.Future":
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(response)
+    return future
+
+
+def _require_method(request: Request, method: str) -> None:
+    if request.method != method:
+        raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"Use {method} for {request.path}.")
+
+
+def _render_days(result, start: int, stop: int) -> bytes:
+    lines = []
+    for day in range(start, stop):
+        record = timeline_record(0, result, day)
+        del record["row"]
+        lines.append(json.dumps(record))
+    return ("\n".join(lines) + "\n").encode()
@@ -0,0 +1,198 @@
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+# ---------------------------------------------------------------------
+# Background work for Tk windows
+# ---------------------------------------------------------------------
+
+class LatestJobRunner:
+    """
+    Runs jobs on a worker thread and delivers results on the Tk thread.
+
+    Only the most recent job matters: submitting a new job cancels the
+    previous one (it is skipped if it has not started yet, and its
+    outcome is dropped otherwise). Outcomes are picked up by polling
+    with widget.after(), because Tk must only be touched from its own
+    thread.
+
+    A job is called as job(cancelled) where cancelled is a
+    threading.Event it may check to stop early. A superseded job that
+    still finishes hands its result to on_discard, if given, e.g. to
+    give back resources it took; on_discard runs on the worker thread.
+    """
+
+    def __init__(self, widget, poll_ms: int = 30, name: str = "worker"):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=name
+        )
+        self._future: Optional[Future] = None
+        self._cancelled: Optional[threading.Event] = None
+        self._on_done: Optional[Callable[[Any], None]] = None
+        self._on_error: Optional[Callable[[Exception], None]] = None
+        self._on_discard: Optional[Callable[[Any], None]] = None
+        self._polling = False
+
+    @property
+    def busy(self) -> bool:
+        return self._future is not None
+
+    def submit(
+        self,
+        job: Callable[[threading.Event], Any],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+        on_discard: Optional[Callable[[Any], None]] = None,
+    ) -> None:
+        self.cancel()
+
+        self._cancelled = threading.Event()
+        self._on_done = on_done
+        self._on_error = on_error
+        self._on_discard = on_discard
+        self._future = self._executor.submit(job, self._cancelled)
+
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def cancel(self) -> None:
+        if self._future is None:
+            return
+        self._cancelled.set()
+        if not self._future.cancel() and self._on_discard is not None:
+            # already running or done: its result will never be delivered
+            on_discard = self._on_discard
+            self._future.add_done_callback(
+                lambda future: _discard(future, on_discard)
+            )
+        self._future = None
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -----------------------------------------------------------------
+    def _poll(self) -> None:
+        future = self._future
+        if future is None:
+            self._polling = False
+            return
+
+        if not future.done():
+            self.widget.after(self.poll_ms, self._poll)
+            return
+
+        self._future = None
+        self._polling = False
+        try:
+            result = future.result()
+        except CancelledError:
+            return
+        except Exception as e:
+            self._on_error(e)
+            return
+        self._on_done(result)
+
+
+def _discard(future: Future, on_discard: Callable[[Any], None]) -> None:
+    if not future.cancelled() and future.exception() is None:
+        on_discard(future.result())
+
+
+class JobQueue:
+    """
+    Runs every submitted job, in order, on a worker thread and delivers
+    each outcome on the Tk thread (by polling with widget.after(), as
+    LatestJobRunner does). Unlike LatestJobRunner, a new job never
+    replaces an earlier one: use it for work such as file exports where
+    each job matters.
+
+    A job is called without arguments.
+    """
+
+    def __init__(self, widget, poll_ms: int = 30, name: str = "jobs"):
+        self.widget = widget
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix=name
+        )
+        self._jobs = []  # (future, on_done, on_error), in submission order
+        self._polling = False
+
+    @property
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    def submit(
+        self,
+        job: Callable[[], Any],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        self._jobs.append((self._executor.submit(job), on_done, on_error))
+        if not self._polling:
+            self._polling = True
+            self.widget.after(self.poll_ms, self._poll)
+
+    def shutdown(self) -> None:
+        """
+        Drops queued jobs and all outcomes; a running job still finishes.
+        """
+        self._jobs = []
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -----------------------------------------------------------------
+    def _poll(self) -> None:
+        # deliver finished jobs in submission order
+        while self._jobs and self._jobs[0][0].done():
+            future, on_done, on_error = self._jobs.pop(0)
+            try:
+                result = future.result()
+            except CancelledError:
+                continue
+            except Exception as e:
+                on_error(e)
+                continue
+            on_done(result)
+
+        if self._jobs:
+            self.widget.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+
+class Debouncer:
+    """
+    Calls callback once its trigger has been quiet for delay_ms.
+
+    Every trigger() restarts the timer (widget.after / after_cancel),
+    so a burst of keystrokes results in a single call on the Tk thread.
+    """
+
+    def __init__(self, widget, delay_ms: int, callback: Callable[[], None]):
+        self.widget = widget
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self._after_id = None
+
+    @property
+    def pending(self) -> bool:
+        return self._after_id is not None
+
+    def trigger(self, *_event) -> None:
+        self.cancel()
+        self._after_id = self.widget.after(self.delay_ms, self._fire)
+
+    def cancel(self) -> None:
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    # -----------------------------------------------------------------
+    def _fire(self) -> None:
+        self._after_id = None
+        self.callback()